@@ -8,6 +8,7 @@
 get_ipython().magic('matplotlib inline')
 import pandas as pd
 import matplotlib.pyplot as plt
+from lumos.analysis import read_results
 
 #pd.set_option('display.mpl_style', 'default') # Make the graphs a bit prettier
 plt.style.use('ggplot')
@@ -18,10 +19,10 @@ plt.rcParams['lines.linewidth'] = 2.0
 
 # In[2]:
 
-df = pd.read_csv('syn.csv', index_col=0)
-def plot_data(df, legend, sel_vec, x='vdd', y='speedup'):
-    query_str = '&'.join(['{0}=={1}'.format(k, v) for k,v in sel_vec.items()])
-    df2 = df.query(query_str)
+def plot_data(fname, legend, sel_vec, x='vdd', y='speedup'):
+    # only read the selected rows and columns
+    df2 = read_results(fname, columns=[x, legend, y],
+                       filters=[(k, '==', v) for k, v in sel_vec.items()])
     df2_pivot = df2.pivot(index=x, columns=legend, values=y)
     df2_pivot.plot()
 
@@ -53,7 +54,7 @@ sel_vec = {
     'cpi': 0.9, 
     'l1m': 0.1, 
     'l2m': 0.1}
-plot_data(df, 'rm', sel_vec)
+plot_data('syn.parquet', 'rm', sel_vec)
 
 
 # # Sensitivy to Power Budget
@@ -67,7 +68,7 @@ sel_vec = {
     'cpi': 0.9, 
     'l1m': 0.1, 
     'l2m': 0.1}
-plot_data(df, 'power', sel_vec)
+plot_data('syn.parquet', 'power', sel_vec)
 
 
 # # Sensitivity to Area budget
@@ -81,7 +82,7 @@ sel_vec = {
     'cpi': 0.9, 
     'l1m': 0.1, 
     'l2m': 0.1}
-plot_data(df, 'area', sel_vec)
+plot_data('syn.parquet', 'area', sel_vec)
 
 
 # # Sensitivity to LLC cache latency parameter (alpha)
@@ -95,7 +96,7 @@ sel_vec = {
     'cpi': 0.9, 
     'l1m': 0.1, 
     'l2m': 0.1}
-plot_data(df, 'alpha', sel_vec)
+plot_data('syn.parquet', 'alpha', sel_vec)
 
 
 # # CPI
@@ -109,7 +110,7 @@ sel_vec = {
     'alpha': 1.0, 
     'l1m': 0.1, 
     'l2m': 0.1}
-plot_data(df, 'cpi', sel_vec)
+plot_data('syn.parquet', 'cpi', sel_vec)
 
 
 # # L1 miss rate
@@ -123,7 +124,7 @@ sel_vec = {
     'alpha': 1.0, 
     'cpi': 1, 
     'l2m': 0.1}
-plot_data(df, 'l1m', sel_vec)
+plot_data('syn.parquet', 'l1m', sel_vec)
 
 
 # # LLC miss rate
@@ -137,5 +138,5 @@ sel_vec = {
     'alpha': 1.0, 
     'cpi': 1, 
     'l1m': 0.05}
-plot_data(df, 'l2m', sel_vec)
+plot_data('syn.parquet', 'l2m', sel_vec)
 
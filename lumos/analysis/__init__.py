@@ -5,3 +5,8 @@ from .argparser import LumosArgumentParser, lumos_parse_numlist
 
 class LumosAnalysisError(Exception):
     pass
+
+
+from .sweep import ParamGrid, AppGrid, SweepRunner, load_context, print_progress
+from .results import ResultWriter, read_results, iter_results
+from .cache import ResultCache, point_key
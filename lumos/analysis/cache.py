@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""
+A content-addressed, on-disk cache of sweep results.
+
+Each grid point is identified by the digest of its configuration, e.g. the
+budget, tech node, core spec, ASIC allocation, application, and the digest
+of the workload file. Results are kept in a sqlite database keyed by the
+digest, so that an interrupted sweep only evaluates missing points when it
+is rerun, and identical points of different analyses are evaluated once.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from lumos.settings import LUMOS_DEBUG
+from lumos import BraceMessage as _bm_
+from . import LumosAnalysisError
+
+
+__logger = None
+
+if LUMOS_DEBUG and ('all' in LUMOS_DEBUG or 'cache' in LUMOS_DEBUG):
+    _debug_enabled = True
+else:
+    _debug_enabled = False
+
+def _debug(brace_msg):
+    global __logger
+    if not _debug_enabled:
+        return
+
+    if not __logger:
+        __logger = logging.getLogger('ResultCache')
+        __logger.setLevel(logging.DEBUG)
+
+    __logger.debug(brace_msg)
+
+
+# sqlite limits the number of host parameters of a statement
+_MAX_VARS = 500
+
+
+def _canonical(obj):
+    """Convert obj into JSON-serializable values, in a canonical form"""
+    if isinstance(obj, dict):
+        return dict((str(k), _canonical(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if obj is None or isinstance(obj, (bool, str)):
+        return obj
+    if isinstance(obj, float):
+        # 1 and 1.0 are the same
+        return int(obj) if obj.is_integer() else obj
+    if isinstance(obj, int):
+        return obj
+    if hasattr(obj, 'item'):
+        # numpy scalars
+        return _canonical(obj.item())
+    if hasattr(obj, 'area') and hasattr(obj, 'power') and hasattr(obj, 'bw'):
+        # :class:`~lumos.model.Budget`
+        return {'area': _canonical(obj.area), 'power': _canonical(obj.power),
+                'bw': _canonical(obj.bw)}
+    raise LumosAnalysisError('Can not digest {0} of {1}'.format(obj, type(obj)))
+
+
+def point_key(config):
+    """Get the key of a grid point from its configuration.
+
+    Parameters
+    ----------
+    config : dict
+      Everything that determines the result, e.g.::
+
+        {'metric': 'speedup', 'budget': Sys_L, 'tech': 22,
+         'core': (22, 'cmos', 'hp', 'io'), 'asic_alloc': (0.1, 0.05),
+         'app': 'app_dag0', 'workload': file_digest('appdag.xml')}
+
+      Values can be numbers, strings, lists/tuples, dicts, and budgets.
+      Numbers are compared by value, e.g. 1 and 1.0 give the same key.
+
+    Returns
+    -------
+    str
+      The hex digest of the configuration.
+    """
+    s = json.dumps(_canonical(config), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(s.encode('utf-8')).hexdigest()
+
+
+class ResultCache(object):
+    """A persistent key-value store of results, backed by sqlite.
+
+    Parameters
+    ----------
+    path : str
+      The database file, created if not exists.
+    timeout : float
+      Seconds to wait for other processes writing to the same database.
+    """
+    def __init__(self, path, timeout=60):
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=timeout)
+        self._conn.execute('CREATE TABLE IF NOT EXISTS results '
+                           '(key TEXT PRIMARY KEY, value BLOB)')
+        self._conn.commit()
+
+    def __len__(self):
+        return self._conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def __contains__(self, key):
+        return self._conn.execute('SELECT 1 FROM results WHERE key=?',
+                                  (key,)).fetchone() is not None
+
+    def get(self, key, default=None):
+        row = self._conn.execute('SELECT value FROM results WHERE key=?',
+                                 (key,)).fetchone()
+        if row is None:
+            return default
+        return pickle.loads(row[0])
+
+    def get_many(self, keys):
+        """Get cached results of keys
+
+        Returns
+        -------
+        dict
+          results indexed by keys, missing keys are left out.
+        """
+        keys = list(set(keys))
+        ret = dict()
+        for i in range(0, len(keys), _MAX_VARS):
+            part = keys[i:i+_MAX_VARS]
+            rows = self._conn.execute(
+                'SELECT key, value FROM results WHERE key IN ({0})'.format(
+                    ','.join('?' * len(part))), part)
+            for key, value in rows:
+                ret[key] = pickle.loads(value)
+        _debug(_bm_('{0} of {1} keys cached', len(ret), len(keys)))
+        return ret
+
+    def put(self, key, value):
+        self.put_many(((key, value),))
+
+    def put_many(self, items):
+        """Store (key, value) pairs, and commit them to disk"""
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)',
+                ((key, sqlite3.Binary(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)))
+                 for key, value in items))
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
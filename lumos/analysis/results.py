@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+"""
+Columnar storage of sweep results.
+
+Results are appended to a Parquet file in batches (row groups) as a sweep
+progresses, so that memory is bounded by the batch size rather than the
+size of the sweep. Columns are typed and compressed, and can be read back
+selectively, with column predicates evaluated against per-batch statistics
+to skip unrelated data.
+
+This module requires pyarrow, which is imported on demand.
+"""
+
+import logging
+from lumos.settings import LUMOS_DEBUG
+from lumos import BraceMessage as _bm_
+from . import LumosAnalysisError
+
+
+__logger = None
+
+if LUMOS_DEBUG and ('all' in LUMOS_DEBUG or 'results' in LUMOS_DEBUG):
+    _debug_enabled = True
+else:
+    _debug_enabled = False
+
+def _debug(brace_msg):
+    global __logger
+    if not _debug_enabled:
+        return
+
+    if not __logger:
+        __logger = logging.getLogger('Results')
+        __logger.setLevel(logging.DEBUG)
+
+    __logger.debug(brace_msg)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise LumosAnalysisError('pyarrow is required for columnar results, '
+                                 'it can be installed by: pip install pyarrow')
+    return pyarrow
+
+
+class ResultWriter(object):
+    """Append results to a columnar (Parquet) file.
+
+    Rows are buffered, and written as a compressed batch once there are
+    batch_rows of them. The column types are inferred from the first batch,
+    unless a schema is given, and later batches are converted to them.
+
+    Parameters
+    ----------
+    path : str
+      The output file, it will be overwritten.
+    columns : list of str
+      The names of columns, in order. If None, they are taken from the first
+      appended batch.
+    schema : :class:`pyarrow.Schema`
+      The column types.
+    batch_rows : int
+      The number of rows buffered before being written.
+    compression : str
+      The compression codec, e.g. 'zstd', 'snappy', 'gzip', or None.
+
+    Examples
+    --------
+    >>> with ResultWriter('syn.parquet') as writer:
+    ...     for point, perf in runner.run(grid):
+    ...         writer.append_row(dict(point, perf=perf))
+    """
+    def __init__(self, path, columns=None, schema=None, batch_rows=65536,
+                 compression='zstd'):
+        self._pa = _import_pyarrow()
+        self.path = path
+        self.schema = schema
+        if columns is None and schema is not None:
+            columns = schema.names
+        self.columns = list(columns) if columns is not None else None
+        self.batch_rows = batch_rows
+        self.compression = compression
+        self.rows = 0
+
+        self._writer = None
+        # columns are buffered as chunks, rows appended one by one are
+        # collected separately and sealed into a chunk before the next batch
+        self._chunks = None
+        self._rows = None
+        self._buffered = 0
+
+    def _init_buffer(self, columns):
+        if self.columns is None:
+            self.columns = list(columns)
+        self._chunks = dict((name, []) for name in self.columns)
+        self._rows = dict((name, []) for name in self.columns)
+
+    def _check_columns(self, columns):
+        if self._chunks is None:
+            self._init_buffer(columns)
+        if set(columns) != set(self.columns):
+            raise LumosAnalysisError('Columns mismatch, expect {0}, but given {1}'.format(
+                sorted(self.columns), sorted(columns)))
+
+    def _seal_rows(self):
+        if self._rows[self.columns[0]]:
+            for name in self.columns:
+                self._chunks[name].append(self._rows[name])
+                self._rows[name] = []
+
+    def append(self, batch):
+        """Append a batch of rows.
+
+        Parameters
+        ----------
+        batch : dict
+          columns of the batch, as lists or arrays of the same length,
+          indexed by column names.
+        """
+        self._check_columns(batch.keys())
+        n = len(batch[self.columns[0]])
+        for name in self.columns:
+            if len(batch[name]) != n:
+                raise LumosAnalysisError('Column {0} has {1} rows, expect {2}'.format(
+                    name, len(batch[name]), n))
+
+        self._seal_rows()
+        for name in self.columns:
+            self._chunks[name].append(batch[name])
+        self._buffered += n
+
+        if self._buffered >= self.batch_rows:
+            self.flush()
+
+    def append_row(self, row):
+        """Append a row, as a dict indexed by column names"""
+        self._check_columns(row.keys())
+        for name in self.columns:
+            self._rows[name].append(row[name])
+        self._buffered += 1
+
+        if self._buffered >= self.batch_rows:
+            self.flush()
+
+    def _column(self, name, chunks):
+        pa = self._pa
+        if self.schema is not None:
+            dtype = self.schema.field(name).type
+            arrays = [pa.array(chunk, type=dtype) for chunk in chunks]
+        else:
+            arrays = [pa.array(chunk) for chunk in chunks]
+            # follow the type of the first chunk
+            arrays = [arr.cast(arrays[0].type) for arr in arrays]
+        return pa.chunked_array(arrays)
+
+    def flush(self):
+        """Write buffered rows"""
+        if not self._buffered:
+            return
+
+        pa = self._pa
+        self._seal_rows()
+        table = pa.Table.from_arrays(
+            [self._column(name, self._chunks[name]) for name in self.columns],
+            names=self.columns)
+        if self.schema is None:
+            self.schema = table.schema
+
+        if self._writer is None:
+            self._writer = pa.parquet.ParquetWriter(
+                self.path, self.schema, compression=self.compression)
+        self._writer.write_table(table)
+        _debug(_bm_('wrote {0} rows to {1}', self._buffered, self.path))
+
+        self.rows += self._buffered
+        self._buffered = 0
+        self._init_buffer(self.columns)
+
+    def close(self):
+        """Write buffered rows, and close the file"""
+        if self._chunks is not None:
+            self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _filter_expression(filters):
+    if not filters:
+        return None
+    pa = _import_pyarrow()
+    return pa.parquet.filters_to_expression(filters)
+
+
+def read_results(path, columns=None, filters=None):
+    """Read results written by :class:`ResultWriter`.
+
+    Parameters
+    ----------
+    path : str
+      The results file.
+    columns : list of str
+      Columns to be read, all columns if None.
+    filters : list of (column, op, value) tuples
+      Only rows satisfying all predicates are read, e.g. ``[('area', '==',
+      200), ('vdd', '<', 700)]``. Supported ops are ==, !=, <, <=, >, >=,
+      in, and not in.
+
+    Returns
+    -------
+    :class:`pandas.DataFrame`
+    """
+    pa = _import_pyarrow()
+    table = pa.parquet.read_table(path, columns=columns, filters=filters or None)
+    return table.to_pandas()
+
+
+def iter_results(path, columns=None, filters=None, batch_rows=65536):
+    """Iterate results in batches, see :func:`read_results` for parameters.
+
+    Returns
+    -------
+    generator
+      of :class:`pandas.DataFrame`, each has at most batch_rows rows
+    """
+    pa = _import_pyarrow()
+    import pyarrow.dataset
+    dataset = pa.dataset.dataset(path, format='parquet')
+    for batch in dataset.to_batches(columns=columns,
+                                    filter=_filter_expression(filters),
+                                    batch_size=batch_rows):
+        if batch.num_rows:
+            yield batch.to_pandas()
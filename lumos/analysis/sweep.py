@@ -0,0 +1,427 @@
+#!/usr/bin/env python
+"""
+A parallel runner of parameter sweeps.
+
+A sweep evaluates a function on every point of a parameter grid. The grid is
+split into chunks, which are evaluated on a pool of worker processes. Each
+worker loads the workload (kernels and applications) and warms up tech
+models and cores once, when it starts, so that only grid points and results
+are sent between processes. Results are streamed back in the order of the
+grid.
+"""
+
+import itertools
+import logging
+import math
+import multiprocessing
+import sys
+import time
+from collections import OrderedDict, deque
+
+from lumos.settings import LUMOS_DEBUG
+from lumos import BraceMessage as _bm_
+from . import LumosAnalysisError
+from .cache import ResultCache, point_key
+
+
+__logger = None
+
+if LUMOS_DEBUG and ('all' in LUMOS_DEBUG or 'sweep' in LUMOS_DEBUG):
+    _debug_enabled = True
+else:
+    _debug_enabled = False
+
+def _debug(brace_msg):
+    global __logger
+    if not _debug_enabled:
+        return
+
+    if not __logger:
+        __logger = logging.getLogger('Sweep')
+        __logger.setLevel(logging.DEBUG)
+
+    __logger.debug(brace_msg)
+
+
+class ParamGrid(object):
+    """The cartesian product of parameter values.
+
+    Parameters
+    ----------
+    axes : dict or list of (name, values) pairs
+      The values of each parameter. The last parameter varies the fastest.
+      Parameters of a plain dict are sorted by name, use a list or an
+      OrderedDict to keep the order.
+
+    Examples
+    --------
+    >>> grid = ParamGrid([('area', (100, 200)), ('power', (60, 90, 120))])
+    >>> len(grid)
+    6
+    >>> next(iter(grid))
+    {'area': 100, 'power': 60}
+    """
+    def __init__(self, axes):
+        if isinstance(axes, OrderedDict):
+            axes = list(axes.items())
+        elif isinstance(axes, dict):
+            axes = sorted(axes.items())
+        self._names = tuple(name for name, _ in axes)
+        self._values = tuple(tuple(values) for _, values in axes)
+
+    @property
+    def names(self):
+        return self._names
+
+    def __len__(self):
+        n = 1
+        for values in self._values:
+            n *= len(values)
+        return n
+
+    def __iter__(self):
+        for values in itertools.product(*self._values):
+            yield dict(zip(self._names, values))
+
+
+class AppGrid(object):
+    """Grid points of every application of a workload, crossed with other
+    parameters.
+
+    Applications are streamed from the workload (see
+    :func:`~lumos.model.workload.open_workload`) as points are consumed, so
+    that the memory of a sweep is bounded by the chunks in flight rather
+    than the size of the suite.
+
+    Parameters
+    ----------
+    workload_file : str
+      The XML file of kernels and applications.
+    axes : dict or list of (name, values) pairs
+      Other parameters, see :class:`ParamGrid`. They vary faster than
+      applications.
+    cache : bool, str, or None
+      Whether to use the compiled workload cache, or the directory of the
+      cache, see :func:`~lumos.model.workload.open_workload`.
+
+    Attributes
+    ----------
+    kernels : dict
+      Kernels of the workload.
+
+    Examples
+    --------
+    >>> grid = AppGrid('syn.xml', [('vdd', (600, 650, 700))])
+    >>> point = next(iter(grid))
+    >>> point['app'].name, point['vdd']
+    ('app_0', 600)
+
+    Workers only need kernels, so the runner is created with
+    load_apps=False, e.g.
+    ``SweepRunner(func, workload_file='syn.xml', load_apps=False)``.
+    """
+    def __init__(self, workload_file, axes=(), cache=None):
+        from lumos.model.workload import open_workload
+        self._workload = open_workload(workload_file, cache)
+        self._params = ParamGrid(axes)
+
+    @property
+    def names(self):
+        return ('app',) + self._params.names
+
+    @property
+    def kernels(self):
+        return self._workload.kernels
+
+    def __len__(self):
+        # only known for compiled workloads
+        return len(self._workload) * len(self._params)
+
+    def __iter__(self):
+        for app in self._workload.iter_apps():
+            for point in self._params:
+                point['app'] = app
+                yield point
+
+
+def _chunks(points, chunksize):
+    it = iter(points)
+    while True:
+        chunk = list(itertools.islice(it, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+# the context of the current (worker) process, see SweepRunner
+_context = None
+
+
+def load_context(workload_file=None, tech_models=(), cores=(),
+                 initializer=None, initargs=(), load_apps=True):
+    """Load the context of sweep evaluations.
+
+    Parameters
+    ----------
+    workload_file : str
+      The XML file of kernels and applications, loaded by
+      :func:`~lumos.model.workload.load_kernels_and_apps`.
+    tech_models : list of (name, variant, tech) tuples
+      Tech models to be loaded.
+    cores : list of (tech, tech_model_name, tech_model_variant, core_type) tuples
+      Cores to be built and interned, see :func:`~lumos.model.core.get_core`
+    initializer : callable
+      Called as initializer(context, *initargs) at last, which may add more
+      entries to the context.
+    initargs : tuple
+      Extra arguments to the initializer.
+    load_apps : bool
+      If False, only kernels of the workload are loaded, e.g. when
+      applications are streamed by :class:`AppGrid`.
+
+    Returns
+    -------
+    dict
+      with the keys of 'kernels' and 'apps' (if load_apps) if workload_file
+      is given,
+      'tech_models' indexed by (name, variant), and 'cores' indexed by the
+      core spec, as well as entries added by the initializer.
+    """
+    context = dict()
+    if workload_file and load_apps:
+        from lumos.model.workload import load_kernels_and_apps
+        context['kernels'], context['apps'] = load_kernels_and_apps(workload_file)
+    elif workload_file:
+        from lumos.model.workload import open_workload
+        context['kernels'] = open_workload(workload_file).kernels
+
+    if tech_models:
+        from lumos.model.tech import get_model
+        context['tech_models'] = dict()
+        for name, variant, tech in tech_models:
+            model = context['tech_models'].setdefault(
+                (name, variant), get_model(name, variant))
+            # load the node
+            model.freq(tech, model.vnom(tech))
+
+    if cores:
+        from lumos.model.core import get_core
+        context['cores'] = dict((tuple(spec), get_core(*spec)) for spec in cores)
+
+    if initializer:
+        initializer(context, *initargs)
+
+    return context
+
+
+def _init_worker(*args):
+    global _context
+    _context = load_context(*args)
+    _debug(_bm_('worker {0} initialized', multiprocessing.current_process().name))
+
+
+def _run_chunk(args):
+    func, chunk = args
+    return [func(point, _context) for point in chunk]
+
+
+def print_progress(done, total, elapsed):
+    """Print the progress of a sweep to stderr, as a progress callback of
+    :class:`SweepRunner`"""
+    rate = done / elapsed if elapsed > 0 else 0
+    if total:
+        msg = '{0}/{1} points ({2:.1f}%), {3:.1f} points/s'.format(
+            done, total, 100. * done / total, rate)
+    else:
+        msg = '{0} points, {1:.1f} points/s'.format(done, rate)
+    sys.stderr.write('\r' + msg)
+    if total and done == total:
+        sys.stderr.write('\n')
+    sys.stderr.flush()
+
+
+class SweepRunner(object):
+    """Evaluate a function on every point of a parameter grid in parallel.
+
+    Parameters
+    ----------
+    func : callable
+      Called as func(point, context) for each grid point, where the context is
+      loaded once per worker by :func:`load_context`. It needs to be
+      picklable, e.g. a module-level function.
+    nprocs : int
+      The number of worker processes, default to the number of CPUs. If 1,
+      points are evaluated in the current process.
+    chunksize : int
+      The number of points sent to a worker at a time. By default, the grid
+      is split into about 4 chunks per worker.
+    workload_file, tech_models, cores, initializer, initargs, load_apps
+      The context of workers, see :func:`load_context`.
+    progress : callable
+      Called as progress(done, total, elapsed) as results come in, at most
+      once per progress_interval seconds, and once at the end. total is None
+      if the length of the grid is unknown. See :func:`print_progress`.
+    progress_interval : float
+      In seconds.
+    cache : :class:`~lumos.analysis.cache.ResultCache` or str
+      The cache of results (or the path to it). Points found in the cache are
+      not evaluated, and new results are stored to the cache as each chunk
+      completes, so that an interrupted sweep resumes from the last chunk.
+    cache_key : callable
+      Called as cache_key(point) to get the configuration of a point, which
+      is digested by :func:`~lumos.analysis.cache.point_key`. It should
+      include everything that determines the result, e.g. the metric, the
+      digest of the workload file. Required if cache is given.
+
+    Attributes
+    ----------
+    stats : dict
+      Statistics of the last run, with keys of 'points', 'cached' (the number
+      of points served from the cache), 'elapsed' (in seconds), and
+      'throughput' (points per second).
+    """
+    def __init__(self, func, nprocs=None, chunksize=None,
+                 workload_file=None, tech_models=(), cores=(),
+                 initializer=None, initargs=(), load_apps=True,
+                 progress=None, progress_interval=1.0,
+                 cache=None, cache_key=None):
+        if nprocs is None:
+            nprocs = multiprocessing.cpu_count()
+        if nprocs < 1:
+            raise LumosAnalysisError('nprocs should be at least 1, but given {0}'.format(nprocs))
+        if chunksize is not None and chunksize < 1:
+            raise LumosAnalysisError('chunksize should be at least 1, but given {0}'.format(chunksize))
+
+        self.func = func
+        self.nprocs = nprocs
+        self.chunksize = chunksize
+        self._context_args = (workload_file, tuple(tech_models), tuple(cores),
+                              initializer, tuple(initargs), load_apps)
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.stats = None
+
+        if cache is not None and cache_key is None:
+            raise LumosAnalysisError('cache_key is required to cache results')
+        if isinstance(cache, str):
+            cache = ResultCache(cache)
+        self.cache = cache
+        self.cache_key = cache_key
+
+    def _get_chunksize(self, total):
+        if self.chunksize:
+            return self.chunksize
+        if not total:
+            return 1
+        return max(1, int(math.ceil(float(total) / (self.nprocs * 4))))
+
+    def _run_chunks(self, chunks):
+        if self.nprocs == 1:
+            context = None
+            for chunk in chunks:
+                if chunk and context is None:
+                    context = load_context(*self._context_args)
+                yield [self.func(point, context) for point in chunk]
+            return
+
+        pool = multiprocessing.Pool(self.nprocs, initializer=_init_worker,
+                                    initargs=self._context_args)
+        # chunks are submitted from this thread, keeping a few of them in
+        # flight per worker, and results are collected in order
+        inflight = deque()
+        try:
+            for chunk in chunks:
+                inflight.append(pool.apply_async(_run_chunk, ((self.func, chunk),)))
+                if len(inflight) >= 2 * self.nprocs:
+                    yield inflight.popleft().get()
+            while inflight:
+                yield inflight.popleft().get()
+            pool.close()
+        except BaseException:
+            # including GeneratorExit, when results are no longer consumed
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    def run(self, grid):
+        """Evaluate all points of the grid.
+
+        Parameters
+        ----------
+        grid : iterable
+          Grid points, e.g. a :class:`ParamGrid`, each point is passed to func
+          as it is.
+
+        Returns
+        -------
+        generator
+          of (point, result) pairs, in the order of the grid
+        """
+        try:
+            total = len(grid)
+        except TypeError:
+            total = None
+        chunksize = self._get_chunksize(total)
+        _debug(_bm_('sweep {0} points, {1} processes, chunksize: {2}',
+                    total, self.nprocs, chunksize))
+
+        # points are kept in the parent to be paired with results, while
+        # workers only get a copy of points not in the cache
+        pending = deque()
+
+        def tasks():
+            for chunk in _chunks(grid, chunksize):
+                if self.cache is None:
+                    keys, cached = None, dict()
+                    missing = chunk
+                else:
+                    keys = [point_key(self.cache_key(point)) for point in chunk]
+                    cached = self.cache.get_many(keys)
+                    missing = [point for point, key in zip(chunk, keys)
+                               if key not in cached]
+                pending.append((chunk, keys, cached))
+                yield missing
+
+        done = 0
+        ncached = 0
+        start = time.time()
+        last_report = start
+        for results in self._run_chunks(tasks()):
+            chunk, keys, cached = pending.popleft()
+            if keys is None:
+                chunk_results = results
+            else:
+                results = iter(results)
+                chunk_results = []
+                new = []
+                for key in keys:
+                    if key in cached:
+                        chunk_results.append(cached[key])
+                    else:
+                        result = next(results)
+                        chunk_results.append(result)
+                        new.append((key, result))
+                # checkpoint before handing out results
+                self.cache.put_many(new)
+                ncached += len(chunk) - len(new)
+
+            for point, result in zip(chunk, chunk_results):
+                yield point, result
+            done += len(chunk)
+
+            now = time.time()
+            if self.progress and (now - last_report >= self.progress_interval or
+                                  done == total):
+                self.progress(done, total, now - start)
+                last_report = now
+
+        elapsed = time.time() - start
+        self.stats = {
+            'points': done,
+            'cached': ncached,
+            'elapsed': elapsed,
+            'throughput': done / elapsed if elapsed > 0 else float('inf'),
+        }
+        if self.progress and done != total:
+            self.progress(done, total, elapsed)
@@ -1,3 +1,3 @@
 #!/usr/bin/env python 
 
-from .base import BaseCoreError, BaseCore
+from .base import BaseCoreError, BaseCore, get_core, clear_core_cache
@@ -261,13 +261,15 @@ class BaseCore(object):
                         tech_model.fnom_scale[TECH_BASE])
 
         self._vdd_list = np.arange(self.vmin, self.vmax+1)
-        self._sp_list = np.array([self._tech_model.static_power(self._tech, v_)
-                                  for v_ in self._vdd_list]) * self._sp0
-        self._dp_list = np.array([self._tech_model.dynamic_power(self._tech, v_)
-                                  for v_ in self._vdd_list]) * self._dp0
-        self._freq_list = np.array([self._tech_model.freq(self._tech, v_)
-                                    for v_ in self._vdd_list]) * self._f0
-
+        self._sp_list = self._tech_model.static_power_array(
+            self._tech, self._vdd_list) * self._sp0
+        self._dp_list = self._tech_model.dynamic_power_array(
+            self._tech, self._vdd_list) * self._dp0
+        self._freq_list = self._tech_model.freq_array(
+            self._tech, self._vdd_list) * self._f0
+        # cores may be shared through get_core(), keep them immutable
+        for arr in (self._vdd_list, self._sp_list, self._dp_list, self._freq_list):
+            arr.flags.writeable = False
 
         _get_logger().debug(_bm_('a0: {0}, dp0: {1}, sp0: {2}, perf0: {3}',
                                  self._area, self._dp0, self._sp0, self._perf0))
@@ -282,6 +284,45 @@ class BaseCore(object):
                                     vdd, self.vmin, self.vmax))
 
 
+    def _vdd_index(self, vdd):
+        vdd = np.asarray(vdd, dtype=np.int64)
+        if vdd.size and (vdd.min() < self.vmin or vdd.max() > self.vmax):
+            raise BaseCoreError('Vdd {0} not in the range supported by'
+                                ' technology model ({1}mv - {2}mv)'.format(
+                                    vdd, self.vmin, self.vmax))
+        return vdd - self.vmin
+
+    def freq_array(self, vdd):
+        """Vectorized :meth:`freq`
+
+        Parameters
+        ----------
+        vdd : array of int
+          Supply voltages in mV
+
+        Returns
+        -------
+        array
+          Frequencies at the given supplies, in the same shape as `vdd`
+        """
+        return self._freq_list[self._vdd_index(vdd)]
+
+    def power_array(self, vdd):
+        """Vectorized :meth:`power`
+
+        Parameters
+        ----------
+        vdd : array of int
+          Supply voltages in mV
+
+        Returns
+        -------
+        array
+          Total power in Watts at the given supplies, in the same shape as `vdd`
+        """
+        list_idx = self._vdd_index(vdd)
+        return self._dp_list[list_idx] + self._sp_list[list_idx]
+
     def perf_by_vdd(self, vdd):
         """Get performance when the core is operated at the given supply (vdd)
 
@@ -297,6 +338,50 @@ class BaseCore(object):
         """
         return self._perf0 * self.freq(vdd) / self.freq(self.vnom)
 
+    def perf_by_vdd_array(self, vdd):
+        """Vectorized :meth:`perf_by_vdd`
+
+        Parameters
+        ----------
+        vdd : array of int
+          Supply voltages in mV
+
+        Returns
+        -------
+        array
+          The achieved performance at the given supplies.
+        """
+        return self._perf0 * self.freq_array(vdd) / self.freq(self.vnom)
+
+    def vdd_constrained_by_power(self, power_budget):
+        """Get the highest supply (vdd) that meets power budgets
+
+        This is a vectorized search on the cumulative maximum of the power
+        curve, so a supply is returned only if no lower supply exceeds the
+        budget. For a monotonic power curve, this is the same as the binary
+        search in :meth:`perf_constrainted_by_power`.
+
+        Parameters
+        ----------
+        power_budget : float or array
+          The power constraints in Watts.
+
+        Returns
+        -------
+        array of int
+          The highest supply in mV for each power budget, in the same shape as
+          `power_budget`. It is 0 if the budget is too constrained to meet even
+          at the lowest supply (tech_model.vmin).
+        """
+        try:
+            power_cummax = self._power_cummax
+        except AttributeError:
+            power_cummax = np.maximum.accumulate(self._dp_list + self._sp_list)
+            self._power_cummax = power_cummax
+
+        list_idx = np.searchsorted(power_cummax, power_budget, side='right') - 1
+        return np.where(list_idx < 0, 0, list_idx + self.vmin)
+
     def perf_constrainted_by_power(self, power_budget):
         """Get performance constrained by specified power budget
 
@@ -433,3 +518,61 @@ class BaseCore(object):
     @property
     def ctype(self):
         return self._core_type
+
+    @property
+    def mnemonic(self):
+        """The core type and technology model, e.g. 'io-cmos-hp'"""
+        return '{0}-{1}'.format(self._core_type, self._tech_model.mnemonic)
+
+    def __setattr__(self, name, value):
+        # interned cores are shared, only private (lazily cached) attributes
+        # may be set on them
+        if not name.startswith('_') and self.__dict__.get('_interned', False):
+            raise BaseCoreError('Can not set {0} of the shared core {1}'.format(
+                name, self.mnemonic))
+        object.__setattr__(self, name, value)
+
+
+# interned cores, indexed by the core spec
+_core_cache = dict()
+
+
+def get_core(tech, tech_model_name, tech_model_variant, core_type):
+    """Get a core of the given spec.
+
+    Cores are interned, identical specs share one core object, which is
+    immutable once created, setting its attributes raises
+    :class:`BaseCoreError`. Operating points, e.g. the supply, are kept by
+    systems. Systems should use this instead of constructing
+    :class:`BaseCore` directly, so that the per-mV arrays are only computed
+    once for each spec.
+
+    Parameters
+    ----------
+    tech : int
+      technology node
+    tech_model_name : str
+      the name of the technology model, e.g. 'cmos'
+    tech_model_variant : str
+      the variant of the technology model, e.g. 'hp'
+    core_type : str
+      the type of the core, e.g. 'io'
+
+    Returns
+    -------
+    :class:`BaseCore`
+      the shared core
+    """
+    key = (tech, tech_model_name, tech_model_variant, core_type)
+    try:
+        return _core_cache[key]
+    except KeyError:
+        core = BaseCore(tech, tech_model_name, tech_model_variant, core_type)
+        core._interned = True
+        _core_cache[key] = core
+        return core
+
+
+def clear_core_cache():
+    """Drop all interned cores"""
+    _core_cache.clear()
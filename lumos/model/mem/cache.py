@@ -2,11 +2,37 @@
 import re
 import csv
 import bz2
+import bisect
 import os
 import logging
+import multiprocessing
 import pickle
+import struct
+import time
 
 from functools import lru_cache
+import numpy as np
+from lumos.settings import LUMOS_DEBUG
+from lumos import BraceMessage as _bm_
+
+__logger = None
+
+if LUMOS_DEBUG and ('all' in LUMOS_DEBUG or 'cache' in LUMOS_DEBUG):
+    _debug_enabled = True
+else:
+    _debug_enabled = False
+
+
+def _debug(brace_msg):
+    global __logger
+    if not _debug_enabled:
+        return
+
+    if not __logger:
+        __logger = logging.getLogger('Cache')
+        __logger.setLevel(logging.DEBUG)
+
+    __logger.debug(brace_msg)
 
 
 @lru_cache(maxsize=1024)
@@ -331,9 +357,266 @@ class CacheError(Exception):
     pass
 
 
-_cache_db = None
+#: Characteristics of a cache in cache_db
+CACHE_TRAITS = ('power', 'area', 'latency')
+
+#: Records of cache_db in the .npy format, sorted by (group, size), where the
+#: group is the ASCII key "tech_type/tech_node/line_sz/assoc/nbanks"
+CACHE_RECORD_DTYPE = np.dtype([('group', 'S40'), ('size', '<i8')] +
+                              [(name, '<f8') for name in CACHE_TRAITS])
+
+
+# the header of .npy files written by np.save, matched to skip parsing it
+_npy_header_re = re.compile(
+    re.escape("{{'descr': {0!r}, 'fortran_order': False, 'shape': (".format(
+        CACHE_RECORD_DTYPE.descr)) + r"([0-9]+),\),? *\} *\n$")
+
+
+def _group_key(tech_type, tech_node, line_sz, assoc, nbanks):
+    key = '{0}/{1}/{2}/{3}/{4}'.format(tech_type, tech_node, line_sz, assoc,
+                                       nbanks).encode('ascii')
+    if len(key) > CACHE_RECORD_DTYPE['group'].itemsize:
+        raise CacheError('Cache config key {0} is too long'.format(key))
+    return key
+
+
+def cache_db_to_records(cachedb):
+    """Convert cache_db from a dict to a sorted record array
+
+    Parameters
+    ----------
+    cachedb : dict
+      Cache traits indexed by (tech_type, tech_node, size, line_sz, assoc,
+      nbanks), each a dict with keys in :data:`CACHE_TRAITS`.
+
+    Returns
+    -------
+    array
+      of :data:`CACHE_RECORD_DTYPE`
+    """
+    records = np.zeros(len(cachedb), dtype=CACHE_RECORD_DTYPE)
+    for i, ((tech_type, tech_node, size, line_sz, assoc, nbanks), traits) in enumerate(
+            cachedb.items()):
+        records[i] = ((_group_key(tech_type, tech_node, line_sz, assoc, nbanks), size) +
+                      tuple(traits[name] for name in CACHE_TRAITS))
+    records.sort(order=('group', 'size'))
+    return records
+
+
+def records_to_cache_db(records):
+    """Convert cache_db from a record array to a dict, the reverse of
+    :func:`cache_db_to_records`"""
+    cachedb = dict()
+    for rec in records:
+        tech_type, tech_node, line_sz, assoc, nbanks = rec['group'].decode('ascii').split('/')
+        key = (tech_type, int(tech_node), int(rec['size']), int(line_sz),
+               int(assoc), int(nbanks))
+        cachedb[key] = dict((name, float(rec[name])) for name in CACHE_TRAITS)
+    return cachedb
+
+
+class CacheTraitIndex(object):
+    """Cache traits indexed for lookups by size.
+
+    Entries of cache_db are sorted by (tech_type, tech_node, line_sz, assoc,
+    nbanks) and then size, so that a cache configuration is a contiguous
+    range of records found by binary search, which is read on the first
+    lookup of the configuration. Sizes between two entries are interpolated
+    linearly in the log-log space, which is how area, power, and latency of
+    caches scale.
+
+    Use :meth:`from_dict` for cache_db as a dict, and :meth:`open` for
+    cache_db in the .npy format, which is memory-mapped and shared by
+    processes.
+
+    Parameters
+    ----------
+    records : array
+      of :data:`CACHE_RECORD_DTYPE`, sorted by (group, size), e.g. from
+      :func:`cache_db_to_records`.
+    """
+    def __init__(self, records):
+        if records.dtype != CACHE_RECORD_DTYPE:
+            raise CacheError('Expect records of {0}, but got {1}'.format(
+                CACHE_RECORD_DTYPE, records.dtype))
+        self._records = records
+        self._groups = dict()
+
+    @classmethod
+    def from_dict(cls, cachedb):
+        """Index cache_db as a dict, see :func:`cache_db_to_records`"""
+        return cls(cache_db_to_records(cachedb))
+
+    @classmethod
+    def open(cls, npyfile):
+        """Index cache_db in the .npy format without reading it in"""
+        try:
+            with open(npyfile, 'rb') as f:
+                magic = f.read(10)
+                mo = None
+                if magic[:8] == b'\x93NUMPY\x01\x00':
+                    hlen = struct.unpack('<H', magic[8:])[0]
+                    mo = _npy_header_re.match(f.read(hlen).decode('latin1'))
+            if mo and int(mo.group(1)) > 0:
+                records = np.memmap(npyfile, dtype=CACHE_RECORD_DTYPE, mode='r',
+                                    offset=10 + hlen, shape=(int(mo.group(1)), ))
+            else:
+                # written by other versions of numpy
+                records = np.load(npyfile, mmap_mode='r')
+            return cls(records)
+        except (OSError, ValueError) as e:
+            raise CacheError('Fail to open {0}: {1}'.format(npyfile, e))
+
+    def __len__(self):
+        return len(self._records)
+
+    def sizes(self, tech_type='cmos-hp', tech_node=22, line_sz=64, assoc=2, nbanks=1):
+        """Get the sizes in cache_db of a cache configuration, in bytes"""
+        return self._group(tech_type, tech_node, line_sz, assoc, nbanks)[0].astype(int)
+
+    def _group(self, tech_type, tech_node, line_sz, assoc, nbanks):
+        config = (tech_type, tech_node, line_sz, assoc, nbanks)
+        try:
+            return self._groups[config]
+        except KeyError:
+            pass
+
+        key = _group_key(*config)
+        # bisect touches log(n) records, rather than the whole column
+        groups = self._records['group']
+        lo = bisect.bisect_left(groups, key)
+        hi = bisect.bisect_right(groups, key, lo)
+        if lo == hi:
+            raise CacheError(
+                'No cache config for tech_type: {0}, tech_node: {1}, line_sz: {2}, '
+                'assoc: {3}, nbanks: {4}'.format(*config))
+        recs = np.array(self._records[lo:hi])
+        sizes = recs['size'].astype(np.float64)
+        values = np.column_stack([recs[name] for name in CACHE_TRAITS])
+        group = (sizes, values, np.log(sizes), np.log(values),
+                 sizes.tolist(), values.tolist())
+        self._groups[config] = group
+        return group
+
+    def lookup_array(self, size, tech_type='cmos-hp', tech_node=22, line_sz=64,
+                     assoc=2, nbanks=1, interpolate=True):
+        """Look up traits of many cache sizes at once.
+
+        Parameters
+        ----------
+        size : int or array of int
+          Cache sizes in bytes.
+        tech_type, tech_node, line_sz, assoc, nbanks
+          The cache configuration, see :func:`get_cache_trait`.
+        interpolate : bool
+          Interpolate sizes between entries of cache_db, otherwise only exact
+          sizes are allowed.
+
+        Returns
+        -------
+        dict
+          Arrays of traits in the shape of size, indexed by names in
+          :data:`CACHE_TRAITS`.
+
+        Raises
+        ------
+        CacheError
+          No entry for the configuration, or sizes out of the range of
+          cache_db (or not in cache_db if interpolate is False).
+        """
+        sizes, values, log_sizes, log_values, _, _ = self._group(
+            tech_type, tech_node, line_sz, assoc, nbanks)
+        size = np.asarray(size, dtype=np.float64)
+        idx = np.minimum(np.searchsorted(sizes, size), len(sizes) - 1)
+        exact = sizes[idx] == size
+        if not exact.all():
+            missing = size[~exact]
+            if not interpolate:
+                raise CacheError('No cache of size {0} for {1}'.format(
+                    missing.astype(int), (tech_type, tech_node, line_sz, assoc, nbanks)))
+            if (missing < sizes[0]).any() or (missing > sizes[-1]).any():
+                raise CacheError(
+                    'Cache size {0} is out of the range [{1}, {2}] for {3}'.format(
+                        missing.astype(int), int(sizes[0]), int(sizes[-1]),
+                        (tech_type, tech_node, line_sz, assoc, nbanks)))
+
+        log_size = np.log(size)
+        ret = dict()
+        for i, name in enumerate(CACHE_TRAITS):
+            # exact entries are returned as they are
+            ret[name] = np.where(
+                exact, values[idx, i], np.exp(np.interp(log_size, log_sizes, log_values[:, i])))
+        return ret
+
+    def lookup(self, size, tech_type='cmos-hp', tech_node=22, line_sz=64,
+               assoc=2, nbanks=1, interpolate=True):
+        """Look up traits of a cache size, see :meth:`lookup_array`
+
+        Returns
+        -------
+        dict
+          Traits indexed by names in :data:`CACHE_TRAITS`.
+        """
+        _, _, _, _, size_list, value_list = self._group(
+            tech_type, tech_node, line_sz, assoc, nbanks)
+        # sizes in cache_db skip array operations
+        i = bisect.bisect_left(size_list, size)
+        if i < len(size_list) and size_list[i] == size:
+            return dict(zip(CACHE_TRAITS, value_list[i]))
+        ret = self.lookup_array(size, tech_type, tech_node, line_sz, assoc,
+                                nbanks, interpolate)
+        return dict((name, float(val)) for name, val in ret.items())
+
+
+_cache_index = None
 _dbfile = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                        'cache_db.p.bz2')
+_npyfile = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'cache_db.npy')
+
+
+def load_cache_db(dbfile=None):
+    """Load cache_db as a dict, from the bz2-compressed pickle file, or the
+    .npy file"""
+    dbfile = dbfile or _dbfile
+    if dbfile.endswith('.npy'):
+        return records_to_cache_db(CacheTraitIndex.open(dbfile)._records)
+    try:
+        with bz2.open(dbfile, 'rb') as f:
+            return pickle.load(f)
+    except OSError:
+        raise CacheError('Fail to find {0}, go to $LUMOS_HOME and run '
+                         '"python -m lumos.model.mem.cache" to generate '
+                         'cache_db'.format(dbfile))
+
+
+def save_cache_db(cachedb, dbfile=None):
+    """Save cache_db as a dict, to the bz2-compressed pickle file, or the .npy
+    file if dbfile ends with .npy"""
+    dbfile = dbfile or _dbfile
+    if dbfile.endswith('.npy'):
+        tmpfile = '{0}.tmp{1}.npy'.format(dbfile[:-4], os.getpid())
+        np.save(tmpfile, cache_db_to_records(cachedb))
+        # readers never see a partial file
+        os.replace(tmpfile, dbfile)
+    else:
+        with bz2.open(dbfile, 'wb') as f:
+            pickle.dump(cachedb, f)
+
+
+def get_cache_index():
+    """Get the :class:`CacheTraitIndex` of cache_db, loaded on first use.
+
+    cache_db.npy is memory-mapped if it exists, otherwise cache_db.p.bz2 is
+    loaded.
+    """
+    global _cache_index
+    if _cache_index is None:
+        if os.path.exists(_npyfile):
+            _cache_index = CacheTraitIndex.open(_npyfile)
+        else:
+            _cache_index = CacheTraitIndex.from_dict(load_cache_db())
+    return _cache_index
 
 
 def get_cache_trait(size,
@@ -341,31 +624,269 @@ def get_cache_trait(size,
                     tech_node=22,
                     line_sz=64,
                     assoc=2,
-                    nbanks=1):
-    global _cache_db, _dbfile
-    if not _cache_db:
-        try:
-            with bz2.open(_dbfile, 'rb') as f:
-                _cache_db = pickle.load(f)
-        except OSError:
-            raise CacheError('Fail to find {0}, go to $LUMOS_HOME and run '
-                             '"python -m lumos.model.mem.cache" to generate '
-                             'cache_db'.format(_dbfile))
-
-    key = (tech_type, tech_node, size, line_sz, assoc, nbanks)
+                    nbanks=1,
+                    interpolate=True):
+    """Get area, power, and latency of a cache
+
+    Parameters
+    ----------
+    size : int
+      The size of cache in bytes.
+    tech_type : str
+      The technology, e.g. 'cmos-hp', 'finfet-hp', or 'sttram-sttram'.
+    tech_node : int
+      The technology node in nm.
+    line_sz, assoc, nbanks : int
+      The cache line size in bytes, associativity, and number of banks.
+    interpolate : bool
+      Interpolate sizes not in cache_db between the closest sizes in the
+      log-log space, default is True.
+
+    Returns
+    -------
+    dict
+      with keys of 'power' (W), 'area' (mm^2), and 'latency' (ns).
+
+    Raises
+    ------
+    CacheError
+      No entry in cache_db for the cache configuration, or the size is out
+      of the range of cache_db.
+    """
     try:
-        return _cache_db[key]
-    except KeyError:
+        return get_cache_index().lookup(size, tech_type, tech_node, line_sz,
+                                        assoc, nbanks, interpolate)
+    except CacheError as e:
         raise CacheError(
-            'No cache config for tech_type: {tech_type}, tech_node: {tech_node}, '
-            'size: {size}, line_sz: {line_sz}, assoc: {assoc}, nbanks: {nbanks}.'
-            'Add config line to $LUMOS_HOME/lumos/model/mem/cache_db.csv.bz2, '
-            'then rerun "python -m lumos.model.mem.cache" to re-generate cache_db.')
+            '{0}. Add config line to $LUMOS_HOME/lumos/model/mem/cache_db.csv.bz2, '
+            'then rerun "python -m lumos.model.mem.cache" to re-generate '
+            'cache_db.'.format(e))
+
+
+def get_cache_traits(sizes,
+                     tech_type='cmos-hp',
+                     tech_node=22,
+                     line_sz=64,
+                     assoc=2,
+                     nbanks=1,
+                     interpolate=True):
+    """Vectorized :func:`get_cache_trait` on many cache sizes
+
+    Returns
+    -------
+    dict
+      Arrays of 'power', 'area', and 'latency' in the shape of sizes.
+    """
+    return get_cache_index().lookup_array(sizes, tech_type, tech_node, line_sz,
+                                          assoc, nbanks, interpolate)
+
+
+#: Sizes, line sizes, associativities, and numbers of banks in cache_db, for
+#: small (e.g. L1) and large (e.g. L2) caches
+_default_cache_space = (
+    ((16384, 32768, 65536, 131072, 262144, 524288),
+     (64, 128), (1, 2, 4), (1, )),
+    ((1048576, 2097152, 3145728, 4194304, 5242880, 6291456, 7340032, 8388608,
+      9437184, 10485760, 11534336, 12582912, 13631488, 14680064, 15728640,
+      16777216, 33554432, 67108864, 18874368, 134217728),
+     (64, 128, 256), (1, 2, 4, 8), (1, 2, 4)),
+)
+
+
+def default_cache_configs():
+    """Get the default keys of cache_db
+
+    Returns
+    -------
+    list
+      of (tech_type, tech_node, size, line_sz, assoc, nbanks), for all
+      technologies in the scale table.
+    """
+    from itertools import product
+    configs = []
+    for size_list, linesz_list, assoc_list, nbanks_list in _default_cache_space:
+        configs.extend((tech, node, size, line_sz, assoc, nbanks)
+                       for (tech, node), size, line_sz, assoc, nbanks in product(
+                           _tech_scale_table.keys(), size_list, linesz_list,
+                           assoc_list, nbanks_list))
+    return configs
+
+
+def cacti_solve(solve_key):
+    """Get traits of a cache at 22nm from CACTI, before scaling
+
+    Parameters
+    ----------
+    solve_key : tuple
+      (size, line_sz, assoc, nbanks)
+
+    Returns
+    -------
+    dict
+      with keys of 'power' (W), 'area' (mm^2), and 'latency' (ns).
+    """
+    size, line_sz, assoc, nbanks = solve_key
+    res = _solve_cache(size, line_sz=line_sz, assoc=assoc, nbanks=nbanks)
+    return {
+        'power': res.power.readOp.dynamic / res.access_time + res.power.readOp.leakage,
+        'area': res.cache_ht * 1e-3 * res.cache_len * 1e-3,
+        'latency': res.access_time * 1e9,
+    }
+
+
+def scale_cache_traits(traits, tech_type, tech_node):
+    """Scale traits of a cache at 22nm to (tech_type, tech_node), with factors
+    in the scale table"""
+    try:
+        scale = _tech_scale_table[(tech_type, tech_node)]
+    except KeyError:
+        raise CacheError('No scale factors for tech_type: {0}, tech_node: {1}'.format(
+            tech_type, tech_node))
+    return {
+        'power': traits['power'] * scale['power'],
+        'area': traits['area'] * scale['area'],
+        'latency': traits['latency'] * scale['time'],
+    }
+
+
+def _timed_solve(args):
+    solve, solve_key = args
+    start = time.time()
+    traits = solve(solve_key)
+    return solve_key, traits, time.time() - start
+
+
+def _dump_atomic(obj, path):
+    tmpfile = '{0}.tmp{1}'.format(path, os.getpid())
+    with open(tmpfile, 'wb') as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmpfile, path)
+
+
+def generate_cache_db(configs, cachedb=None, nprocs=None, checkpoint=None,
+                      force_update=False, solve=cacti_solve, progress=None):
+    """Fill cache_db with traits of cache configurations.
+
+    CACTI solves caches at 22nm, which are then scaled to each technology,
+    so a solve is shared by all (tech_type, tech_node) of the same (size,
+    line_sz, assoc, nbanks). Distinct solves run in a pool of processes, and
+    each solve is checkpointed as it completes, so that an interrupted run
+    resumes with the remaining solves.
+
+    Parameters
+    ----------
+    configs : iterable
+      Keys of cache_db, (tech_type, tech_node, size, line_sz, assoc, nbanks).
+    cachedb : dict
+      The existing cache_db, updated in place. Keys already in it are not
+      solved unless force_update.
+    nprocs : int
+      The number of worker processes, default to the number of CPUs. If 1,
+      caches are solved in the current process.
+    checkpoint : str
+      The path to the checkpoint of solves, a pickle of unscaled traits
+      indexed by (size, line_sz, assoc, nbanks).
+    force_update : bool
+      Solve all configs again, ignoring cachedb and the checkpoint.
+    solve : callable
+      Called as solve((size, line_sz, assoc, nbanks)) in workers, and returns
+      unscaled traits. It needs to be picklable, default is
+      :func:`cacti_solve`.
+    progress : callable
+      Called as progress(solve_key, elapsed, done, total) as each solve
+      completes, where elapsed is the time of the solve in seconds.
+
+    Returns
+    -------
+    cachedb : dict
+      The updated cache_db.
+    stats : dict
+      with keys of 'configs' (the number of keys updated), 'solves' (the
+      number of distinct solves run), 'checkpointed' (solves loaded from the
+      checkpoint), 'solve_time' (the sum of solve times in seconds), and
+      'elapsed' (in seconds).
+    """
+    if cachedb is None:
+        cachedb = dict()
+    if nprocs is None:
+        nprocs = multiprocessing.cpu_count()
+    if nprocs < 1:
+        raise CacheError('nprocs should be at least 1, but given {0}'.format(nprocs))
+
+    solves = dict()
+    if checkpoint and os.path.exists(checkpoint) and not force_update:
+        with open(checkpoint, 'rb') as f:
+            solves = pickle.load(f)
+
+    # configs to update grouped by their solves
+    pending = dict()
+    for key in configs:
+        tech_type, tech_node, size, line_sz, assoc, nbanks = key
+        if key in cachedb and not force_update:
+            continue
+        if (tech_type, tech_node) not in _tech_scale_table:
+            raise CacheError('No scale factors for tech_type: {0}, tech_node: {1}'.format(
+                tech_type, tech_node))
+        pending.setdefault((size, line_sz, assoc, nbanks), []).append(key)
+
+    def update(solve_key, traits):
+        for key in pending[solve_key]:
+            cachedb[key] = scale_cache_traits(traits, key[0], key[1])
+
+    nconfigs = sum(len(keys) for keys in pending.values())
+    todo = []
+    for solve_key in sorted(pending):
+        if solve_key in solves:
+            update(solve_key, solves[solve_key])
+        else:
+            todo.append(solve_key)
+    ncheckpointed = len(pending) - len(todo)
+    _debug(_bm_('{0} configs, {1} solves, {2} from checkpoint', nconfigs,
+                len(pending), ncheckpointed))
+
+    start = time.time()
+    solve_time = 0
+    tasks = [(solve, solve_key) for solve_key in todo]
+    pool = None
+    if nprocs == 1 or len(tasks) <= 1:
+        results = map(_timed_solve, tasks)
+    else:
+        pool = multiprocessing.Pool(min(nprocs, len(tasks)))
+        results = pool.imap_unordered(_timed_solve, tasks)
+    try:
+        for done, (solve_key, traits, elapsed) in enumerate(results, 1):
+            solves[solve_key] = traits
+            update(solve_key, traits)
+            solve_time += elapsed
+            if checkpoint:
+                _dump_atomic(solves, checkpoint)
+            _debug(_bm_('solve {0} in {1:.2f}s', solve_key, elapsed))
+            if progress:
+                progress(solve_key, elapsed, done, len(todo))
+        if pool:
+            pool.close()
+    except BaseException:
+        if pool:
+            pool.terminate()
+        raise
+    finally:
+        if pool:
+            pool.join()
+
+    return cachedb, {'configs': nconfigs,
+                     'solves': len(todo),
+                     'checkpointed': ncheckpointed,
+                     'solve_time': solve_time,
+                     'elapsed': time.time() - start}
+
+
+def _print_solve(solve_key, elapsed, done, total):
+    print('[{0}/{1}] solve size: {2}, line_sz: {3}, assoc: {4}, nbanks: {5} '
+          'in {6:.1f}s'.format(done, total, *(solve_key + (elapsed,))))
 
 
 if __name__ == '__main__':
     import argparse
-    from itertools import product
 
     parser = argparse.ArgumentParser()
     logging_levels = ('CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG',
@@ -376,19 +897,29 @@ if __name__ == '__main__':
                         choices=logging_levels)
     parser.add_argument('-f', '--force-update', action='store_true')
     parser.add_argument('-i', '--ignore-csvfile', action='store_true')
+    parser.add_argument('-j', '--nprocs', type=int, default=None,
+                        help='the number of processes, default to the number of CPUs')
+    parser.add_argument('-c', '--convert', action='store_true',
+                        help='convert cache_db.p.bz2 to cache_db.npy without solving')
     args = parser.parse_args()
 
+    if args.convert:
+        save_cache_db(load_cache_db(), _npyfile)
+        raise SystemExit(0)
+
     _logger = logging.getLogger()
     _logger.setLevel(args.logging_level)
 
     csvfile = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                            'cache_db.csv.bz2')
+    # unscaled CACTI results, kept across runs to resume generation
+    solvefile = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'cache_solves.p')
 
     if not args.force_update:
         try:
-            with bz2.open(_dbfile, 'rb') as f:
-                cachedb = pickle.load(f)
-        except OSError:
+            cachedb = load_cache_db()
+        except CacheError:
             cachedb = dict()
     else:
         cachedb = dict()
@@ -397,124 +928,22 @@ if __name__ == '__main__':
     if os.path.exists(csvfile) and not args.ignore_csvfile:
         with bz2.open(csvfile, 'rt') as f:
             reader = csv.DictReader(f)
-            for row in reader:
-                tech = row['tech']
-                node = int(row['node'])
-                size = int(row['size'])
-                line_sz = int(row['line_sz'])
-                assoc = int(row['assoc'])
-                nbanks = int(row['nbanks'])
-                key = (tech, node, size, line_sz, assoc, nbanks)
-                if key in cachedb and not args.force_update:
-                    continue
-                tech_table_index = (tech, node)
-                area_scale = _tech_scale_table[tech_table_index]['area']
-                power_scale = _tech_scale_table[tech_table_index]['power']
-                time_scale = _tech_scale_table[tech_table_index]['time']
-                print(
-                    'solve {tech} {node} {size} {line_sz} {assoc} {nbanks}'.format(
-                        **row))
-                res = _solve_cache(size,
-                                   line_sz=line_sz,
-                                   assoc=assoc,
-                                   nbanks=nbanks)
-                cachedb[key] = {
-                    'power': (res.power.readOp.dynamic / res.access_time +
-                              res.power.readOp.leakage) * power_scale,
-                    'area':
-                    res.cache_ht * 1e-3 * res.cache_len * 1e-3 * area_scale,
-                    'latency': res.access_time * 1e9 * time_scale,
-                }
-
-        with bz2.open(_dbfile, 'wb') as f:
-            pickle.dump(cachedb, f)
+            configs = [(row['tech'], int(row['node']), int(row['size']),
+                        int(row['line_sz']), int(row['assoc']), int(row['nbanks']))
+                       for row in reader]
     else:
-        rows = []
-        # small caches, e.g. L1
-        size_list = (16384, 32768, 65536, 131072, 262144, 524288)
-        linesz_list = (64, 128)
-        assoc_list = (1, 2, 4)
-        nbanks_list = (1, )
-        for (tech, node), size, line_sz, assoc, nbanks in product(
-            _tech_scale_table.keys(), size_list, linesz_list, assoc_list,
-            nbanks_list):
-            key = (tech, node, size, line_sz, assoc, nbanks)
-            row = {
-                'tech': tech,
-                'node': node,
-                'size': size,
-                'line_sz': line_sz,
-                'assoc': assoc,
-                'nbanks': nbanks
-            }
-            rows.append(row)
-            if key in cachedb and not args.force_update:
-                continue
-            tech_table_index = (tech, node)
-            area_scale = _tech_scale_table[tech_table_index]['area']
-            power_scale = _tech_scale_table[tech_table_index]['power']
-            time_scale = _tech_scale_table[tech_table_index]['time']
-            print(
-                'solve {tech} {node} {size} {line_sz} {assoc} {nbanks}'.format(
-                    **row))
-            res = _solve_cache(size,
-                               line_sz=line_sz,
-                               assoc=assoc,
-                               nbanks=nbanks)
-            cachedb[key] = {
-                'power': (res.power.readOp.dynamic / res.access_time +
-                          res.power.readOp.leakage) * power_scale,
-                'area':
-                res.cache_ht * 1e-3 * res.cache_len * 1e-3 * area_scale,
-                'latency': res.access_time * 1e9 * time_scale,
-            }
-
-        # large caches, e.g. L2
-        size_list = (1048576, 2097152, 3145728, 4194304, 5242880, 6291456,
-                     7340032, 8388608, 9437184, 10485760, 11534336, 12582912,
-                     13631488, 14680064, 15728640, 16777216, 33554432,
-                     67108864, 18874368, 134217728)
-        linesz_list = (64, 128, 256)
-        assoc_list = (1, 2, 4, 8)
-        nbanks_list = (1, 2, 4)
-        for (tech, node), size, line_sz, assoc, nbanks in product(
-            _tech_scale_table.keys(), size_list, linesz_list, assoc_list,
-            nbanks_list):
-            key = (tech, node, size, line_sz, assoc, nbanks)
-            row = {
-                'tech': tech,
-                'node': node,
-                'size': size,
-                'line_sz': line_sz,
-                'assoc': assoc,
-                'nbanks': nbanks
-            }
-            rows.append(row)
-            if key in cachedb and not args.force_update:
-                continue
-            tech_table_index = (tech, node)
-            area_scale = _tech_scale_table[tech_table_index]['area']
-            power_scale = _tech_scale_table[tech_table_index]['power']
-            time_scale = _tech_scale_table[tech_table_index]['time']
-            print(
-                'solve {tech} {node} {size} {line_sz} {assoc} {nbanks}'.format(
-                    **row))
-            res = _solve_cache(size,
-                               line_sz=line_sz,
-                               assoc=assoc,
-                               nbanks=nbanks)
-            cachedb[key] = {
-                'power': (res.power.readOp.dynamic / res.access_time +
-                          res.power.readOp.leakage) * power_scale,
-                'area':
-                res.cache_ht * 1e-3 * res.cache_len * 1e-3 * area_scale,
-                'latency': res.access_time * 1e9 * time_scale,
-            }
-
+        configs = default_cache_configs()
         with bz2.open(csvfile, 'wt') as f:
-            csvwriter = csv.DictWriter(f, fieldnames=index_fields)
-            csvwriter.writeheader()
-            csvwriter.writerows(rows)
-
-        with bz2.open(_dbfile, 'wb') as f:
-            pickle.dump(cachedb, f)
+            csvwriter = csv.writer(f)
+            csvwriter.writerow(index_fields)
+            csvwriter.writerows(configs)
+
+    cachedb, stats = generate_cache_db(configs, cachedb, nprocs=args.nprocs,
+                                       checkpoint=solvefile,
+                                       force_update=args.force_update,
+                                       progress=_print_solve)
+    print('{configs} configs updated with {solves} solves ({checkpointed} from '
+          'checkpoint), solve time: {solve_time:.1f}s, elapsed: {elapsed:.1f}s'.format(**stats))
+
+    save_cache_db(cachedb, _dbfile)
+    save_cache_db(cachedb, _npyfile)
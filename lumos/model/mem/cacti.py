@@ -0,0 +1,655 @@
+# This file was automatically generated by SWIG (https://www.swig.org).
+# Version 4.5.1
+#
+# Do not make changes to this file unless you know what you are doing - modify
+# the SWIG interface file instead.
+
+import typing
+# Import the low-level C/C++ module
+if getattr(globals().get("__spec__"), "parent", None) or __package__ or "." in __name__:
+    from . import _cacti
+else:
+    import _cacti
+
+import builtins as __builtin__
+
+def _swig_repr(self):
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
+    return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
+
+
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "this":
+            set(self, name, value)
+        elif name == "thisown":
+            self.this.own(value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
+        else:
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
+
+
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
+        else:
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
+
+
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
+
+
+class SwigPyIterator(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+
+    def __init__(self, *args, **kwargs):
+        raise AttributeError("No constructor defined - class is abstract")
+    __repr__ = _swig_repr
+    __swig_destroy__ = _cacti.delete_SwigPyIterator
+
+    def value(self):
+        return _cacti.SwigPyIterator_value(self)
+
+    def incr(self, n=1):
+        return _cacti.SwigPyIterator_incr(self, n)
+
+    def decr(self, n=1):
+        return _cacti.SwigPyIterator_decr(self, n)
+
+    def distance(self, x):
+        return _cacti.SwigPyIterator_distance(self, x)
+
+    def equal(self, x):
+        return _cacti.SwigPyIterator_equal(self, x)
+
+    def copy(self):
+        return _cacti.SwigPyIterator_copy(self)
+
+    def __next__(self):
+        return _cacti.SwigPyIterator___next__(self)
+
+    def previous(self):
+        return _cacti.SwigPyIterator_previous(self)
+
+    def advance(self, n):
+        return _cacti.SwigPyIterator_advance(self, n)
+
+    def __eq__(self, x):
+        return _cacti.SwigPyIterator___eq__(self, x)
+
+    def __ne__(self, x):
+        return _cacti.SwigPyIterator___ne__(self, x)
+
+    def __iadd__(self, n):
+        return _cacti.SwigPyIterator___iadd__(self, n)
+
+    def __isub__(self, n):
+        return _cacti.SwigPyIterator___isub__(self, n)
+
+    def __add__(self, n):
+        return _cacti.SwigPyIterator___add__(self, n)
+
+    def __sub__(self, *args):
+        return _cacti.SwigPyIterator___sub__(self, *args)
+    def __iter__(self):
+        return self
+
+# Register SwigPyIterator in _cacti:
+_cacti.SwigPyIterator_swigregister(SwigPyIterator)
+class VectorDouble(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def iterator(self):
+        return _cacti.VectorDouble_iterator(self)
+    def __iter__(self):
+        return self.iterator()
+
+    def __bool__(self):
+        return _cacti.VectorDouble___bool__(self)
+
+    def __len__(self):
+        return _cacti.VectorDouble___len__(self)
+
+    def __delitem__(self, *args):
+        return _cacti.VectorDouble___delitem__(self, *args)
+
+    def __getitem__(self, *args):
+        return _cacti.VectorDouble___getitem__(self, *args)
+
+    def __setitem__(self, *args):
+        return _cacti.VectorDouble___setitem__(self, *args)
+
+    def pop(self):
+        return _cacti.VectorDouble_pop(self)
+
+    def append(self, x):
+        return _cacti.VectorDouble_append(self, x)
+
+    def empty(self):
+        return _cacti.VectorDouble_empty(self)
+
+    def size(self):
+        return _cacti.VectorDouble_size(self)
+
+    def swap(self, v):
+        return _cacti.VectorDouble_swap(self, v)
+
+    def begin(self):
+        return _cacti.VectorDouble_begin(self)
+
+    def end(self):
+        return _cacti.VectorDouble_end(self)
+
+    def rbegin(self):
+        return _cacti.VectorDouble_rbegin(self)
+
+    def rend(self):
+        return _cacti.VectorDouble_rend(self)
+
+    def clear(self):
+        return _cacti.VectorDouble_clear(self)
+
+    def get_allocator(self):
+        return _cacti.VectorDouble_get_allocator(self)
+
+    def pop_back(self):
+        return _cacti.VectorDouble_pop_back(self)
+
+    def erase(self, *args):
+        return _cacti.VectorDouble_erase(self, *args)
+
+    def __init__(self, *args):
+        _cacti.VectorDouble_swiginit(self, _cacti.new_VectorDouble(*args))
+
+    def push_back(self, x):
+        return _cacti.VectorDouble_push_back(self, x)
+
+    def front(self):
+        return _cacti.VectorDouble_front(self)
+
+    def back(self):
+        return _cacti.VectorDouble_back(self)
+
+    def assign(self, n, x):
+        return _cacti.VectorDouble_assign(self, n, x)
+
+    def resize(self, *args):
+        return _cacti.VectorDouble_resize(self, *args)
+
+    def insert(self, *args):
+        return _cacti.VectorDouble_insert(self, *args)
+
+    def reserve(self, n):
+        return _cacti.VectorDouble_reserve(self, n)
+
+    def capacity(self):
+        return _cacti.VectorDouble_capacity(self)
+    __swig_destroy__ = _cacti.delete_VectorDouble
+
+# Register VectorDouble in _cacti:
+_cacti.VectorDouble_swigregister(VectorDouble)
+class powerComponents(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    dynamic = property(_cacti.powerComponents_dynamic_get, _cacti.powerComponents_dynamic_set)
+    leakage = property(_cacti.powerComponents_leakage_get, _cacti.powerComponents_leakage_set)
+    gate_leakage = property(_cacti.powerComponents_gate_leakage_get, _cacti.powerComponents_gate_leakage_set)
+    short_circuit = property(_cacti.powerComponents_short_circuit_get, _cacti.powerComponents_short_circuit_set)
+    longer_channel_leakage = property(_cacti.powerComponents_longer_channel_leakage_get, _cacti.powerComponents_longer_channel_leakage_set)
+    power_gated_leakage = property(_cacti.powerComponents_power_gated_leakage_get, _cacti.powerComponents_power_gated_leakage_set)
+    power_gated_with_long_channel_leakage = property(_cacti.powerComponents_power_gated_with_long_channel_leakage_get, _cacti.powerComponents_power_gated_with_long_channel_leakage_set)
+
+    def __init__(self, *args):
+        _cacti.powerComponents_swiginit(self, _cacti.new_powerComponents(*args))
+
+    def reset(self):
+        return _cacti.powerComponents_reset(self)
+    __swig_destroy__ = _cacti.delete_powerComponents
+
+# Register powerComponents in _cacti:
+_cacti.powerComponents_swigregister(powerComponents)
+class powerDef(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    readOp = property(_cacti.powerDef_readOp_get, _cacti.powerDef_readOp_set)
+    writeOp = property(_cacti.powerDef_writeOp_get, _cacti.powerDef_writeOp_set)
+    searchOp = property(_cacti.powerDef_searchOp_get, _cacti.powerDef_searchOp_set)
+
+    def __init__(self):
+        _cacti.powerDef_swiginit(self, _cacti.new_powerDef())
+
+    def reset(self):
+        return _cacti.powerDef_reset(self)
+    __swig_destroy__ = _cacti.delete_powerDef
+
+# Register powerDef in _cacti:
+_cacti.powerDef_swigregister(powerDef)
+
+def cxxop_add(*args):
+    return _cacti.cxxop_add(*args)
+
+def cxxop_mul(*args):
+    return _cacti.cxxop_mul(*args)
+
+Global = _cacti.Global
+Global_5 = _cacti.Global_5
+Global_10 = _cacti.Global_10
+Global_20 = _cacti.Global_20
+Global_30 = _cacti.Global_30
+Low_swing = _cacti.Low_swing
+Semi_global = _cacti.Semi_global
+Transmission = _cacti.Transmission
+Optical = _cacti.Optical
+Invalid_wtype = _cacti.Invalid_wtype
+class InputParameter(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+
+    def __init__(self):
+        _cacti.InputParameter_swiginit(self, _cacti.new_InputParameter())
+
+    def parse_cfg(self, infile):
+        return _cacti.InputParameter_parse_cfg(self, infile)
+
+    def error_checking(self):
+        return _cacti.InputParameter_error_checking(self)
+
+    def display_ip(self):
+        return _cacti.InputParameter_display_ip(self)
+    cache_sz = property(_cacti.InputParameter_cache_sz_get, _cacti.InputParameter_cache_sz_set)
+    line_sz = property(_cacti.InputParameter_line_sz_get, _cacti.InputParameter_line_sz_set)
+    assoc = property(_cacti.InputParameter_assoc_get, _cacti.InputParameter_assoc_set)
+    nbanks = property(_cacti.InputParameter_nbanks_get, _cacti.InputParameter_nbanks_set)
+    out_w = property(_cacti.InputParameter_out_w_get, _cacti.InputParameter_out_w_set)
+    specific_tag = property(_cacti.InputParameter_specific_tag_get, _cacti.InputParameter_specific_tag_set)
+    tag_w = property(_cacti.InputParameter_tag_w_get, _cacti.InputParameter_tag_w_set)
+    access_mode = property(_cacti.InputParameter_access_mode_get, _cacti.InputParameter_access_mode_set)
+    obj_func_dyn_energy = property(_cacti.InputParameter_obj_func_dyn_energy_get, _cacti.InputParameter_obj_func_dyn_energy_set)
+    obj_func_dyn_power = property(_cacti.InputParameter_obj_func_dyn_power_get, _cacti.InputParameter_obj_func_dyn_power_set)
+    obj_func_leak_power = property(_cacti.InputParameter_obj_func_leak_power_get, _cacti.InputParameter_obj_func_leak_power_set)
+    obj_func_cycle_t = property(_cacti.InputParameter_obj_func_cycle_t_get, _cacti.InputParameter_obj_func_cycle_t_set)
+    F_sz_nm = property(_cacti.InputParameter_F_sz_nm_get, _cacti.InputParameter_F_sz_nm_set)
+    F_sz_um = property(_cacti.InputParameter_F_sz_um_get, _cacti.InputParameter_F_sz_um_set)
+    specific_hp_vdd = property(_cacti.InputParameter_specific_hp_vdd_get, _cacti.InputParameter_specific_hp_vdd_set)
+    hp_Vdd = property(_cacti.InputParameter_hp_Vdd_get, _cacti.InputParameter_hp_Vdd_set)
+    specific_lstp_vdd = property(_cacti.InputParameter_specific_lstp_vdd_get, _cacti.InputParameter_specific_lstp_vdd_set)
+    lstp_Vdd = property(_cacti.InputParameter_lstp_Vdd_get, _cacti.InputParameter_lstp_Vdd_set)
+    specific_lop_vdd = property(_cacti.InputParameter_specific_lop_vdd_get, _cacti.InputParameter_specific_lop_vdd_set)
+    lop_Vdd = property(_cacti.InputParameter_lop_Vdd_get, _cacti.InputParameter_lop_Vdd_set)
+    specific_vcc_min = property(_cacti.InputParameter_specific_vcc_min_get, _cacti.InputParameter_specific_vcc_min_set)
+    user_defined_vcc_min = property(_cacti.InputParameter_user_defined_vcc_min_get, _cacti.InputParameter_user_defined_vcc_min_set)
+    user_defined_vcc_underflow = property(_cacti.InputParameter_user_defined_vcc_underflow_get, _cacti.InputParameter_user_defined_vcc_underflow_set)
+    num_rw_ports = property(_cacti.InputParameter_num_rw_ports_get, _cacti.InputParameter_num_rw_ports_set)
+    num_rd_ports = property(_cacti.InputParameter_num_rd_ports_get, _cacti.InputParameter_num_rd_ports_set)
+    num_wr_ports = property(_cacti.InputParameter_num_wr_ports_get, _cacti.InputParameter_num_wr_ports_set)
+    num_se_rd_ports = property(_cacti.InputParameter_num_se_rd_ports_get, _cacti.InputParameter_num_se_rd_ports_set)
+    num_search_ports = property(_cacti.InputParameter_num_search_ports_get, _cacti.InputParameter_num_search_ports_set)
+    is_main_mem = property(_cacti.InputParameter_is_main_mem_get, _cacti.InputParameter_is_main_mem_set)
+    is_cache = property(_cacti.InputParameter_is_cache_get, _cacti.InputParameter_is_cache_set)
+    pure_ram = property(_cacti.InputParameter_pure_ram_get, _cacti.InputParameter_pure_ram_set)
+    pure_cam = property(_cacti.InputParameter_pure_cam_get, _cacti.InputParameter_pure_cam_set)
+    rpters_in_htree = property(_cacti.InputParameter_rpters_in_htree_get, _cacti.InputParameter_rpters_in_htree_set)
+    ver_htree_wires_over_array = property(_cacti.InputParameter_ver_htree_wires_over_array_get, _cacti.InputParameter_ver_htree_wires_over_array_set)
+    broadcast_addr_din_over_ver_htrees = property(_cacti.InputParameter_broadcast_addr_din_over_ver_htrees_get, _cacti.InputParameter_broadcast_addr_din_over_ver_htrees_set)
+    temp = property(_cacti.InputParameter_temp_get, _cacti.InputParameter_temp_set)
+    ram_cell_tech_type = property(_cacti.InputParameter_ram_cell_tech_type_get, _cacti.InputParameter_ram_cell_tech_type_set)
+    peri_global_tech_type = property(_cacti.InputParameter_peri_global_tech_type_get, _cacti.InputParameter_peri_global_tech_type_set)
+    data_arr_ram_cell_tech_type = property(_cacti.InputParameter_data_arr_ram_cell_tech_type_get, _cacti.InputParameter_data_arr_ram_cell_tech_type_set)
+    data_arr_peri_global_tech_type = property(_cacti.InputParameter_data_arr_peri_global_tech_type_get, _cacti.InputParameter_data_arr_peri_global_tech_type_set)
+    tag_arr_ram_cell_tech_type = property(_cacti.InputParameter_tag_arr_ram_cell_tech_type_get, _cacti.InputParameter_tag_arr_ram_cell_tech_type_set)
+    tag_arr_peri_global_tech_type = property(_cacti.InputParameter_tag_arr_peri_global_tech_type_get, _cacti.InputParameter_tag_arr_peri_global_tech_type_set)
+    burst_len = property(_cacti.InputParameter_burst_len_get, _cacti.InputParameter_burst_len_set)
+    int_prefetch_w = property(_cacti.InputParameter_int_prefetch_w_get, _cacti.InputParameter_int_prefetch_w_set)
+    page_sz_bits = property(_cacti.InputParameter_page_sz_bits_get, _cacti.InputParameter_page_sz_bits_set)
+    ic_proj_type = property(_cacti.InputParameter_ic_proj_type_get, _cacti.InputParameter_ic_proj_type_set)
+    wire_is_mat_type = property(_cacti.InputParameter_wire_is_mat_type_get, _cacti.InputParameter_wire_is_mat_type_set)
+    wire_os_mat_type = property(_cacti.InputParameter_wire_os_mat_type_get, _cacti.InputParameter_wire_os_mat_type_set)
+    wt = property(_cacti.InputParameter_wt_get, _cacti.InputParameter_wt_set)
+    force_wiretype = property(_cacti.InputParameter_force_wiretype_get, _cacti.InputParameter_force_wiretype_set)
+    print_input_args = property(_cacti.InputParameter_print_input_args_get, _cacti.InputParameter_print_input_args_set)
+    nuca_cache_sz = property(_cacti.InputParameter_nuca_cache_sz_get, _cacti.InputParameter_nuca_cache_sz_set)
+    ndbl = property(_cacti.InputParameter_ndbl_get, _cacti.InputParameter_ndbl_set)
+    ndwl = property(_cacti.InputParameter_ndwl_get, _cacti.InputParameter_ndwl_set)
+    nspd = property(_cacti.InputParameter_nspd_get, _cacti.InputParameter_nspd_set)
+    ndsam1 = property(_cacti.InputParameter_ndsam1_get, _cacti.InputParameter_ndsam1_set)
+    ndsam2 = property(_cacti.InputParameter_ndsam2_get, _cacti.InputParameter_ndsam2_set)
+    ndcm = property(_cacti.InputParameter_ndcm_get, _cacti.InputParameter_ndcm_set)
+    force_cache_config = property(_cacti.InputParameter_force_cache_config_get, _cacti.InputParameter_force_cache_config_set)
+    cache_level = property(_cacti.InputParameter_cache_level_get, _cacti.InputParameter_cache_level_set)
+    cores = property(_cacti.InputParameter_cores_get, _cacti.InputParameter_cores_set)
+    nuca_bank_count = property(_cacti.InputParameter_nuca_bank_count_get, _cacti.InputParameter_nuca_bank_count_set)
+    force_nuca_bank = property(_cacti.InputParameter_force_nuca_bank_get, _cacti.InputParameter_force_nuca_bank_set)
+    delay_wt = property(_cacti.InputParameter_delay_wt_get, _cacti.InputParameter_delay_wt_set)
+    dynamic_power_wt = property(_cacti.InputParameter_dynamic_power_wt_get, _cacti.InputParameter_dynamic_power_wt_set)
+    leakage_power_wt = property(_cacti.InputParameter_leakage_power_wt_get, _cacti.InputParameter_leakage_power_wt_set)
+    cycle_time_wt = property(_cacti.InputParameter_cycle_time_wt_get, _cacti.InputParameter_cycle_time_wt_set)
+    area_wt = property(_cacti.InputParameter_area_wt_get, _cacti.InputParameter_area_wt_set)
+    delay_wt_nuca = property(_cacti.InputParameter_delay_wt_nuca_get, _cacti.InputParameter_delay_wt_nuca_set)
+    dynamic_power_wt_nuca = property(_cacti.InputParameter_dynamic_power_wt_nuca_get, _cacti.InputParameter_dynamic_power_wt_nuca_set)
+    leakage_power_wt_nuca = property(_cacti.InputParameter_leakage_power_wt_nuca_get, _cacti.InputParameter_leakage_power_wt_nuca_set)
+    cycle_time_wt_nuca = property(_cacti.InputParameter_cycle_time_wt_nuca_get, _cacti.InputParameter_cycle_time_wt_nuca_set)
+    area_wt_nuca = property(_cacti.InputParameter_area_wt_nuca_get, _cacti.InputParameter_area_wt_nuca_set)
+    delay_dev = property(_cacti.InputParameter_delay_dev_get, _cacti.InputParameter_delay_dev_set)
+    dynamic_power_dev = property(_cacti.InputParameter_dynamic_power_dev_get, _cacti.InputParameter_dynamic_power_dev_set)
+    leakage_power_dev = property(_cacti.InputParameter_leakage_power_dev_get, _cacti.InputParameter_leakage_power_dev_set)
+    cycle_time_dev = property(_cacti.InputParameter_cycle_time_dev_get, _cacti.InputParameter_cycle_time_dev_set)
+    area_dev = property(_cacti.InputParameter_area_dev_get, _cacti.InputParameter_area_dev_set)
+    delay_dev_nuca = property(_cacti.InputParameter_delay_dev_nuca_get, _cacti.InputParameter_delay_dev_nuca_set)
+    dynamic_power_dev_nuca = property(_cacti.InputParameter_dynamic_power_dev_nuca_get, _cacti.InputParameter_dynamic_power_dev_nuca_set)
+    leakage_power_dev_nuca = property(_cacti.InputParameter_leakage_power_dev_nuca_get, _cacti.InputParameter_leakage_power_dev_nuca_set)
+    cycle_time_dev_nuca = property(_cacti.InputParameter_cycle_time_dev_nuca_get, _cacti.InputParameter_cycle_time_dev_nuca_set)
+    area_dev_nuca = property(_cacti.InputParameter_area_dev_nuca_get, _cacti.InputParameter_area_dev_nuca_set)
+    ed = property(_cacti.InputParameter_ed_get, _cacti.InputParameter_ed_set)
+    nuca = property(_cacti.InputParameter_nuca_get, _cacti.InputParameter_nuca_set)
+    fast_access = property(_cacti.InputParameter_fast_access_get, _cacti.InputParameter_fast_access_set)
+    block_sz = property(_cacti.InputParameter_block_sz_get, _cacti.InputParameter_block_sz_set)
+    tag_assoc = property(_cacti.InputParameter_tag_assoc_get, _cacti.InputParameter_tag_assoc_set)
+    data_assoc = property(_cacti.InputParameter_data_assoc_get, _cacti.InputParameter_data_assoc_set)
+    is_seq_acc = property(_cacti.InputParameter_is_seq_acc_get, _cacti.InputParameter_is_seq_acc_set)
+    fully_assoc = property(_cacti.InputParameter_fully_assoc_get, _cacti.InputParameter_fully_assoc_set)
+    nsets = property(_cacti.InputParameter_nsets_get, _cacti.InputParameter_nsets_set)
+    print_detail = property(_cacti.InputParameter_print_detail_get, _cacti.InputParameter_print_detail_set)
+    add_ecc_b_ = property(_cacti.InputParameter_add_ecc_b__get, _cacti.InputParameter_add_ecc_b__set)
+    throughput = property(_cacti.InputParameter_throughput_get, _cacti.InputParameter_throughput_set)
+    latency = property(_cacti.InputParameter_latency_get, _cacti.InputParameter_latency_set)
+    pipelinable = property(_cacti.InputParameter_pipelinable_get, _cacti.InputParameter_pipelinable_set)
+    pipeline_stages = property(_cacti.InputParameter_pipeline_stages_get, _cacti.InputParameter_pipeline_stages_set)
+    per_stage_vector = property(_cacti.InputParameter_per_stage_vector_get, _cacti.InputParameter_per_stage_vector_set)
+    with_clock_grid = property(_cacti.InputParameter_with_clock_grid_get, _cacti.InputParameter_with_clock_grid_set)
+    array_power_gated = property(_cacti.InputParameter_array_power_gated_get, _cacti.InputParameter_array_power_gated_set)
+    bitline_floating = property(_cacti.InputParameter_bitline_floating_get, _cacti.InputParameter_bitline_floating_set)
+    wl_power_gated = property(_cacti.InputParameter_wl_power_gated_get, _cacti.InputParameter_wl_power_gated_set)
+    cl_power_gated = property(_cacti.InputParameter_cl_power_gated_get, _cacti.InputParameter_cl_power_gated_set)
+    interconect_power_gated = property(_cacti.InputParameter_interconect_power_gated_get, _cacti.InputParameter_interconect_power_gated_set)
+    power_gating = property(_cacti.InputParameter_power_gating_get, _cacti.InputParameter_power_gating_set)
+    perfloss = property(_cacti.InputParameter_perfloss_get, _cacti.InputParameter_perfloss_set)
+    cl_vertical = property(_cacti.InputParameter_cl_vertical_get, _cacti.InputParameter_cl_vertical_set)
+    dvs_voltage = property(_cacti.InputParameter_dvs_voltage_get, _cacti.InputParameter_dvs_voltage_set)
+    long_channel_device = property(_cacti.InputParameter_long_channel_device_get, _cacti.InputParameter_long_channel_device_set)
+    __swig_destroy__ = _cacti.delete_InputParameter
+
+# Register InputParameter in _cacti:
+_cacti.InputParameter_swigregister(InputParameter)
+class results_mem_array(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    Ndwl = property(_cacti.results_mem_array_Ndwl_get, _cacti.results_mem_array_Ndwl_set)
+    Ndbl = property(_cacti.results_mem_array_Ndbl_get, _cacti.results_mem_array_Ndbl_set)
+    Nspd = property(_cacti.results_mem_array_Nspd_get, _cacti.results_mem_array_Nspd_set)
+    deg_bl_muxing = property(_cacti.results_mem_array_deg_bl_muxing_get, _cacti.results_mem_array_deg_bl_muxing_set)
+    Ndsam_lev_1 = property(_cacti.results_mem_array_Ndsam_lev_1_get, _cacti.results_mem_array_Ndsam_lev_1_set)
+    Ndsam_lev_2 = property(_cacti.results_mem_array_Ndsam_lev_2_get, _cacti.results_mem_array_Ndsam_lev_2_set)
+    number_activated_mats_horizontal_direction = property(_cacti.results_mem_array_number_activated_mats_horizontal_direction_get, _cacti.results_mem_array_number_activated_mats_horizontal_direction_set)
+    number_subbanks = property(_cacti.results_mem_array_number_subbanks_get, _cacti.results_mem_array_number_subbanks_set)
+    page_size_in_bits = property(_cacti.results_mem_array_page_size_in_bits_get, _cacti.results_mem_array_page_size_in_bits_set)
+    delay_route_to_bank = property(_cacti.results_mem_array_delay_route_to_bank_get, _cacti.results_mem_array_delay_route_to_bank_set)
+    delay_crossbar = property(_cacti.results_mem_array_delay_crossbar_get, _cacti.results_mem_array_delay_crossbar_set)
+    delay_addr_din_horizontal_htree = property(_cacti.results_mem_array_delay_addr_din_horizontal_htree_get, _cacti.results_mem_array_delay_addr_din_horizontal_htree_set)
+    delay_addr_din_vertical_htree = property(_cacti.results_mem_array_delay_addr_din_vertical_htree_get, _cacti.results_mem_array_delay_addr_din_vertical_htree_set)
+    delay_row_predecode_driver_and_block = property(_cacti.results_mem_array_delay_row_predecode_driver_and_block_get, _cacti.results_mem_array_delay_row_predecode_driver_and_block_set)
+    delay_row_decoder = property(_cacti.results_mem_array_delay_row_decoder_get, _cacti.results_mem_array_delay_row_decoder_set)
+    delay_bitlines = property(_cacti.results_mem_array_delay_bitlines_get, _cacti.results_mem_array_delay_bitlines_set)
+    delay_sense_amp = property(_cacti.results_mem_array_delay_sense_amp_get, _cacti.results_mem_array_delay_sense_amp_set)
+    delay_subarray_output_driver = property(_cacti.results_mem_array_delay_subarray_output_driver_get, _cacti.results_mem_array_delay_subarray_output_driver_set)
+    delay_bit_mux_predecode_driver_and_block = property(_cacti.results_mem_array_delay_bit_mux_predecode_driver_and_block_get, _cacti.results_mem_array_delay_bit_mux_predecode_driver_and_block_set)
+    delay_bit_mux_decoder = property(_cacti.results_mem_array_delay_bit_mux_decoder_get, _cacti.results_mem_array_delay_bit_mux_decoder_set)
+    delay_senseamp_mux_lev_1_predecode_driver_and_block = property(_cacti.results_mem_array_delay_senseamp_mux_lev_1_predecode_driver_and_block_get, _cacti.results_mem_array_delay_senseamp_mux_lev_1_predecode_driver_and_block_set)
+    delay_senseamp_mux_lev_1_decoder = property(_cacti.results_mem_array_delay_senseamp_mux_lev_1_decoder_get, _cacti.results_mem_array_delay_senseamp_mux_lev_1_decoder_set)
+    delay_senseamp_mux_lev_2_predecode_driver_and_block = property(_cacti.results_mem_array_delay_senseamp_mux_lev_2_predecode_driver_and_block_get, _cacti.results_mem_array_delay_senseamp_mux_lev_2_predecode_driver_and_block_set)
+    delay_senseamp_mux_lev_2_decoder = property(_cacti.results_mem_array_delay_senseamp_mux_lev_2_decoder_get, _cacti.results_mem_array_delay_senseamp_mux_lev_2_decoder_set)
+    delay_input_htree = property(_cacti.results_mem_array_delay_input_htree_get, _cacti.results_mem_array_delay_input_htree_set)
+    delay_output_htree = property(_cacti.results_mem_array_delay_output_htree_get, _cacti.results_mem_array_delay_output_htree_set)
+    delay_dout_vertical_htree = property(_cacti.results_mem_array_delay_dout_vertical_htree_get, _cacti.results_mem_array_delay_dout_vertical_htree_set)
+    delay_dout_horizontal_htree = property(_cacti.results_mem_array_delay_dout_horizontal_htree_get, _cacti.results_mem_array_delay_dout_horizontal_htree_set)
+    delay_comparator = property(_cacti.results_mem_array_delay_comparator_get, _cacti.results_mem_array_delay_comparator_set)
+    access_time = property(_cacti.results_mem_array_access_time_get, _cacti.results_mem_array_access_time_set)
+    cycle_time = property(_cacti.results_mem_array_cycle_time_get, _cacti.results_mem_array_cycle_time_set)
+    multisubbank_interleave_cycle_time = property(_cacti.results_mem_array_multisubbank_interleave_cycle_time_get, _cacti.results_mem_array_multisubbank_interleave_cycle_time_set)
+    delay_request_network = property(_cacti.results_mem_array_delay_request_network_get, _cacti.results_mem_array_delay_request_network_set)
+    delay_inside_mat = property(_cacti.results_mem_array_delay_inside_mat_get, _cacti.results_mem_array_delay_inside_mat_set)
+    delay_reply_network = property(_cacti.results_mem_array_delay_reply_network_get, _cacti.results_mem_array_delay_reply_network_set)
+    trcd = property(_cacti.results_mem_array_trcd_get, _cacti.results_mem_array_trcd_set)
+    cas_latency = property(_cacti.results_mem_array_cas_latency_get, _cacti.results_mem_array_cas_latency_set)
+    precharge_delay = property(_cacti.results_mem_array_precharge_delay_get, _cacti.results_mem_array_precharge_delay_set)
+    power_routing_to_bank = property(_cacti.results_mem_array_power_routing_to_bank_get, _cacti.results_mem_array_power_routing_to_bank_set)
+    power_addr_input_htree = property(_cacti.results_mem_array_power_addr_input_htree_get, _cacti.results_mem_array_power_addr_input_htree_set)
+    power_data_input_htree = property(_cacti.results_mem_array_power_data_input_htree_get, _cacti.results_mem_array_power_data_input_htree_set)
+    power_data_output_htree = property(_cacti.results_mem_array_power_data_output_htree_get, _cacti.results_mem_array_power_data_output_htree_set)
+    power_addr_horizontal_htree = property(_cacti.results_mem_array_power_addr_horizontal_htree_get, _cacti.results_mem_array_power_addr_horizontal_htree_set)
+    power_datain_horizontal_htree = property(_cacti.results_mem_array_power_datain_horizontal_htree_get, _cacti.results_mem_array_power_datain_horizontal_htree_set)
+    power_dataout_horizontal_htree = property(_cacti.results_mem_array_power_dataout_horizontal_htree_get, _cacti.results_mem_array_power_dataout_horizontal_htree_set)
+    power_addr_vertical_htree = property(_cacti.results_mem_array_power_addr_vertical_htree_get, _cacti.results_mem_array_power_addr_vertical_htree_set)
+    power_datain_vertical_htree = property(_cacti.results_mem_array_power_datain_vertical_htree_get, _cacti.results_mem_array_power_datain_vertical_htree_set)
+    power_row_predecoder_drivers = property(_cacti.results_mem_array_power_row_predecoder_drivers_get, _cacti.results_mem_array_power_row_predecoder_drivers_set)
+    power_row_predecoder_blocks = property(_cacti.results_mem_array_power_row_predecoder_blocks_get, _cacti.results_mem_array_power_row_predecoder_blocks_set)
+    power_row_decoders = property(_cacti.results_mem_array_power_row_decoders_get, _cacti.results_mem_array_power_row_decoders_set)
+    power_bit_mux_predecoder_drivers = property(_cacti.results_mem_array_power_bit_mux_predecoder_drivers_get, _cacti.results_mem_array_power_bit_mux_predecoder_drivers_set)
+    power_bit_mux_predecoder_blocks = property(_cacti.results_mem_array_power_bit_mux_predecoder_blocks_get, _cacti.results_mem_array_power_bit_mux_predecoder_blocks_set)
+    power_bit_mux_decoders = property(_cacti.results_mem_array_power_bit_mux_decoders_get, _cacti.results_mem_array_power_bit_mux_decoders_set)
+    power_senseamp_mux_lev_1_predecoder_drivers = property(_cacti.results_mem_array_power_senseamp_mux_lev_1_predecoder_drivers_get, _cacti.results_mem_array_power_senseamp_mux_lev_1_predecoder_drivers_set)
+    power_senseamp_mux_lev_1_predecoder_blocks = property(_cacti.results_mem_array_power_senseamp_mux_lev_1_predecoder_blocks_get, _cacti.results_mem_array_power_senseamp_mux_lev_1_predecoder_blocks_set)
+    power_senseamp_mux_lev_1_decoders = property(_cacti.results_mem_array_power_senseamp_mux_lev_1_decoders_get, _cacti.results_mem_array_power_senseamp_mux_lev_1_decoders_set)
+    power_senseamp_mux_lev_2_predecoder_drivers = property(_cacti.results_mem_array_power_senseamp_mux_lev_2_predecoder_drivers_get, _cacti.results_mem_array_power_senseamp_mux_lev_2_predecoder_drivers_set)
+    power_senseamp_mux_lev_2_predecoder_blocks = property(_cacti.results_mem_array_power_senseamp_mux_lev_2_predecoder_blocks_get, _cacti.results_mem_array_power_senseamp_mux_lev_2_predecoder_blocks_set)
+    power_senseamp_mux_lev_2_decoders = property(_cacti.results_mem_array_power_senseamp_mux_lev_2_decoders_get, _cacti.results_mem_array_power_senseamp_mux_lev_2_decoders_set)
+    power_bitlines = property(_cacti.results_mem_array_power_bitlines_get, _cacti.results_mem_array_power_bitlines_set)
+    power_sense_amps = property(_cacti.results_mem_array_power_sense_amps_get, _cacti.results_mem_array_power_sense_amps_set)
+    power_prechg_eq_drivers = property(_cacti.results_mem_array_power_prechg_eq_drivers_get, _cacti.results_mem_array_power_prechg_eq_drivers_set)
+    power_output_drivers_at_subarray = property(_cacti.results_mem_array_power_output_drivers_at_subarray_get, _cacti.results_mem_array_power_output_drivers_at_subarray_set)
+    power_dataout_vertical_htree = property(_cacti.results_mem_array_power_dataout_vertical_htree_get, _cacti.results_mem_array_power_dataout_vertical_htree_set)
+    power_comparators = property(_cacti.results_mem_array_power_comparators_get, _cacti.results_mem_array_power_comparators_set)
+    power_crossbar = property(_cacti.results_mem_array_power_crossbar_get, _cacti.results_mem_array_power_crossbar_set)
+    total_power = property(_cacti.results_mem_array_total_power_get, _cacti.results_mem_array_total_power_set)
+    area = property(_cacti.results_mem_array_area_get, _cacti.results_mem_array_area_set)
+    all_banks_height = property(_cacti.results_mem_array_all_banks_height_get, _cacti.results_mem_array_all_banks_height_set)
+    all_banks_width = property(_cacti.results_mem_array_all_banks_width_get, _cacti.results_mem_array_all_banks_width_set)
+    bank_height = property(_cacti.results_mem_array_bank_height_get, _cacti.results_mem_array_bank_height_set)
+    bank_width = property(_cacti.results_mem_array_bank_width_get, _cacti.results_mem_array_bank_width_set)
+    subarray_memory_cell_area_height = property(_cacti.results_mem_array_subarray_memory_cell_area_height_get, _cacti.results_mem_array_subarray_memory_cell_area_height_set)
+    subarray_memory_cell_area_width = property(_cacti.results_mem_array_subarray_memory_cell_area_width_get, _cacti.results_mem_array_subarray_memory_cell_area_width_set)
+    mat_height = property(_cacti.results_mem_array_mat_height_get, _cacti.results_mem_array_mat_height_set)
+    mat_width = property(_cacti.results_mem_array_mat_width_get, _cacti.results_mem_array_mat_width_set)
+    routing_area_height_within_bank = property(_cacti.results_mem_array_routing_area_height_within_bank_get, _cacti.results_mem_array_routing_area_height_within_bank_set)
+    routing_area_width_within_bank = property(_cacti.results_mem_array_routing_area_width_within_bank_get, _cacti.results_mem_array_routing_area_width_within_bank_set)
+    area_efficiency = property(_cacti.results_mem_array_area_efficiency_get, _cacti.results_mem_array_area_efficiency_set)
+    refresh_power = property(_cacti.results_mem_array_refresh_power_get, _cacti.results_mem_array_refresh_power_set)
+    dram_refresh_period = property(_cacti.results_mem_array_dram_refresh_period_get, _cacti.results_mem_array_dram_refresh_period_set)
+    dram_array_availability = property(_cacti.results_mem_array_dram_array_availability_get, _cacti.results_mem_array_dram_array_availability_set)
+    dyn_read_energy_from_closed_page = property(_cacti.results_mem_array_dyn_read_energy_from_closed_page_get, _cacti.results_mem_array_dyn_read_energy_from_closed_page_set)
+    dyn_read_energy_from_open_page = property(_cacti.results_mem_array_dyn_read_energy_from_open_page_get, _cacti.results_mem_array_dyn_read_energy_from_open_page_set)
+    leak_power_subbank_closed_page = property(_cacti.results_mem_array_leak_power_subbank_closed_page_get, _cacti.results_mem_array_leak_power_subbank_closed_page_set)
+    leak_power_subbank_open_page = property(_cacti.results_mem_array_leak_power_subbank_open_page_get, _cacti.results_mem_array_leak_power_subbank_open_page_set)
+    leak_power_request_and_reply_networks = property(_cacti.results_mem_array_leak_power_request_and_reply_networks_get, _cacti.results_mem_array_leak_power_request_and_reply_networks_set)
+    activate_energy = property(_cacti.results_mem_array_activate_energy_get, _cacti.results_mem_array_activate_energy_set)
+    read_energy = property(_cacti.results_mem_array_read_energy_get, _cacti.results_mem_array_read_energy_set)
+    write_energy = property(_cacti.results_mem_array_write_energy_get, _cacti.results_mem_array_write_energy_set)
+    precharge_energy = property(_cacti.results_mem_array_precharge_energy_get, _cacti.results_mem_array_precharge_energy_set)
+
+    def __init__(self):
+        _cacti.results_mem_array_swiginit(self, _cacti.new_results_mem_array())
+    __swig_destroy__ = _cacti.delete_results_mem_array
+
+# Register results_mem_array in _cacti:
+_cacti.results_mem_array_swigregister(results_mem_array)
+class uca_org_t(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    tag_array2 = property(_cacti.uca_org_t_tag_array2_get, _cacti.uca_org_t_tag_array2_set)
+    data_array2 = property(_cacti.uca_org_t_data_array2_get, _cacti.uca_org_t_data_array2_set)
+    access_time = property(_cacti.uca_org_t_access_time_get, _cacti.uca_org_t_access_time_set)
+    cycle_time = property(_cacti.uca_org_t_cycle_time_get, _cacti.uca_org_t_cycle_time_set)
+    area = property(_cacti.uca_org_t_area_get, _cacti.uca_org_t_area_set)
+    area_efficiency = property(_cacti.uca_org_t_area_efficiency_get, _cacti.uca_org_t_area_efficiency_set)
+    power = property(_cacti.uca_org_t_power_get, _cacti.uca_org_t_power_set)
+    leak_power_with_sleep_transistors_in_mats = property(_cacti.uca_org_t_leak_power_with_sleep_transistors_in_mats_get, _cacti.uca_org_t_leak_power_with_sleep_transistors_in_mats_set)
+    cache_ht = property(_cacti.uca_org_t_cache_ht_get, _cacti.uca_org_t_cache_ht_set)
+    cache_len = property(_cacti.uca_org_t_cache_len_get, _cacti.uca_org_t_cache_len_set)
+    file_n = property(_cacti.uca_org_t_file_n_get, _cacti.uca_org_t_file_n_set)
+    vdd_periph_global = property(_cacti.uca_org_t_vdd_periph_global_get, _cacti.uca_org_t_vdd_periph_global_set)
+    valid = property(_cacti.uca_org_t_valid_get, _cacti.uca_org_t_valid_set)
+    tag_array = property(_cacti.uca_org_t_tag_array_get, _cacti.uca_org_t_tag_array_set)
+    data_array = property(_cacti.uca_org_t_data_array_get, _cacti.uca_org_t_data_array_set)
+    uca_q = property(_cacti.uca_org_t_uca_q_get, _cacti.uca_org_t_uca_q_set)
+    uca_pg_reference = property(_cacti.uca_org_t_uca_pg_reference_get, _cacti.uca_org_t_uca_pg_reference_set)
+
+    def __init__(self):
+        _cacti.uca_org_t_swiginit(self, _cacti.new_uca_org_t())
+
+    def find_delay(self):
+        return _cacti.uca_org_t_find_delay(self)
+
+    def find_energy(self):
+        return _cacti.uca_org_t_find_energy(self)
+
+    def find_area(self):
+        return _cacti.uca_org_t_find_area(self)
+
+    def find_cyc(self):
+        return _cacti.uca_org_t_find_cyc(self)
+
+    def adjust_area(self):
+        return _cacti.uca_org_t_adjust_area(self)
+
+    def cleanup(self):
+        return _cacti.uca_org_t_cleanup(self)
+    __swig_destroy__ = _cacti.delete_uca_org_t
+
+# Register uca_org_t in _cacti:
+_cacti.uca_org_t_swigregister(uca_org_t)
+
+def reconfigure(local_interface, fin_res):
+    return _cacti.reconfigure(local_interface, fin_res)
+
+def init_interface(local_interface):
+    return _cacti.init_interface(local_interface)
+
+def cacti_interface(*args):
+    return _cacti.cacti_interface(*args)
+class mem_array(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    Ndcm = property(_cacti.mem_array_Ndcm_get, _cacti.mem_array_Ndcm_set)
+    Ndwl = property(_cacti.mem_array_Ndwl_get, _cacti.mem_array_Ndwl_set)
+    Ndbl = property(_cacti.mem_array_Ndbl_get, _cacti.mem_array_Ndbl_set)
+    Nspd = property(_cacti.mem_array_Nspd_get, _cacti.mem_array_Nspd_set)
+    deg_bl_muxing = property(_cacti.mem_array_deg_bl_muxing_get, _cacti.mem_array_deg_bl_muxing_set)
+    Ndsam_lev_1 = property(_cacti.mem_array_Ndsam_lev_1_get, _cacti.mem_array_Ndsam_lev_1_set)
+    Ndsam_lev_2 = property(_cacti.mem_array_Ndsam_lev_2_get, _cacti.mem_array_Ndsam_lev_2_set)
+    access_time = property(_cacti.mem_array_access_time_get, _cacti.mem_array_access_time_set)
+    cycle_time = property(_cacti.mem_array_cycle_time_get, _cacti.mem_array_cycle_time_set)
+    multisubbank_interleave_cycle_time = property(_cacti.mem_array_multisubbank_interleave_cycle_time_get, _cacti.mem_array_multisubbank_interleave_cycle_time_set)
+    area_ram_cells = property(_cacti.mem_array_area_ram_cells_get, _cacti.mem_array_area_ram_cells_set)
+    area = property(_cacti.mem_array_area_get, _cacti.mem_array_area_set)
+    power = property(_cacti.mem_array_power_get, _cacti.mem_array_power_set)
+    delay_senseamp_mux_decoder = property(_cacti.mem_array_delay_senseamp_mux_decoder_get, _cacti.mem_array_delay_senseamp_mux_decoder_set)
+    delay_before_subarray_output_driver = property(_cacti.mem_array_delay_before_subarray_output_driver_get, _cacti.mem_array_delay_before_subarray_output_driver_set)
+    delay_from_subarray_output_driver_to_output = property(_cacti.mem_array_delay_from_subarray_output_driver_to_output_get, _cacti.mem_array_delay_from_subarray_output_driver_to_output_set)
+    height = property(_cacti.mem_array_height_get, _cacti.mem_array_height_set)
+    width = property(_cacti.mem_array_width_get, _cacti.mem_array_width_set)
+    mat_height = property(_cacti.mem_array_mat_height_get, _cacti.mem_array_mat_height_set)
+    mat_length = property(_cacti.mem_array_mat_length_get, _cacti.mem_array_mat_length_set)
+    subarray_length = property(_cacti.mem_array_subarray_length_get, _cacti.mem_array_subarray_length_set)
+    subarray_height = property(_cacti.mem_array_subarray_height_get, _cacti.mem_array_subarray_height_set)
+    delay_route_to_bank = property(_cacti.mem_array_delay_route_to_bank_get, _cacti.mem_array_delay_route_to_bank_set)
+    delay_input_htree = property(_cacti.mem_array_delay_input_htree_get, _cacti.mem_array_delay_input_htree_set)
+    delay_row_predecode_driver_and_block = property(_cacti.mem_array_delay_row_predecode_driver_and_block_get, _cacti.mem_array_delay_row_predecode_driver_and_block_set)
+    delay_row_decoder = property(_cacti.mem_array_delay_row_decoder_get, _cacti.mem_array_delay_row_decoder_set)
+    delay_bitlines = property(_cacti.mem_array_delay_bitlines_get, _cacti.mem_array_delay_bitlines_set)
+    delay_sense_amp = property(_cacti.mem_array_delay_sense_amp_get, _cacti.mem_array_delay_sense_amp_set)
+    delay_subarray_output_driver = property(_cacti.mem_array_delay_subarray_output_driver_get, _cacti.mem_array_delay_subarray_output_driver_set)
+    delay_dout_htree = property(_cacti.mem_array_delay_dout_htree_get, _cacti.mem_array_delay_dout_htree_set)
+    delay_comparator = property(_cacti.mem_array_delay_comparator_get, _cacti.mem_array_delay_comparator_set)
+    delay_matchlines = property(_cacti.mem_array_delay_matchlines_get, _cacti.mem_array_delay_matchlines_set)
+    all_banks_height = property(_cacti.mem_array_all_banks_height_get, _cacti.mem_array_all_banks_height_set)
+    all_banks_width = property(_cacti.mem_array_all_banks_width_get, _cacti.mem_array_all_banks_width_set)
+    area_efficiency = property(_cacti.mem_array_area_efficiency_get, _cacti.mem_array_area_efficiency_set)
+    power_routing_to_bank = property(_cacti.mem_array_power_routing_to_bank_get, _cacti.mem_array_power_routing_to_bank_set)
+    power_addr_input_htree = property(_cacti.mem_array_power_addr_input_htree_get, _cacti.mem_array_power_addr_input_htree_set)
+    power_data_input_htree = property(_cacti.mem_array_power_data_input_htree_get, _cacti.mem_array_power_data_input_htree_set)
+    power_data_output_htree = property(_cacti.mem_array_power_data_output_htree_get, _cacti.mem_array_power_data_output_htree_set)
+    power_htree_in_search = property(_cacti.mem_array_power_htree_in_search_get, _cacti.mem_array_power_htree_in_search_set)
+    power_htree_out_search = property(_cacti.mem_array_power_htree_out_search_get, _cacti.mem_array_power_htree_out_search_set)
+    power_row_predecoder_drivers = property(_cacti.mem_array_power_row_predecoder_drivers_get, _cacti.mem_array_power_row_predecoder_drivers_set)
+    power_row_predecoder_blocks = property(_cacti.mem_array_power_row_predecoder_blocks_get, _cacti.mem_array_power_row_predecoder_blocks_set)
+    power_row_decoders = property(_cacti.mem_array_power_row_decoders_get, _cacti.mem_array_power_row_decoders_set)
+    power_bit_mux_predecoder_drivers = property(_cacti.mem_array_power_bit_mux_predecoder_drivers_get, _cacti.mem_array_power_bit_mux_predecoder_drivers_set)
+    power_bit_mux_predecoder_blocks = property(_cacti.mem_array_power_bit_mux_predecoder_blocks_get, _cacti.mem_array_power_bit_mux_predecoder_blocks_set)
+    power_bit_mux_decoders = property(_cacti.mem_array_power_bit_mux_decoders_get, _cacti.mem_array_power_bit_mux_decoders_set)
+    power_senseamp_mux_lev_1_predecoder_drivers = property(_cacti.mem_array_power_senseamp_mux_lev_1_predecoder_drivers_get, _cacti.mem_array_power_senseamp_mux_lev_1_predecoder_drivers_set)
+    power_senseamp_mux_lev_1_predecoder_blocks = property(_cacti.mem_array_power_senseamp_mux_lev_1_predecoder_blocks_get, _cacti.mem_array_power_senseamp_mux_lev_1_predecoder_blocks_set)
+    power_senseamp_mux_lev_1_decoders = property(_cacti.mem_array_power_senseamp_mux_lev_1_decoders_get, _cacti.mem_array_power_senseamp_mux_lev_1_decoders_set)
+    power_senseamp_mux_lev_2_predecoder_drivers = property(_cacti.mem_array_power_senseamp_mux_lev_2_predecoder_drivers_get, _cacti.mem_array_power_senseamp_mux_lev_2_predecoder_drivers_set)
+    power_senseamp_mux_lev_2_predecoder_blocks = property(_cacti.mem_array_power_senseamp_mux_lev_2_predecoder_blocks_get, _cacti.mem_array_power_senseamp_mux_lev_2_predecoder_blocks_set)
+    power_senseamp_mux_lev_2_decoders = property(_cacti.mem_array_power_senseamp_mux_lev_2_decoders_get, _cacti.mem_array_power_senseamp_mux_lev_2_decoders_set)
+    power_bitlines = property(_cacti.mem_array_power_bitlines_get, _cacti.mem_array_power_bitlines_set)
+    power_sense_amps = property(_cacti.mem_array_power_sense_amps_get, _cacti.mem_array_power_sense_amps_set)
+    power_prechg_eq_drivers = property(_cacti.mem_array_power_prechg_eq_drivers_get, _cacti.mem_array_power_prechg_eq_drivers_set)
+    power_output_drivers_at_subarray = property(_cacti.mem_array_power_output_drivers_at_subarray_get, _cacti.mem_array_power_output_drivers_at_subarray_set)
+    power_dataout_vertical_htree = property(_cacti.mem_array_power_dataout_vertical_htree_get, _cacti.mem_array_power_dataout_vertical_htree_set)
+    power_comparators = property(_cacti.mem_array_power_comparators_get, _cacti.mem_array_power_comparators_set)
+    power_cam_bitline_precharge_eq_drv = property(_cacti.mem_array_power_cam_bitline_precharge_eq_drv_get, _cacti.mem_array_power_cam_bitline_precharge_eq_drv_set)
+    power_searchline = property(_cacti.mem_array_power_searchline_get, _cacti.mem_array_power_searchline_set)
+    power_searchline_precharge = property(_cacti.mem_array_power_searchline_precharge_get, _cacti.mem_array_power_searchline_precharge_set)
+    power_matchlines = property(_cacti.mem_array_power_matchlines_get, _cacti.mem_array_power_matchlines_set)
+    power_matchline_precharge = property(_cacti.mem_array_power_matchline_precharge_get, _cacti.mem_array_power_matchline_precharge_set)
+    power_matchline_to_wordline_drv = property(_cacti.mem_array_power_matchline_to_wordline_drv_get, _cacti.mem_array_power_matchline_to_wordline_drv_set)
+    arr_min = property(_cacti.mem_array_arr_min_get, _cacti.mem_array_arr_min_set)
+    wt = property(_cacti.mem_array_wt_get, _cacti.mem_array_wt_set)
+    activate_energy = property(_cacti.mem_array_activate_energy_get, _cacti.mem_array_activate_energy_set)
+    read_energy = property(_cacti.mem_array_read_energy_get, _cacti.mem_array_read_energy_set)
+    write_energy = property(_cacti.mem_array_write_energy_get, _cacti.mem_array_write_energy_set)
+    precharge_energy = property(_cacti.mem_array_precharge_energy_get, _cacti.mem_array_precharge_energy_set)
+    refresh_power = property(_cacti.mem_array_refresh_power_get, _cacti.mem_array_refresh_power_set)
+    leak_power_subbank_closed_page = property(_cacti.mem_array_leak_power_subbank_closed_page_get, _cacti.mem_array_leak_power_subbank_closed_page_set)
+    leak_power_subbank_open_page = property(_cacti.mem_array_leak_power_subbank_open_page_get, _cacti.mem_array_leak_power_subbank_open_page_set)
+    leak_power_request_and_reply_networks = property(_cacti.mem_array_leak_power_request_and_reply_networks_get, _cacti.mem_array_leak_power_request_and_reply_networks_set)
+    precharge_delay = property(_cacti.mem_array_precharge_delay_get, _cacti.mem_array_precharge_delay_set)
+    array_leakage = property(_cacti.mem_array_array_leakage_get, _cacti.mem_array_array_leakage_set)
+    wl_leakage = property(_cacti.mem_array_wl_leakage_get, _cacti.mem_array_wl_leakage_set)
+    cl_leakage = property(_cacti.mem_array_cl_leakage_get, _cacti.mem_array_cl_leakage_set)
+    sram_sleep_tx_width = property(_cacti.mem_array_sram_sleep_tx_width_get, _cacti.mem_array_sram_sleep_tx_width_set)
+    wl_sleep_tx_width = property(_cacti.mem_array_wl_sleep_tx_width_get, _cacti.mem_array_wl_sleep_tx_width_set)
+    cl_sleep_tx_width = property(_cacti.mem_array_cl_sleep_tx_width_get, _cacti.mem_array_cl_sleep_tx_width_set)
+    sram_sleep_tx_area = property(_cacti.mem_array_sram_sleep_tx_area_get, _cacti.mem_array_sram_sleep_tx_area_set)
+    wl_sleep_tx_area = property(_cacti.mem_array_wl_sleep_tx_area_get, _cacti.mem_array_wl_sleep_tx_area_set)
+    cl_sleep_tx_area = property(_cacti.mem_array_cl_sleep_tx_area_get, _cacti.mem_array_cl_sleep_tx_area_set)
+    sram_sleep_wakeup_latency = property(_cacti.mem_array_sram_sleep_wakeup_latency_get, _cacti.mem_array_sram_sleep_wakeup_latency_set)
+    wl_sleep_wakeup_latency = property(_cacti.mem_array_wl_sleep_wakeup_latency_get, _cacti.mem_array_wl_sleep_wakeup_latency_set)
+    cl_sleep_wakeup_latency = property(_cacti.mem_array_cl_sleep_wakeup_latency_get, _cacti.mem_array_cl_sleep_wakeup_latency_set)
+    bl_floating_wakeup_latency = property(_cacti.mem_array_bl_floating_wakeup_latency_get, _cacti.mem_array_bl_floating_wakeup_latency_set)
+    sram_sleep_wakeup_energy = property(_cacti.mem_array_sram_sleep_wakeup_energy_get, _cacti.mem_array_sram_sleep_wakeup_energy_set)
+    wl_sleep_wakeup_energy = property(_cacti.mem_array_wl_sleep_wakeup_energy_get, _cacti.mem_array_wl_sleep_wakeup_energy_set)
+    cl_sleep_wakeup_energy = property(_cacti.mem_array_cl_sleep_wakeup_energy_get, _cacti.mem_array_cl_sleep_wakeup_energy_set)
+    bl_floating_wakeup_energy = property(_cacti.mem_array_bl_floating_wakeup_energy_get, _cacti.mem_array_bl_floating_wakeup_energy_set)
+    num_active_mats = property(_cacti.mem_array_num_active_mats_get, _cacti.mem_array_num_active_mats_set)
+    num_submarray_mats = property(_cacti.mem_array_num_submarray_mats_get, _cacti.mem_array_num_submarray_mats_set)
+    long_channel_leakage_reduction_periperal = property(_cacti.mem_array_long_channel_leakage_reduction_periperal_get, _cacti.mem_array_long_channel_leakage_reduction_periperal_set)
+    long_channel_leakage_reduction_memcell = property(_cacti.mem_array_long_channel_leakage_reduction_memcell_get, _cacti.mem_array_long_channel_leakage_reduction_memcell_set)
+
+    @staticmethod
+    def lt(m1, m2):
+        return _cacti.mem_array_lt(m1, m2)
+
+    def __init__(self):
+        _cacti.mem_array_swiginit(self, _cacti.new_mem_array())
+    __swig_destroy__ = _cacti.delete_mem_array
+
+# Register mem_array in _cacti:
+_cacti.mem_array_swigregister(mem_array)
+
+def output_data_csv(fin_res):
+    return _cacti.output_data_csv(fin_res)
+
+def output_UCA(fin_res):
+    return _cacti.output_UCA(fin_res)
+
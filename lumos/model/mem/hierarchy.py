@@ -0,0 +1,341 @@
+#!/usr/bin/env python
+"""
+A multi-level cache hierarchy of throughput cores.
+
+A :class:`CacheHierarchy` is a list of :class:`CacheLevel`, from the closest
+to cores (e.g. L1) to the last level before memory. Each level has a size, a
+technology, and a sharing degree, i.e. the number of cores sharing an
+instance of the cache, and its power, area, and latency are taken from
+cache_db (see :func:`~lumos.model.mem.cache.get_cache_trait`).
+
+Miss rates follow a power law of the cache capacity available to a core,
+
+    miss = min(1, miss_nom * (size / (sharers * size_nom)) ** (1 - alpha))
+
+where sharers is the number of active cores sharing the cache, and
+miss_nom, size_nom, and alpha are characteristics of kernels at each level,
+named as miss_<level>, cache_sz_<level>_nom, and alpha_<level> in their
+`core_perf_config`, e.g. miss_l1. A level may give defaults for kernels
+without them. The average memory access time (AMAT) weights the latency of
+each level (and memory) by the fraction of accesses served there.
+
+All methods follow numpy broadcasting rules on cnum and kernel
+characteristics, so that a grid of core counts (e.g. the budget at each
+supply) is evaluated at once.
+"""
+
+import logging
+import numpy as np
+from lumos.settings import LUMOS_DEBUG
+from lumos import BraceMessage as _bm_
+from . import BASELINE_L1_DELAY, BASELINE_L1_SIZE, BASELINE_L1_TECH_NAME
+from . import BASELINE_L1_TECH_VARIANT, BASELINE_L1_TECH_NODE
+from . import BASELINE_L2_DELAY, BASELINE_L2_SIZE, BASELINE_L2_TECH_NAME
+from . import BASELINE_L2_TECH_VARIANT, BASELINE_L2_TECH_NODE
+from .cache import get_cache_trait, CacheError
+
+__logger = None
+
+if LUMOS_DEBUG and ('all' in LUMOS_DEBUG or 'hierarchy' in LUMOS_DEBUG):
+    _debug_enabled = True
+else:
+    _debug_enabled = False
+
+
+def _debug(brace_msg):
+    global __logger
+    if not _debug_enabled:
+        return
+
+    if not __logger:
+        __logger = logging.getLogger('Hierarchy')
+        __logger.setLevel(logging.DEBUG)
+
+    __logger.debug(brace_msg)
+
+
+#: The reference of L1 latency, as (delay in cycles, size, tech_type, tech_node)
+BASELINE_L1 = (BASELINE_L1_DELAY, BASELINE_L1_SIZE,
+               '-'.join((BASELINE_L1_TECH_NAME, BASELINE_L1_TECH_VARIANT)),
+               BASELINE_L1_TECH_NODE)
+
+#: The reference of L2 latency, as (delay in cycles, size, tech_type, tech_node)
+BASELINE_L2 = (BASELINE_L2_DELAY, BASELINE_L2_SIZE,
+               '-'.join((BASELINE_L2_TECH_NAME, BASELINE_L2_TECH_VARIANT)),
+               BASELINE_L2_TECH_NODE)
+
+
+def _get_param(kparams, key):
+    if hasattr(kparams, 'keys'):
+        # arrays of many kernels, which must have all columns
+        try:
+            return kparams[key]
+        except KeyError:
+            raise CacheError('Kernel characteristic {0} is not in {1}'.format(
+                key, sorted(kparams.keys())))
+    # kernel objects
+    return getattr(kparams, key, None)
+
+
+class CacheLevel(object):
+    """A level of caches.
+
+    Parameters
+    ----------
+    name : str
+      The name of the level, e.g. 'l1', which names kernel characteristics
+      of the level, e.g. miss_l1.
+    size : int
+      The size of a cache instance in bytes.
+    tech_type : str
+      The technology in cache_db, e.g. 'cmos-hp', or 'sttram-sttram'.
+    tech_node : int
+      The technology node in nm.
+    sharing : int
+      The number of cores sharing a cache instance, 1 for private caches,
+      and None for a single cache shared by all cores.
+    delay : int
+      The access latency in cycles at the nominal supply. By default, it is
+      scaled from baseline by the latency in cache_db.
+    baseline : tuple
+      The reference latency, as (delay, size, tech_type, tech_node), e.g.
+      :data:`BASELINE_L1` or :data:`BASELINE_L2`.
+    line_sz, assoc, nbanks : int
+      The cache configuration in cache_db.
+    miss, alpha, size_nom : float
+      The defaults of kernel characteristics at this level, for kernels
+      without them.
+
+    Attributes
+    ----------
+    traits : dict
+      The power (W), area (mm^2), and latency (ns) of a cache instance.
+    delay : int
+      The access latency in cycles at the nominal supply.
+    """
+    def __init__(self, name, size, tech_type='cmos-hp', tech_node=22,
+                 sharing=1, delay=None, baseline=BASELINE_L2, line_sz=64,
+                 assoc=2, nbanks=1, miss=None, alpha=None, size_nom=None):
+        if sharing is not None and sharing < 1:
+            raise CacheError('Sharing degree of {0} should be at least 1, '
+                             'but given {1}'.format(name, sharing))
+        self.name = name
+        self.size = size
+        self.tech_type = tech_type
+        self.tech_node = tech_node
+        self.sharing = sharing
+        self.traits = get_cache_trait(size, tech_type, tech_node, line_sz,
+                                      assoc, nbanks)
+        if delay is None:
+            base_delay, base_size, base_tech_type, base_node = baseline
+            base_traits = get_cache_trait(base_size, base_tech_type, base_node)
+            scale_factor = self.traits['latency'] / base_traits['latency']
+            delay = int(base_delay * scale_factor)
+        self.delay = delay
+        self._params = (('miss', 'miss_' + name, miss),
+                        ('alpha', 'alpha_' + name, alpha),
+                        ('size_nom', 'cache_sz_{0}_nom'.format(name), size_nom))
+        _debug(_bm_('{0}: {1} bytes of {2}, delay: {3}', name, size, tech_type, delay))
+
+    @property
+    def kernel_params(self):
+        """The names of kernel characteristics at this level"""
+        return tuple(key for _, key, _ in self._params)
+
+    def _kernel_param(self, kparams, idx):
+        name, key, default = self._params[idx]
+        val = _get_param(kparams, key)
+        if val is None:
+            if default is None:
+                raise CacheError('Kernel characteristic {0} is required by {1}'.format(
+                    key, self.name))
+            return default
+        if isinstance(val, np.ndarray):
+            # NaN for kernels without the characteristic
+            missing = np.isnan(val)
+            if missing.any():
+                if default is None:
+                    raise CacheError('Kernel characteristic {0} is required by {1}'.format(
+                        key, self.name))
+                val = np.where(missing, default, val)
+        return val
+
+    def instances(self, cnum):
+        """The number of cache instances for cnum active cores"""
+        if self.sharing is None:
+            return np.ones_like(cnum)
+        if self.sharing == 1:
+            return cnum
+        return -(-np.asarray(cnum) // self.sharing)
+
+    def sharers(self, cnum):
+        """The number of active cores sharing a cache instance"""
+        if self.sharing is None:
+            return cnum
+        return np.minimum(cnum, self.sharing)
+
+    def miss_rate(self, kparams, cnum):
+        """The local miss rate of kernels with cnum active cores
+
+        Parameters
+        ----------
+        kparams : dict or kernel object
+          Kernel characteristics, as arrays in a dict (e.g. columns of a
+          :class:`~lumos.model.workload.packed.PackedSuite`), or attributes
+          of a kernel. Defaults of the level only apply to kernels without
+          a characteristic, i.e. a missing attribute or NaN in arrays, and
+          arrays must have all of :attr:`kernel_params`.
+        cnum : int or array of int
+          The number of active cores.
+        """
+        miss = self._kernel_param(kparams, 0)
+        alpha = self._kernel_param(kparams, 1)
+        size_nom = self._kernel_param(kparams, 2)
+        if self.sharing == 1:
+            ratio = self.size / size_nom
+        else:
+            ratio = self.size / (self.sharers(cnum) * size_nom)
+        return np.minimum(1, miss * (ratio ** (1 - alpha)))
+
+
+class CacheHierarchy(object):
+    """Levels of caches between cores and memory.
+
+    Parameters
+    ----------
+    levels : list of :class:`CacheLevel`
+      From the closest to cores.
+    delay_mem : int
+      The latency of memory in cycles at the nominal supply.
+    """
+    def __init__(self, levels, delay_mem):
+        self.levels = list(levels)
+        if not self.levels:
+            raise CacheError('A cache hierarchy needs at least one level')
+        names = [level.name for level in self.levels]
+        if len(set(names)) != len(names):
+            raise CacheError('Duplicated cache levels in {0}'.format(names))
+        self.delay_mem = delay_mem
+
+    def __len__(self):
+        return len(self.levels)
+
+    def __iter__(self):
+        return iter(self.levels)
+
+    @property
+    def kernel_params(self):
+        """The names of kernel characteristics of all levels"""
+        return tuple(key for level in self.levels for key in level.kernel_params)
+
+    def _traits(self, name, cnum):
+        cnum = np.asarray(cnum)
+        return np.array([level.instances(cnum) * level.traits[name]
+                         for level in self.levels], dtype=np.float64)
+
+    def power(self, cnum):
+        """Power of each level with cnum active cores
+
+        Returns
+        -------
+        array
+          In W, of the shape (nlevels, ) + shape of cnum.
+        """
+        return self._traits('power', cnum)
+
+    def area(self, cnum):
+        """Area of each level with cnum cores, see :meth:`power`"""
+        return self._traits('area', cnum)
+
+    def max_cores(self, power, area, core_power, core_area):
+        """The number of cores allowed by budgets, with their caches
+
+        Parameters
+        ----------
+        power, area : float or array
+          The budgets of power (W) and area (mm^2).
+        core_power : float or array
+          Power of a core, e.g. at each supply.
+        core_area : float
+          Area of a core.
+
+        Returns
+        -------
+        int or array of int
+          In the shape of broadcast arguments.
+        """
+        # private caches come with cores, and shared caches are paid once
+        fixed_power, fixed_area = 0, 0
+        per_power, per_area = core_power, core_area
+        partial = []
+        for level in self.levels:
+            if level.sharing is None:
+                fixed_power += level.traits['power']
+                fixed_area += level.traits['area']
+            elif level.sharing == 1:
+                per_power = per_power + level.traits['power']
+                per_area = per_area + level.traits['area']
+            else:
+                per_power = per_power + level.traits['power'] / level.sharing
+                per_area = per_area + level.traits['area'] / level.sharing
+                partial.append(level)
+        cnum = np.minimum((power - fixed_power) / per_power,
+                          (area - fixed_area) / per_area)
+        scalar = not np.ndim(cnum)
+        cnum = np.asarray(cnum).astype(int)
+
+        if partial:
+            # a partially used instance of a shared cache costs in full, so
+            # the estimate by amortized costs may take a few cores too many
+            while True:
+                over = ((cnum * core_power + self.power(cnum).sum(axis=0) > power) |
+                        (cnum * core_area + self.area(cnum).sum(axis=0) > area))
+                over &= cnum > 0
+                if not over.any():
+                    break
+                cnum = cnum - over
+        return int(cnum) if scalar else cnum
+
+    def miss_rates(self, kparams, cnum):
+        """Local miss rates of each level, see :meth:`CacheLevel.miss_rate`
+
+        Returns
+        -------
+        list
+          of miss rates, one per level.
+        """
+        return [level.miss_rate(kparams, cnum) for level in self.levels]
+
+    def amat(self, kparams, cnum):
+        """The average memory access time of kernels with cnum active cores
+
+        Parameters
+        ----------
+        kparams : dict or kernel object
+          Kernel characteristics, see :meth:`CacheLevel.miss_rate`.
+        cnum : int or array of int
+          The number of active cores.
+
+        Returns
+        -------
+        float or array
+          In cycles at the nominal supply. It scales with the frequency at
+          other supplies, as memory latency is fixed in time.
+        """
+        t0 = 0
+        reach = 1
+        for level in self.levels:
+            miss = level.miss_rate(kparams, cnum)
+            t0 = t0 + reach * (1 - miss) * level.delay
+            reach = reach * miss
+        return t0 + reach * self.delay_mem
+
+
+def baseline_hierarchy(tech, l1_size, l1_tech_type, l2_size, l2_tech_type,
+                       delay_mem):
+    """A private L1 and an L2 shared by all cores, with latencies scaled
+    from :data:`BASELINE_L1` and :data:`BASELINE_L2`"""
+    return CacheHierarchy(
+        [CacheLevel('l1', l1_size, l1_tech_type, tech, sharing=1, baseline=BASELINE_L1),
+         CacheLevel('l2', l2_size, l2_tech_type, tech, sharing=None, baseline=BASELINE_L2)],
+        delay_mem)
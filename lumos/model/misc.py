@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 
+import hashlib
 import os
+from collections import OrderedDict
 from math import fabs
 from os.path import join as joinpath
 
@@ -78,3 +80,98 @@ def approx_equal(a, b, tol=1e-9):
       True if the two numbers are approximately equal, False otherwise.
     """
     return fabs(a-b) <= max(fabs(a), fabs(b)) * tol
+
+
+def file_digest(fname, algorithm='sha1', blocksize=1 << 20):
+    """Get the digest of a file's content
+
+    Parameters
+    ----------
+    fname: path
+      The file to be digested.
+    algorithm: str
+      The hash algorithm, any of :data:`hashlib.algorithms_available`.
+    blocksize: int
+      The file is read by blocks of blocksize bytes.
+
+    Returns
+    -------
+    str:
+      The hex digest.
+    """
+    h = hashlib.new(algorithm)
+    with open(fname, 'rb') as f:
+        for block in iter(lambda: f.read(blocksize), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+class LRUCache(object):
+    """A bounded dict-like cache with least-recently-used eviction.
+
+    Unlike :func:`functools.lru_cache`, entries can be invalidated explicitly
+    while hit/miss counters are kept, so that the hit rate can be checked
+    across many invalidations.
+
+    Parameters
+    ----------
+    maxsize : int
+      The maximum number of cached entries.
+
+    Attributes
+    ----------
+    hits, misses : int
+      The number of lookups that hit and missed the cache.
+    """
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Look up `key`, and mark it as the most recently used entry.
+
+        Returns
+        -------
+        The cached value, or `default` if `key` is not cached.
+        """
+        try:
+            value = self._data.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data[key] = value
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Cache `value` under `key`, evicting the least recently used entry if
+        the cache is full."""
+        self._data.pop(key, None)
+        self._data[key] = value
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """Invalidate all entries, hit/miss counters are kept."""
+        self._data.clear()
+
+    def info(self):
+        """Get cache statistics
+
+        Returns
+        -------
+        dict
+          with keys of 'hits', 'misses', 'size', and 'maxsize'.
+        """
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize}
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+"""
+Search the area allocation of accelerators in a heterogeneous system.
+
+:class:`AreaAllocator` looks for the area ratios of ASIC accelerators
+(:class:`~lumos.model.acc.ASAcc`) and the RL accelerator
+(:class:`~lumos.model.acc.RLAcc`) of a
+:class:`~lumos.model.system.hetero.HeterogSys` that maximize the mean,
+geometric mean, or harmonic mean of the performance of a suite. The search
+is a coordinate descent on a grid of area ratios, whose step is halved
+whenever no single-accelerator move improves the objective. Each move is
+evaluated incrementally by
+:meth:`~lumos.model.system.hetero.HeterogSys.set_asacc_area` and
+:meth:`~lumos.model.system.hetero.HeterogSys.set_rlacc_area`, so that only
+the moved accelerator is re-evaluated and dim-silicon optima are reused
+across moves.
+"""
+
+import logging
+import numpy as np
+from .hetero import HeterogSys, HeterogSysError
+from ..workload.packed import pack_apps
+from lumos.settings import LUMOS_DEBUG
+from lumos import BraceMessage as _bm_
+
+__logger = None
+
+if LUMOS_DEBUG and ('all' in LUMOS_DEBUG or 'alloc' in LUMOS_DEBUG):
+    _debug_enabled = True
+else:
+    _debug_enabled = False
+
+
+def _debug(brace_msg):
+    global __logger
+    if not _debug_enabled:
+        return
+
+    if not __logger:
+        __logger = logging.getLogger('Alloc')
+        __logger.setLevel(logging.DEBUG)
+
+    __logger.debug(brace_msg)
+
+
+class AllocError(Exception):
+    pass
+
+
+#: The key of the RL accelerator in allocations
+RLACC = 'rlacc'
+
+
+def _gmean(perf):
+    return np.exp(np.mean(np.log(perf)))
+
+
+def _hmean(perf):
+    return len(perf) / np.sum(1 / perf)
+
+
+OBJECTIVES = {
+    'mean': np.mean,
+    'gmean': _gmean,
+    'hmean': _hmean,
+}
+
+
+class AreaAllocator(object):
+    """Search area ratios of accelerators to maximize suite performance.
+
+    Parameters
+    ----------
+    sysconfig : :class:`~lumos.model.system.hetero.SysConfig`
+      The system configuration, e.g. budget, technology, and cores.
+      Accelerators already in sysconfig but not searched keep their area.
+    kernels : dict
+      Kernel objects indexed by names.
+    apps : iterable of :class:`~lumos.model.application.SimpleApplication`
+      The applications of the suite.
+    asaccs : list of (str, str)
+      The ASIC accelerators to allocate, as (kernel name, acc_id).
+    rlacc : bool
+      Whether to allocate the RL accelerator as well.
+    objective : str
+      One of 'mean', 'gmean', and 'hmean' of suite performance.
+
+    Attributes
+    ----------
+    keys : list
+      The searched accelerators, (kernel name, acc_id) for ASICs, and
+      :data:`RLACC` for the RL accelerator.
+    sys : :class:`~lumos.model.system.hetero.HeterogSys`
+      The system being searched, configured with the last evaluated
+      allocation.
+    evaluations : int
+      The number of distinct allocations evaluated.
+    """
+    def __init__(self, sysconfig, kernels, apps, asaccs, rlacc=False,
+                 objective='hmean'):
+        try:
+            self._objective = OBJECTIVES[objective]
+        except KeyError:
+            raise AllocError('Unknown objective {0}, expect one of {1}'.format(
+                objective, sorted(OBJECTIVES)))
+        self.keys = [tuple(key) for key in asaccs]
+        if rlacc:
+            self.keys.append(RLACC)
+        if not self.keys:
+            raise AllocError('No accelerator to allocate')
+        for key in self.keys:
+            if key != RLACC and key[0] not in kernels:
+                raise AllocError('Unknown kernel {0}'.format(key[0]))
+
+        self.sys = HeterogSys(sysconfig, kernels)
+        self.suite = pack_apps(apps)
+        self._ratios = [self._get_ratio(key) for key in self.keys]
+        self._scores = dict()
+        self.evaluations = 0
+
+    def _get_ratio(self, key):
+        sys = self.sys
+        if key == RLACC:
+            acc = sys.rlacc
+        else:
+            kid, acc_id = key
+            acc = sys.asic_dict.get(kid, dict()).get(acc_id)
+        return acc.area / sys.sys_area if acc is not None else 0
+
+    def _set_ratio(self, key, ratio):
+        if key == RLACC:
+            self.sys.set_rlacc_area(ratio)
+        else:
+            kid, acc_id = key
+            self.sys.set_asacc_area(kid, acc_id, ratio)
+
+    def _apply(self, ratios):
+        """Configure the system with ratios, give area back before taking
+        it, so that a failure leaves the system unchanged."""
+        changes = [(new - old, i) for i, (old, new) in
+                   enumerate(zip(self._ratios, ratios)) if new != old]
+        done = []
+        try:
+            for _, i in sorted(changes):
+                self._set_ratio(self.keys[i], ratios[i])
+                done.append(i)
+        except HeterogSysError:
+            for i in reversed(done):
+                self._set_ratio(self.keys[i], self._ratios[i])
+            raise
+        self._ratios = list(ratios)
+
+    def evaluate(self, ratios):
+        """Evaluate the objective of an allocation.
+
+        Parameters
+        ----------
+        ratios : sequence of float
+          Area ratios in the order of :attr:`keys`.
+
+        Returns
+        -------
+        float
+          The objective of suite performance, or None if the allocation
+          leaves no area for throughput cores.
+        """
+        ratios = tuple(float(r) for r in ratios)
+        if len(ratios) != len(self.keys):
+            raise AllocError('Expect {0} ratios, got {1}'.format(
+                len(self.keys), len(ratios)))
+        try:
+            return self._scores[ratios]
+        except KeyError:
+            pass
+
+        if min(ratios) < 0:
+            score = None
+        else:
+            try:
+                self._apply(ratios)
+                perf = self.sys.get_perf_suite(self.suite)['perf']
+                score = float(self._objective(perf))
+            except HeterogSysError:
+                score = None
+        self._scores[ratios] = score
+        self.evaluations += 1
+        _debug(_bm_('evaluate: {0} -> {1}', ratios, score))
+        return score
+
+    def optimize(self, init=None, step=0.08, min_step=0.005, max_iter=1000):
+        """Search the allocation by coordinate descent.
+
+        Starting from init, every accelerator in turn is moved by +/- step,
+        and a move is taken if it improves the objective. When no move
+        improves, the step is halved until it is below min_step.
+
+        Parameters
+        ----------
+        init : sequence of float
+          The initial area ratios in the order of :attr:`keys`. By default,
+          the ratios configured in sysconfig.
+        step : float
+          The initial step of area ratios.
+        min_step : float
+          The finest step of area ratios.
+        max_iter : int
+          The maximum number of moves taken.
+
+        Returns
+        -------
+        dict: results wrapped in a python dict with keys:
+
+        ratios : dict
+          The best area ratios indexed by :attr:`keys`.
+        score : float
+          The objective of the best allocation.
+        perf : array
+          Performance of each application with the best allocation.
+        evaluations : int
+          The number of distinct allocations evaluated.
+        """
+        if not step > 0 or not min_step > 0:
+            raise AllocError('Steps must be positive')
+        x = list(self._ratios if init is None else init)
+        best = self.evaluate(x)
+        if best is None:
+            raise AllocError('Infeasible initial allocation {0}'.format(x))
+
+        niter = 0
+        while step >= min_step and niter < max_iter:
+            improved = False
+            for i in range(len(x)):
+                for delta in (step, -step):
+                    y = list(x)
+                    # round to keep the grid exact for memoized scores
+                    y[i] = round(x[i] + delta, 9)
+                    score = self.evaluate(y)
+                    if score is not None and score > best:
+                        x, best = y, score
+                        improved = True
+                        break
+            if improved:
+                niter += 1
+            else:
+                step /= 2
+            _debug(_bm_('optimize: step {0}, best {1} at {2}', step, best, x))
+
+        self._apply(x)
+        return {'ratios': dict(zip(self.keys, x)),
+                'score': best,
+                'perf': self.sys.get_perf_suite(self.suite)['perf'],
+                'evaluations': self.evaluations}
+
+
+def optimize_alloc(sysconfig, kernels, apps, asaccs, rlacc=False,
+                   objective='hmean', **kwargs):
+    """Search the area allocation of accelerators, see
+    :class:`AreaAllocator` and :meth:`AreaAllocator.optimize`."""
+    allocator = AreaAllocator(sysconfig, kernels, apps, asaccs,
+                              rlacc=rlacc, objective=objective)
+    return allocator.optimize(**kwargs)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+"""
+Vectorized building blocks shared by the detailed system models
+(:class:`~lumos.model.system.homo.HomogSysDetailed` and
+:class:`~lumos.model.system.hetero.HeterogSysDetailed`).
+
+The functions here evaluate the cache-miss/memory-stall model of
+throughput cores with NumPy array expressions, so that a whole grid of
+supply voltages, core counts and kernel characteristics can be evaluated
+in one pass instead of one `perf` call per point. Caches are modeled by a
+:class:`~lumos.model.mem.hierarchy.CacheHierarchy`, see
+:func:`cache_hierarchy`.
+"""
+
+import numpy as np
+from lumos.model.mem.hierarchy import CacheHierarchy, baseline_hierarchy
+from lumos.model.workload.packed import KERNEL_PERF_PARAMS
+
+
+def kernel_params(kernels, extra_params=()):
+    """Collect performance characteristics of kernels into arrays
+
+    Parameters
+    ----------
+    kernels : iterable of :class:`~lumos.model.workload.kernel.Kernel`
+      Kernels with core performance characteristics
+      (e.g. loaded from `core_perf_config`).
+    extra_params : iterable of str
+      Optional characteristics besides
+      :data:`~lumos.model.workload.packed.KERNEL_PERF_PARAMS`, e.g. those of
+      an L3 cache, see
+      :attr:`~lumos.model.mem.hierarchy.CacheHierarchy.kernel_params`.
+      Kernels without them give NaN.
+
+    Returns
+    -------
+    dict
+      A dict of numpy arrays indexed by names in
+      :data:`~lumos.model.workload.packed.KERNEL_PERF_PARAMS` and
+      extra_params, one element per kernel, in the order of `kernels`.
+    """
+    kobjs = list(kernels)
+    ret = dict((name, np.array([getattr(k, name) for k in kobjs],
+                               dtype=np.float64))
+               for name in KERNEL_PERF_PARAMS)
+    for name in extra_params:
+        if name not in ret:
+            ret[name] = np.array([getattr(k, name, np.nan) for k in kobjs],
+                                 dtype=np.float64)
+    return ret
+
+
+def cache_hierarchy(sysconfig):
+    """Get the cache hierarchy of a detailed system configuration
+
+    Parameters
+    ----------
+    sysconfig : SysConfigDetailed
+      of :mod:`~lumos.model.system.homo` or
+      :mod:`~lumos.model.system.hetero`. Its cache_levels, if set, is a list
+      of :class:`~lumos.model.mem.hierarchy.CacheLevel`. Otherwise, a private
+      L1 in the technology of cores and an L2 shared by all cores are built
+      from cache_sz_l1, cache_sz_l2, and their technologies.
+
+    Returns
+    -------
+    :class:`~lumos.model.mem.hierarchy.CacheHierarchy`
+    """
+    levels = getattr(sysconfig, 'cache_levels', None)
+    if levels:
+        return CacheHierarchy(levels, sysconfig.delay_mem)
+    return baseline_hierarchy(
+        sysconfig.tech,
+        sysconfig.cache_sz_l1,
+        '-'.join([sysconfig.l1_tech_name, sysconfig.l1_tech_variant]),
+        sysconfig.cache_sz_l2,
+        '-'.join([sysconfig.l2_tech_name, sysconfig.l2_tech_variant]),
+        sysconfig.delay_mem)
+
+
+def parallel_runtime(freq, fnom, cnum, amat, kparams):
+    """Run time of kernels parallelized on throughput cores, given their
+    average memory access time
+
+    Parameters
+    ----------
+    freq : float or array
+      The frequency of throughput cores at the operating supply.
+    fnom : float
+      The frequency of throughput cores at the nominal supply.
+    cnum : int or array
+      The number of active throughput cores.
+    amat : float or array
+      The average memory access time in cycles at the nominal supply, e.g.
+      from :meth:`~lumos.model.mem.hierarchy.CacheHierarchy.amat`.
+    kparams : dict
+      Kernel characteristics with at least 'rm', 'cpi_exe', and 'pf'.
+
+    Returns
+    -------
+    array
+      Run time relative to a single core at the nominal supply, i.e.
+      `1 - pf + pf/p_speedup`.
+    """
+    t0 = amat
+    t = t0 * freq / fnom
+    eta = 1 / (1 + t * kparams['rm'] / kparams['cpi_exe'])
+    eta0 = 1 / (1 + t0 * kparams['rm'] / kparams['cpi_exe'])
+    p_speedup = (freq / fnom) * cnum * (eta / eta0)
+
+    pf = kparams['pf']
+    return 1 - pf + pf / p_speedup
+
+
+def argmax_unimodal(func, hi):
+    """Maximize func over integers in [1, hi], element-wise, by binary search
+
+    func is assumed to be unimodal in its argument, i.e. non-decreasing up
+    to its maximum and non-increasing after it, so that the maximum is
+    found with O(log(hi)) evaluations rather than hi.
+
+    Parameters
+    ----------
+    func : callable
+      Called with an int array in the shape of hi, and returns the values in
+      the same shape.
+    hi : array of int
+      The upper bounds, at least 1.
+
+    Returns
+    -------
+    (array of int, array)
+      The smallest maximizers and the maximum values, in the shape of hi.
+    """
+    hi = np.array(hi, dtype=int)
+    lo = np.ones_like(hi)
+    while True:
+        active = lo < hi
+        if not active.any():
+            break
+        mid = np.where(active, (lo + hi) // 2, lo)
+        up = active & (func(mid + active) > func(mid))
+        lo = np.where(up, mid + 1, lo)
+        hi = np.where(active & ~up, mid, hi)
+    return lo, func(lo)
+
+
+def optimize_operating_point(vdd, cnum_max, perf_func, napps):
+    """Find the optimal (vdd, cnum) of throughput cores for each application
+
+    For every supply, the best core count is found by
+    :func:`argmax_unimodal`, and the best supply is taken afterwards, which
+    costs O(V log C) evaluations for V supplies and at most C cores.
+
+    Parameters
+    ----------
+    vdd : array of int
+      The supplies to be searched, in mV.
+    cnum_max : array of int
+      The number of cores allowed by power and area budgets at each supply,
+      supplies with less than one core are skipped.
+    perf_func : callable
+      Called as perf_func(vdd, cnum) with vdd in the shape of (V, 1) and
+      cnum in the shape of (V, napps), and returns the performance in the
+      shape of (V, napps).
+    napps : int
+      The number of applications.
+
+    Returns
+    -------
+    dict: results wrapped in a python dict with keys of 'vdd', 'cnum' and
+    'perf', each an array of the optimal point of each application. None
+    if no supply is feasible.
+    """
+    vdd = np.asarray(vdd, dtype=int).reshape(-1)
+    cnum_max = np.asarray(cnum_max, dtype=int).reshape(-1)
+    feasible = cnum_max >= 1
+    if not feasible.any():
+        return None
+    vdd = vdd[feasible].reshape(-1, 1)
+    cnum_max = cnum_max[feasible].reshape(-1, 1)
+
+    cnum, perf = argmax_unimodal(lambda c: perf_func(vdd, c),
+                                 np.repeat(cnum_max, napps, axis=1))
+    idx = np.argmax(perf, axis=0)
+    apps = np.arange(napps)
+    return {'vdd': vdd[idx, 0],
+            'cnum': cnum[idx, apps],
+            'perf': perf[idx, apps]}
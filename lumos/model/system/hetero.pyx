@@ -3,13 +3,16 @@
 import logging
 from .budget import Sys_L
 from .. import tech as techmodel
-from ..core import BaseCore
+from ..core import get_core
 # from ..core.io_cmos import PERF_BASE
 PERF_BASE = 12.92
 # from ..ucore import UCore
 from ..acc import ASAcc, RLAcc
 from lumos.model import mem
-from lumos.model.mem.cache import get_cache_trait
+from .detailed import cache_hierarchy, parallel_runtime, optimize_operating_point
+from ..workload.packed import PackedSuite, pack_apps
+from lumos.model.misc import LRUCache
+import numpy as np
 from lumos.settings import LUMOS_DEBUG
 from lumos import BraceMessage as _bm_
 
@@ -17,6 +20,7 @@ VMIN = 300
 VMAX = 1100
 VSF_MAX = 1.3  # maxium vdd is 1.3 * vdd_nominal
 V_PRECISION = 1  # 1mV
+DIM_PERF_CACHE_SIZE = 1024  # max number of memoized dim-silicon optima
 
 __logger = None
 
@@ -100,6 +104,12 @@ class HeterogSys():
         self.asic_dict = dict()
         asacc_techmodel = techmodel.get_model(sysconfig.asacc_tech_model,
                                               sysconfig.asacc_tech_variant)
+        # kept for incremental updates, see set_asacc_area and set_rlacc_area
+        self._kernels = kernels
+        self._asacc_techmodel = asacc_techmodel
+        self._rlacc_id = sysconfig.rlacc_id
+        self._rlacc_techmodel = techmodel.get_model(sysconfig.rlacc_tech_model,
+                                                    sysconfig.rlacc_tech_variant)
         for (key_, area_ratio) in sysconfig.asacc_config.items():
             ker_id, acc_id = key_
             ko = kernels[ker_id]
@@ -113,21 +123,20 @@ class HeterogSys():
         if sysconfig.rlacc_area_ratio:
             self.use_rlacc = True
             rlacc_area = sysconfig.rlacc_area_ratio * self.sys_area
-            rlacc_techmodel = techmodel.get_model(sysconfig.rlacc_tech_model,
-                                                  sysconfig.rlacc_tech_variant)
-            self.rlacc = RLAcc(sysconfig.rlacc_id, rlacc_area, self.tech, rlacc_techmodel)
+            self.rlacc = RLAcc(sysconfig.rlacc_id, rlacc_area, self.tech,
+                               self._rlacc_techmodel)
             available_area -= rlacc_area
         else:
             self.use_rlacc = False
             self.rlacc = None
 
-        self.thru_core = BaseCore(sysconfig.tech, sysconfig.thru_core_tech_name,
-                                  sysconfig.thru_core_tech_variant, sysconfig.thru_core_type)
+        self.thru_core = get_core(sysconfig.tech, sysconfig.thru_core_tech_name,
+                                 sysconfig.thru_core_tech_variant, sysconfig.thru_core_type)
 
         if not sysconfig.thru_core_as_serial:
-            self.serial_core = BaseCore(self.tech, sysconfig.serial_core_tech_name,
-                                        sysconfig.serial_core_tech_variant,
-                                        sysconfig.serial_core_type)
+            self.serial_core = get_core(self.tech, sysconfig.serial_core_tech_name,
+                                       sysconfig.serial_core_tech_variant,
+                                       sysconfig.serial_core_type)
             available_area -= self.serial_core.area
         else:
             self.serial_core = self.thru_core
@@ -136,11 +145,13 @@ class HeterogSys():
         self.thru_core_num = int(self.thru_core_area / self.thru_core.area)
 
         self.thru_core_power = self.sys_power
+        # accelerator perf under system power and bandwidth, indexed by
+        # ('asacc' or 'rlacc', kernel name)
+        self._acc_perf = dict()
+        # dim-silicon optima indexed by (cnum_max, thru_core_power)
+        self._dim_perf_cache = LRUCache(DIM_PERF_CACHE_SIZE)
         if _dimperf_preprocessed:
-            ret = self._dim_perf_opt()
-            self.dim_perf = ret['perf']
-            self.opt_cnum = ret['cnum']
-            self.opt_vdd = ret['vdd']
+            self._update_dim_perf()
         else:
             self.dim_perf = None
             self.opt_cnum = None
@@ -204,7 +215,7 @@ class HeterogSys():
             vmin = VMIN
 
         vl = vmin
-        vr = min(core.vnom * VSF_MAX, core.vmax)
+        vr = int(min(core.vnom * VSF_MAX, core.vmax))
         vm = int((vl + vr) / 2)
 
         while (vr - vl) > V_PRECISION:
@@ -227,7 +238,6 @@ class HeterogSys():
                     'util': float(100 * cnum) / float(cnum_max)}
 
         else:
-            core.vd = vl
             lperf = cnum * core.perf_by_vdd(vl)
             _debug(_bm_('_dim_perf_cnum: optimal vdd for {0} thru_core: {1}mV', cnum, vr))
             return {'perf': lperf / PERF_BASE,
@@ -269,12 +279,128 @@ class HeterogSys():
         else:
             self.thru_core_power = self.sys_power
 
-        ret = self._dim_perf_opt()
+        self._update_dim_perf()
+
+    def _update_dim_perf(self):
+        """Update dim_perf, opt_cnum and opt_vdd with the current area and
+        power of throughput cores. Optima are memoized, since they only
+        change with the number of cores fitting in thru_core_area."""
+        key = (int(self.thru_core_area / self.thru_core.area), self.thru_core_power)
+        ret = self._dim_perf_cache.get(key)
+        if ret is None:
+            ret = self._dim_perf_opt()
+            self._dim_perf_cache.put(key, ret)
 
         self.dim_perf = ret['perf']
         self.opt_cnum = ret['cnum']
         self.opt_vdd = ret['vdd']
 
+    def dim_perf_cache_info(self):
+        """Get statistics of the memoized dim-silicon optima
+
+        Returns
+        -------
+        dict
+          with keys of 'hits', 'misses', 'size' and 'maxsize'.
+        """
+        return self._dim_perf_cache.info()
+
+    def _set_thru_core_area(self, area):
+        if area < self.thru_core.area:
+            raise HeterogSysError(
+                'No area left for throughput cores: {0}, core area: {1}'.format(
+                    area, self.thru_core.area))
+        self.thru_core_area = area
+        self.thru_core_num = int(area / self.thru_core.area)
+        if self.dim_perf is not None:
+            self._update_dim_perf()
+
+    def set_asacc_area(self, kid, acc_id, area_ratio, apps=None):
+        """Change the area of an ASIC accelerator incrementally.
+
+        The area is taken from (or given back to) throughput cores. Only the
+        perf of the ASIC and the dim-silicon optimum are re-evaluated, the
+        latter only if the number of throughput cores changes.
+
+        Parameters
+        ----------
+        kid : str
+          The name of the kernel targeted by the ASIC.
+        acc_id : str
+          The accelerator identifier, e.g. 'asic_5x'.
+        area_ratio : float
+          The new area as a ratio of the system area. The ASIC is added if it
+          does not exist yet, and removed if area_ratio is 0.
+        apps : iterable of :class:`~lumos.model.application.SimpleApplication`, or :class:`~lumos.model.workload.packed.PackedSuite`
+          If given, return the updated perf of the suite.
+
+        Returns
+        -------
+        dict or None
+          The results of :meth:`get_perf_suite` on apps, None if apps is None.
+
+        Raises
+        ------
+        HeterogSysError
+          The kernel is unknown, or no area is left for a throughput core.
+        """
+        asaccs = self.asic_dict.get(kid, dict())
+        asacc = asaccs.get(acc_id)
+        if asacc is None and area_ratio and kid not in self._kernels:
+            raise HeterogSysError('Unknown kernel {0}'.format(kid))
+        old_area = asacc.area if asacc is not None else 0
+        new_area = area_ratio * self.sys_area
+        self._set_thru_core_area(self.thru_core_area + old_area - new_area)
+
+        if not area_ratio:
+            asaccs.pop(acc_id, None)
+            if not asaccs:
+                self.asic_dict.pop(kid, None)
+        elif asacc is not None:
+            asacc.area = new_area
+        else:
+            asacc = ASAcc(acc_id, self._kernels[kid], new_area, self.tech,
+                          self._asacc_techmodel)
+            self.asic_dict.setdefault(kid, asaccs)[acc_id] = asacc
+        self._acc_perf.pop(('asacc', kid), None)
+
+        if apps is not None:
+            return self.get_perf_suite(apps)
+
+    def set_rlacc_area(self, area_ratio, apps=None):
+        """Change the area of the RL accelerator incrementally, see
+        :meth:`set_asacc_area`.
+
+        Parameters
+        ----------
+        area_ratio : float
+          The new area as a ratio of the system area, 0 to remove the RL
+          accelerator.
+        apps : iterable of :class:`~lumos.model.application.SimpleApplication`, or :class:`~lumos.model.workload.packed.PackedSuite`
+          If given, return the updated perf of the suite.
+
+        Returns
+        -------
+        dict or None
+          The results of :meth:`get_perf_suite` on apps, None if apps is None.
+        """
+        old_area = self.rlacc.area if self.rlacc is not None else 0
+        new_area = area_ratio * self.sys_area
+        self._set_thru_core_area(self.thru_core_area + old_area - new_area)
+
+        if area_ratio:
+            self.use_rlacc = True
+            self.rlacc = RLAcc(self._rlacc_id, new_area, self.tech,
+                               self._rlacc_techmodel)
+        else:
+            self.use_rlacc = False
+            self.rlacc = None
+        for key in [key for key in self._acc_perf if key[0] == 'rlacc']:
+            del self._acc_perf[key]
+
+        if apps is not None:
+            return self.get_perf_suite(apps)
+
     def get_perf(self, app):
         """ Get the optimal performance fo the system. It uses accelerators to execute
         kernels if available. Otherwise, kernels are executed and accelerated by
@@ -309,7 +435,6 @@ class HeterogSys():
         """
         _debug(_bm_('Get perf on app {0}', app.name))
         serial_core = self.serial_core
-        rlacc = self.rlacc
 
         serial_perf = serial_core.perf_by_vdd(serial_core.vmax) / PERF_BASE
         _debug(_bm_('serial_perf: {0}', serial_perf))
@@ -324,24 +449,97 @@ class HeterogSys():
         for kid in app.get_all_kernels():
             cov = app.get_cov(kid)
             _debug(_bm_('get_perf: kernel {0}, cov {1}', kid, cov))
-            if self.has_asacc(kid):
-                asacc = self.get_asacc_list(kid)[0]
-                asacc_perf = asacc.perf(
-                    power=self.sys_power, bandwidth=self.sys_bandwidth) / PERF_BASE
-                perf = perf + cov / asacc_perf
-                _debug(_bm_('get_perf: ASAcc perf: {0}', asacc_perf))
-            elif self.use_rlacc:
-                rlacc_perf = rlacc.perf(
-                    app.get_kernel(kid), power=self.sys_power, bandwidth=self.sys_bandwidth) / PERF_BASE
-                perf = perf + cov / rlacc_perf
-                _debug(_bm_('get_perf: RLAcc perf: {0}', rlacc_perf))
-            else:
-                perf = perf + cov / dim_perf
+            perf = perf + cov / self._kernel_perf(kid, app.get_kernel(kid))
 
         return {'perf': 1 / perf,
                 'cnum': self.opt_cnum,
                 'vdd': self.opt_vdd}
 
+    def _asacc_perf(self, kid):
+        """The perf of the ASIC of kernel kid under system power and
+        bandwidth, relative to PERF_BASE"""
+        asacc = self.get_asacc_list(kid)[0]
+        key = ('asacc', kid)
+        try:
+            return self._acc_perf[key]
+        except KeyError:
+            perf = asacc.perf(power=self.sys_power,
+                              bandwidth=self.sys_bandwidth) / PERF_BASE
+            self._acc_perf[key] = perf
+            _debug(_bm_('get_perf: ASAcc perf: {0}', perf))
+            return perf
+
+    def _rlacc_perf(self, kobj):
+        """The perf of the RL accelerator on kobj under system power and
+        bandwidth, relative to PERF_BASE"""
+        key = ('rlacc', kobj.name)
+        try:
+            return self._acc_perf[key]
+        except KeyError:
+            perf = self.rlacc.perf(kobj, power=self.sys_power,
+                                   bandwidth=self.sys_bandwidth) / PERF_BASE
+            self._acc_perf[key] = perf
+            _debug(_bm_('get_perf: RLAcc perf: {0}', perf))
+            return perf
+
+    def _kernel_perf(self, kid, kobj):
+        """The perf of executing kernel kid, by its ASIC if available, or the
+        RL accelerator, otherwise by throughput cores"""
+        if self.has_asacc(kid):
+            return self._asacc_perf(kid)
+        elif self.use_rlacc:
+            return self._rlacc_perf(kobj)
+        else:
+            return self.dim_perf
+
+    def get_perf_suite(self, apps):
+        """Get the performance of a suite of applications, the same as
+        :meth:`get_perf` on each of them.
+
+        The perf of accelerators is evaluated once per kernel, and the run
+        time of all applications is given by the product of the coverage
+        matrix (applications by kernels) and the per-kernel run time vector.
+
+        Parameters
+        ----------
+        apps : iterable of :class:`~lumos.model.application.SimpleApplication`, or :class:`~lumos.model.workload.packed.PackedSuite`
+          The targeted applications, e.g. values of a suite. Pass them
+          packed by :func:`~lumos.model.workload.packed.pack_apps` to
+          evaluate the same suite repeatedly.
+
+        Returns
+        -------
+        dict: results wrapped in a python dict with three keys:
+
+        perf : array
+          Relative performance of each application, in the order of apps.
+        cnum : int
+          The number of active cores for the optimal configuration.
+        vdd : float
+          The supply voltage of throughput cores when executing parallel part
+          of applications.
+        """
+        if not isinstance(apps, PackedSuite):
+            apps = pack_apps(apps)
+        serial_core = self.serial_core
+        serial_perf = serial_core.perf_by_vdd(serial_core.vmax) / PERF_BASE
+
+        dim_perf = self.dim_perf
+        if not dim_perf:
+            raise HeterogSysError('dim_perf not initialized properly')
+
+        kernel_time = np.array([1 / self._kernel_perf(kobj.name, kobj)
+                                for kobj in apps.kernels], dtype=np.float64)
+        f = apps.app_columns['f']
+        f_noacc = apps.app_columns['f_noacc']
+        perf = ((1 - f) / serial_perf + f_noacc / dim_perf +
+                apps.cov_matrix.dot(kernel_time))
+
+        return {'perf': 1 / perf,
+                'cnum': self.opt_cnum,
+                'vdd': self.opt_vdd}
+
+
 class SysConfigDetailed():
     def __init__(self):
         self.tech = 22
@@ -372,6 +570,8 @@ class SysConfigDetailed():
         self.delay_mem = mem.BASELINE_L2_DELAY
         self.cache_sz_l1 = mem.BASELINE_L1_SIZE
         self.cache_sz_l2 = mem.BASELINE_L2_SIZE
+        # a list of lumos.model.mem.hierarchy.CacheLevel, in place of L1/L2
+        self.cache_levels = None
 
     def add_asacc(self, ker_id, acc_id, area_ratio, tech_name='cmos', tech_variant='hp'):
         self.asacc_config[(ker_id, acc_id)] = (area_ratio, tech_name, tech_variant)
@@ -395,6 +595,13 @@ class HeterogSysDetailed(HeterogSys):
 
         available_area = self.sys_area
         self.asic_dict = dict()
+        # kept for incremental updates, see set_asacc_area and set_rlacc_area
+        self._kernels = kernels
+        self._asacc_techmodel = techmodel.get_model(sysconfig.asacc_tech_model,
+                                                    sysconfig.asacc_tech_variant)
+        self._rlacc_id = sysconfig.rlacc_id
+        self._rlacc_techmodel = techmodel.get_model(sysconfig.rlacc_tech_model,
+                                                    sysconfig.rlacc_tech_variant)
         for (key_, value_) in sysconfig.asacc_config.items():
             ker_id, acc_id = key_
             area_ratio, tech_name, tech_variant = value_
@@ -410,16 +617,15 @@ class HeterogSysDetailed(HeterogSys):
         if sysconfig.rlacc_area_ratio:
             self.use_rlacc = True
             rlacc_area = sysconfig.rlacc_area_ratio * self.sys_area
-            rlacc_techmodel = techmodel.get_model(sysconfig.rlacc_tech_model,
-                                                  sysconfig.rlacc_tech_variant)
-            self.rlacc = RLAcc(sysconfig.rlacc_id, rlacc_area, self.tech, rlacc_techmodel)
+            self.rlacc = RLAcc(sysconfig.rlacc_id, rlacc_area, self.tech,
+                               self._rlacc_techmodel)
             available_area -= rlacc_area
         else:
             self.use_rlacc = False
             self.rlacc = None
 
-        self.thru_core = BaseCore(sysconfig.tech, sysconfig.thru_core_tech_name,
-                                  sysconfig.thru_core_tech_variant, sysconfig.thru_core_type)
+        self.thru_core = get_core(sysconfig.tech, sysconfig.thru_core_tech_name,
+                                 sysconfig.thru_core_tech_variant, sysconfig.thru_core_type)
 
         if not sysconfig.thru_core_as_serial:
             raise Exception('SysConfigDetailed requires thru_core_as_serial')
@@ -432,43 +638,61 @@ class HeterogSysDetailed(HeterogSys):
         # assume every functional units (cores, accelerators) are power-gated,
         # therefore consume no power if not activated.
         self.thru_core_power = self.sys_power
+        # the dim-silicon model of HeterogSys is not used, operating points
+        # are searched by optimize instead
+        self._acc_perf = dict()
+        self._dim_perf_cache = LRUCache(DIM_PERF_CACHE_SIZE)
+        self.dim_perf = None
+        self.opt_cnum = None
+        self.opt_vdd = None
+
+        self.caches = cache_hierarchy(sysconfig)
+        _debug(_bm_('cache levels: {0}, latency: {1}',
+                    [level.name for level in self.caches],
+                    [level.delay for level in self.caches]))
 
-        baseline_cache_tech = '-'.join((mem.BASELINE_L1_TECH_NAME, mem.BASELINE_L1_TECH_VARIANT))
-        baseline_traits = get_cache_trait(mem.BASELINE_L1_SIZE,
-                                          baseline_cache_tech,
-                                          mem.BASELINE_L1_TECH_NODE)
+        self.delay_mem = sysconfig.delay_mem
 
-        self.cache_sz_l1 = sysconfig.cache_sz_l1
-        l1_tech_type = '-'.join([sysconfig.l1_tech_name, sysconfig.l1_tech_variant] )
-        self.l1_traits = get_cache_trait(self.cache_sz_l1, l1_tech_type, sysconfig.tech)
+    def get_perf_suite(self, apps):
+        """Get the optimal performance of a suite of applications, the same
+        as :meth:`optimize` on apps, e.g. after :meth:`set_asacc_area`.
 
-        scale_factor = self.l1_traits['latency'] / baseline_traits['latency']
-        self.delay_l1 = int(mem.BASELINE_L1_DELAY * scale_factor)
+        Parameters
+        ----------
+        apps : iterable of applications, or :class:`~lumos.model.workload.packed.PackedSuite`
+          The targeted synthetic applications.
 
-        baseline_cache_tech = '-'.join((mem.BASELINE_L2_TECH_NAME, mem.BASELINE_L2_TECH_VARIANT))
-        baseline_traits = get_cache_trait(mem.BASELINE_L2_SIZE,
-                                          baseline_cache_tech,
-                                          mem.BASELINE_L2_TECH_NODE)
-        self.cache_sz_l2 = sysconfig.cache_sz_l2
-        l2_tech_type = '-'.join([sysconfig.l2_tech_name, sysconfig.l2_tech_variant])
-        self.l2_traits = get_cache_trait(self.cache_sz_l2, l2_tech_type, sysconfig.tech)
+        Returns
+        -------
+        dict: results of :meth:`optimize`, with perf, cnum and vdd of each
+        application.
+        """
+        if not isinstance(apps, PackedSuite):
+            apps = list(apps)
+        return self.optimize(apps)
 
-        scale_factor = self.l2_traits['latency'] / baseline_traits['latency']
-        self.delay_l2 = int(mem.BASELINE_L2_DELAY * scale_factor)
-        _debug(_bm_('l2 cache tech: {0}, latency: {1}', l2_tech_type, self.delay_l2))
+    def get_cnum(self, vdd):
+        core = self.thru_core
+        return self.caches.max_cores(self.sys_power, self.thru_core_area,
+                                     core.power(vdd), core.area)
 
-        self.delay_mem = sysconfig.delay_mem
+    def get_cnum_array(self, vdd):
+        """Vectorized :meth:`get_cnum`
 
-    def get_cnum(self, vdd):
+        Parameters
+        ----------
+        vdd : array of int
+          Supply voltages of throughput cores, in mV
+
+        Returns
+        -------
+        array of int
+          The number of cores allowed by power and area budgets at each
+          supply.
+        """
         core = self.thru_core
-        core_power = core.power(vdd)
-        l2_power = self.l2_traits['power']
-        l2_area = self.l2_traits['area']
-        l1_power = self.l1_traits['power']
-        l1_area = self.l1_traits['area']
-        cnum = min((self.sys_power-l2_power)/(core_power+l1_power),
-                   (self.thru_core_area-l2_area)/(core.area+l1_area))
-        return int(cnum)
+        return np.asarray(self.caches.max_cores(
+            self.sys_power, self.thru_core_area, core.power_array(vdd), core.area))
 
     def perf(self, vdd, app, cnum_max=None, disable_rlacc=False, disable_asacc=False):
         """ Get the optimal performance fo the system. It uses accelerators to execute
@@ -526,7 +750,7 @@ class HeterogSysDetailed(HeterogSys):
         cdef float p_speedup, core_speedup
         cdef float asacc_perf, asacc_speedup
         cdef float rlacc_perf, rl_acc_speedup
-        cdef float miss_l1, miss_l2, t0, t, eta, eta0
+        cdef float t0, t, eta, eta0
         cov, speedup = 1, 0
         for kid in app.get_all_kernels():
             kcov,k_rc_count, k_rc_time = app.get_kernel_characteristics(kid)
@@ -551,14 +775,8 @@ class HeterogSysDetailed(HeterogSys):
             _debug(_bm_('get_perf: RLAcc speedup: {0}', rlacc_speedup))
 
             # compute multi-core parallelization speedup
-            miss_l1 = min(
-                1, kobj.miss_l1 * ((self.cache_sz_l1/(kobj.cache_sz_l1_nom)) ** (1-kobj.alpha_l1)))
-            miss_l2 = min(
-                1, kobj.miss_l2 * ((self.cache_sz_l2/(cnum*kobj.cache_sz_l2_nom)) ** (1-kobj.alpha_l2)))
-
-            _debug(_bm_('l1_miss: {0}, l2_miss: {1}', miss_l1, miss_l2))
-            t0 = ((1-miss_l1)*self.delay_l1 + miss_l1*(1-miss_l2)*self.delay_l2 +
-                  miss_l1*miss_l2*self.delay_mem)
+            t0 = self.caches.amat(kobj, cnum)
+            _debug(_bm_('amat: {0}', t0))
             t = t0 * core.freq(vdd) / core.freq(core.vnom)
             _debug(_bm_('t: {0}', t))
             eta = 1 / (1 + t * kobj.rm / kobj.cpi_exe)
@@ -587,3 +805,216 @@ class HeterogSysDetailed(HeterogSys):
         _debug(_bm_('non-kernel: {0}', cov))
         perf = core.perfnom / speedup
         return perf
+
+    def perf_packed(self, vdd, suite, cnum_max=None, disable_rlacc=False, disable_asacc=False):
+        """Vectorized :meth:`perf` on packed synthetic applications.
+
+        Accelerator performance is evaluated once per distinct kernel, and
+        every (application, kernel) row takes the fastest of ASIC, RL
+        accelerator, and throughput cores, as :meth:`perf` does.
+
+        Parameters
+        ----------
+        vdd : int or array of int, in mV
+          the supply of throughput cores
+        suite : :class:`~lumos.model.workload.packed.PackedSuite`
+          The applications to be evaluated.
+        cnum_max, disable_rlacc, disable_asacc
+          See :meth:`perf`.
+
+        Returns
+        -------
+        array
+          The performance score of each application, in the order of
+          `suite.names`. For an array of V supplies, the shape is
+          (V, napps).
+
+        Raises
+        ------
+        AppError
+          Kernel characteristics of caches are not packed in suite.
+        """
+        suite.require(self.caches.kernel_params)
+        vdd = np.asarray(vdd)
+        if vdd.ndim:
+            # supplies along the first axis, rows along the last
+            vdd = vdd.reshape(-1, 1)
+            cnum = (self.get_cnum_array(vdd) if not cnum_max
+                    else np.full(vdd.shape, int(cnum_max)))
+            freq = self.thru_core.freq_array(vdd)
+        else:
+            vdd = int(vdd)
+            cnum = self.get_cnum(vdd) if not cnum_max else int(cnum_max)
+            freq = self.thru_core.freq(vdd)
+
+        core = self.thru_core
+        cols = suite.columns
+        cov = cols['cov']
+        acc_speedup = self._acc_speedup_packed(suite, disable_rlacc, disable_asacc)
+        core_speedup = cov * parallel_runtime(freq, core.fnom, cnum,
+                                              self.caches.amat(cols, cnum), cols)
+
+        best_speedup = np.minimum(acc_speedup, core_speedup)
+        # non-kernels will not be speedup/accelerated
+        speedup = suite.app_sum(best_speedup) + (1 - suite.app_sum(cov))
+        return core.perfnom / speedup
+
+    def _acc_speedup_packed(self, suite, disable_rlacc, disable_asacc):
+        """The run time of each row of suite on its fastest accelerator, inf
+        if no accelerator is available, see :meth:`perf_packed`"""
+        core = self.thru_core
+        rlacc = self.rlacc
+        cols = suite.columns
+        cov = cols['cov']
+
+        # run time of a unit coverage on accelerators, inf if not available
+        def asacc_time(kobj):
+            if disable_asacc or not self.has_asacc(kobj.name):
+                return np.inf
+            asacc = self.get_asacc_list(kobj.name)[0]
+            return core.perfnom / asacc.perf(power=self.sys_power,
+                                             bandwidth=self.sys_bandwidth)
+
+        def rlacc_time(kobj):
+            if disable_rlacc or not self.has_rlacc() or not kobj.accelerated_by('fpga'):
+                return np.inf
+            return core.perfnom / rlacc.perf(kobj, power=self.sys_power,
+                                             bandwidth=self.sys_bandwidth)
+
+        asacc_speedup = cov * suite.kernel_map(asacc_time)
+        rlacc_speedup = cov * suite.kernel_map(rlacc_time)
+        if rlacc is not None:
+            rlacc_speedup = rlacc_speedup + cols['rc_count'] * cols['rc_time'] * rlacc.area_nom
+        return np.minimum(asacc_speedup, rlacc_speedup)
+
+    def perf_vdd_curve(self, app, vdd, cnum_max=None, disable_rlacc=False,
+                       disable_asacc=False):
+        """Get the performance over a range of supplies, and the optimal
+        supply, in one vectorized pass.
+
+        This is the same as calling :meth:`perf` on each supply, but
+        accelerator performance and cache miss rates are evaluated once,
+        and cores are evaluated on all supplies with array frequencies and
+        power. Supplies that can not power a single core with its caches
+        are infeasible.
+
+        Parameters
+        ----------
+        app : :class:`~lumos.model.workload.application.SyntheticApp`
+          The targeted application.
+        vdd : array of int, in mV
+          The supplies of throughput cores.
+        cnum_max, disable_rlacc, disable_asacc
+          See :meth:`perf`.
+
+        Returns
+        -------
+        dict: results wrapped in a python dict with keys:
+
+        vdd, cnum : array of int
+          The supplies, and the number of throughput cores at each of them.
+        perf : array
+          The performance at each supply, NaN if infeasible.
+        opt_vdd, opt_cnum, opt_perf
+          The optimal supply, with its number of cores and performance.
+
+        Raises
+        ------
+        HeterogSysError
+          None of the supplies is feasible.
+        """
+        if app.type != 'synthetic':
+            raise HeterogSysError('Requires a synthetic application')
+        vdd = np.asarray(vdd, dtype=int).reshape(-1)
+        if not cnum_max:
+            cnum = self.get_cnum_array(vdd)
+        else:
+            cnum = np.full(vdd.shape, int(cnum_max))
+        feasible = cnum >= 1
+        if not feasible.any():
+            raise HeterogSysError('No feasible supply in {0}'.format(vdd))
+
+        perf = np.full(vdd.shape, np.nan)
+        suite = PackedSuite.from_apps([app], self.caches.kernel_params)
+        perf[feasible] = self.perf_packed(vdd[feasible], suite, cnum_max,
+                                          disable_rlacc, disable_asacc)[:, 0]
+        idx = np.nanargmax(perf)
+        return {'vdd': vdd,
+                'cnum': cnum,
+                'perf': perf,
+                'opt_vdd': int(vdd[idx]),
+                'opt_cnum': int(cnum[idx]),
+                'opt_perf': perf[idx]}
+
+    def optimize(self, apps, vdd=None, disable_rlacc=False, disable_asacc=False):
+        """Find the optimal supply and number of throughput cores.
+
+        The whole (vdd, cnum) space allowed by power and area budgets is
+        searched, with power and area of caches taken into account as
+        :meth:`get_cnum` does. The performance is assumed unimodal in the
+        number of cores at a given supply, so that the best core count is
+        found by binary search, see
+        :func:`~lumos.model.system.detailed.optimize_operating_point`.
+        Accelerators are evaluated once per kernel.
+
+        Parameters
+        ----------
+        apps : application, iterable of applications, or :class:`~lumos.model.workload.packed.PackedSuite`
+          A synthetic application, or many of them to be optimized at once.
+        vdd : array of int, optional
+          The supplies to be searched, in mV. By default, all supplies of
+          throughput cores at the step of V_PRECISION.
+        disable_rlacc, disable_asacc
+          See :meth:`perf`.
+
+        Returns
+        -------
+        dict: results wrapped in a python dict with keys:
+
+        vdd, cnum, perf
+          The optimal supply, number of cores, and performance, the same as
+          :meth:`perf` with them as vdd and cnum_max. For many applications,
+          they are arrays in the order of applications, which are given by
+          an extra key of 'names'.
+
+        Raises
+        ------
+        HeterogSysError
+          No supply can power a core with its caches.
+        AppError
+          A packed suite lacks kernel characteristics of caches.
+        """
+        single = not isinstance(apps, PackedSuite) and hasattr(apps, 'type')
+        if isinstance(apps, PackedSuite):
+            suite = apps
+            suite.require(self.caches.kernel_params)
+        else:
+            suite = pack_apps([apps] if single else apps,
+                              extra_params=self.caches.kernel_params)
+
+        core = self.thru_core
+        if vdd is None:
+            vdd = np.arange(core.vmin, core.vmax + 1, V_PRECISION)
+        vdd = np.asarray(vdd, dtype=int)
+        cols = suite.columns
+        cov = cols['cov']
+        noncov = 1 - suite.app_sum(cov)
+        acc_speedup = self._acc_speedup_packed(suite, disable_rlacc, disable_asacc)
+
+        def perf_func(vdd_, cnum):
+            cnum = cnum[:, suite.app_index]
+            core_speedup = cov * parallel_runtime(core.freq_array(vdd_), core.fnom, cnum,
+                                                  self.caches.amat(cols, cnum), cols)
+            speedup = suite.app_sum(np.minimum(acc_speedup, core_speedup)) + noncov
+            return core.perfnom / speedup
+
+        ret = optimize_operating_point(vdd, self.get_cnum_array(vdd), perf_func,
+                                       len(suite))
+        if ret is None:
+            raise HeterogSysError('No feasible supply in {0}'.format(vdd))
+        if single:
+            return {'vdd': int(ret['vdd'][0]),
+                    'cnum': int(ret['cnum'][0]),
+                    'perf': ret['perf'][0]}
+        ret['names'] = suite.names
+        return ret
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 
 import logging
-from ..core import BaseCore
+from ..core import get_core
 PERF_BASE = 12.92
 
 VMIN = 300
@@ -60,7 +60,7 @@ class HomogSys(object):
         else:
             self.power = 0
 
-        self.core = BaseCore(45, 'cmos', 'hp', 'io')
+        self.core = get_core(45, 'cmos', 'hp', 'io')
 
     def set_core_prop(self, **kwargs):
         """
@@ -143,7 +143,6 @@ class HomogSys(object):
         vdd_max = min(core.vnom * VSF_MAX, core.vmax)
         sperf = core.perf_by_vdd(vdd_max)
 
-        core.vdd = vdd
         active_num = min(int(self.area / core.area),
                          int(self.power / core.power(vdd)))
 
@@ -251,7 +250,6 @@ class HomogSys(object):
                 vr = vr
 
         _debug(_bm_('End of bin-search, vl: {0}mV, vr: {1}mV', vl, vr))
-        core.vdd = vl
         lpower = core.power(vl)
         lfreq = core.freq(vl)
         lcnum = min(int(self.area / core.area), int(self.power / lpower))
@@ -417,8 +415,10 @@ class HomogSys(object):
 
 
 from .budget import Sys_L
+from .detailed import cache_hierarchy, parallel_runtime, optimize_operating_point
+from ..workload.packed import PackedSuite, pack_apps
 from lumos.model import mem
-from lumos.model.mem.cache import get_cache_trait
+import numpy as np
 
 
 class SysConfigDetailed():
@@ -434,6 +434,8 @@ class SysConfigDetailed():
         self.delay_mem = mem.BASELINE_L2_DELAY
         self.cache_sz_l1 = mem.BASELINE_L1_SIZE
         self.cache_sz_l2 = mem.BASELINE_L2_SIZE
+        # a list of lumos.model.mem.hierarchy.CacheLevel, in place of L1/L2
+        self.cache_levels = None
 
     @property
     def l1_tech_name(self):
@@ -450,53 +452,19 @@ class HomogSysDetailed():
         self.sys_power = sysconfig.budget.power
         self.sys_bw = sysconfig.budget.bw
 
-        self.core = BaseCore(sysconfig.tech, sysconfig.core_tech_name,
+        self.core = get_core(sysconfig.tech, sysconfig.core_tech_name,
                              sysconfig.core_tech_variant, sysconfig.core_type)
 
-        baseline_cache_tech = '-'.join((mem.BASELINE_L1_TECH_NAME,
-                                        mem.BASELINE_L1_TECH_VARIANT))
-        baseline_traits = get_cache_trait(mem.BASELINE_L1_SIZE,
-                                          baseline_cache_tech,
-                                          mem.BASELINE_L1_TECH_NODE)
-
-        self.cache_sz_l1 = sysconfig.cache_sz_l1
-        l1_tech_type = '-'.join([sysconfig.l1_tech_name,
-                                 sysconfig.l1_tech_variant])
-        self.l1_traits = get_cache_trait(self.cache_sz_l1, l1_tech_type,
-                                         sysconfig.tech)
-
-        scale_factor = self.l1_traits['latency'] / baseline_traits['latency']
-        self.delay_l1 = int(mem.BASELINE_L1_DELAY * scale_factor)
-
-        baseline_cache_tech = '-'.join((mem.BASELINE_L2_TECH_NAME,
-                                        mem.BASELINE_L2_TECH_VARIANT))
-        baseline_traits = get_cache_trait(mem.BASELINE_L2_SIZE,
-                                          baseline_cache_tech,
-                                          mem.BASELINE_L2_TECH_NODE)
-        self.cache_sz_l2 = sysconfig.cache_sz_l2
-        l2_tech_type = '-'.join([sysconfig.l2_tech_name,
-                                 sysconfig.l2_tech_variant])
-        self.l2_traits = get_cache_trait(self.cache_sz_l2, l2_tech_type,
-                                         sysconfig.tech)
-
-        scale_factor = self.l2_traits['latency'] / baseline_traits['latency']
-        self.delay_l2 = int(mem.BASELINE_L2_DELAY * scale_factor)
-
+        self.caches = cache_hierarchy(sysconfig)
         self.delay_mem = sysconfig.delay_mem
 
     def get_cnum(self, vdd):
         core = self.core
         core_power = core.power(vdd)
         _debug(_bm_('core_power: {0}', core_power))
-        l2_power = self.l2_traits['power']
-        l2_area = self.l2_traits['area']
-        _debug(_bm_('l2_power: {0}', l2_power))
-        l1_power = self.l1_traits['power']
-        l1_area = self.l1_traits['area']
-        _debug(_bm_('l1_power: {0}', l1_power))
-        cnum = min((self.sys_power - l2_power) / (core_power + l1_power),
-                   (self.sys_area - l2_area) / (core.area + l1_area))
-        return int(cnum)
+        _debug(_bm_('cache power: {0}', self.caches.power(1)))
+        return self.caches.max_cores(self.sys_power, self.sys_area,
+                                     core_power, core.area)
 
     def perf(self, vdd, app, cnum=None):
         if app.type != 'synthetic':
@@ -515,18 +483,8 @@ class HomogSysDetailed():
             kcov = app.get_cov(kid)
             kobj = app.get_kernel(kid)
 
-            miss_l1 = min(
-                1, kobj.miss_l1 * ((self.cache_sz_l1 /
-                                    (kobj.cache_sz_l1_nom)) **
-                                   (1 - kobj.alpha_l1)))
-            miss_l2 = min(
-                1, kobj.miss_l2 * ((self.cache_sz_l2 /
-                                    (cnum * kobj.cache_sz_l2_nom)) **
-                                   (1 - kobj.alpha_l2)))
-
-            _debug(_bm_('l1_miss: {0}, l2_miss: {1}', miss_l1, miss_l2))
-            t0 = ((1 - miss_l1) * self.delay_l1 + miss_l1 * (1 - miss_l2) *
-                  self.delay_l2 + miss_l1 * miss_l2 * self.delay_mem)
+            t0 = self.caches.amat(kobj, cnum)
+            _debug(_bm_('amat: {0}', t0))
             t = t0 * core.freq(vdd) / core.freq(core.vnom)
             _debug(_bm_('t: {0}', t))
             eta = 1 / (1 + t * kobj.rm / kobj.cpi_exe)
@@ -549,3 +507,164 @@ class HomogSysDetailed():
 
         abs_perf = core.perfnom / perf  # speedup = 1 / perf
         return abs_perf
+
+    def get_cnum_array(self, vdd):
+        """Vectorized :meth:`get_cnum`
+
+        Parameters
+        ----------
+        vdd : array of int
+          Supply voltages of throughput cores, in mV
+
+        Returns
+        -------
+        array of int
+          The number of cores allowed by power and area budgets at each
+          supply.
+        """
+        core = self.core
+        return np.asarray(self.caches.max_cores(
+            self.sys_power, self.sys_area, core.power_array(vdd), core.area))
+
+    def perf_batch(self, vdd, kparams, cnum=None, cov=1):
+        """Vectorized :meth:`perf` on single-kernel synthetic applications.
+
+        All array arguments follow numpy broadcasting rules, e.g. to evaluate
+        V supplies on K kernels, pass `vdd` in the shape of (V, 1) and kernel
+        characteristics in the shape of (K,) to get a (V, K) result.
+
+        Parameters
+        ----------
+        vdd : int or array of int, in mV
+          The supply of throughput cores.
+        kparams : dict
+          Kernel characteristics indexed by names in
+          :data:`~lumos.model.workload.packed.KERNEL_PERF_PARAMS`, e.g. built by
+          :func:`~lumos.model.system.detailed.kernel_params`, or the columns of
+          a pandas DataFrame.
+        cnum : int or array of int, optional
+          The number of throughput cores. If None, it is determined by system
+          power/area budget at each `vdd`, the same as :meth:`perf`.
+        cov : float or array, optional
+          The coverage of the kernel, default is 1.
+
+        Returns
+        -------
+        array
+          The performance scores, the same as what :meth:`perf` returns for
+          each point.
+        """
+        vdd = np.asarray(vdd)
+        if cnum is None:
+            cnum = self.get_cnum_array(vdd)
+
+        core = self.core
+        runtime = parallel_runtime(core.freq_array(vdd), core.fnom, cnum,
+                                   self.caches.amat(kparams, cnum), kparams)
+        perf = cov * runtime + (1 - cov)
+        return core.perfnom / perf
+
+    def perf_packed(self, vdd, suite, cnum=None):
+        """Vectorized :meth:`perf` on packed synthetic applications.
+
+        Parameters
+        ----------
+        vdd : int, in mV
+          The supply of throughput cores.
+        suite : :class:`~lumos.model.workload.packed.PackedSuite`
+          The applications to be evaluated.
+        cnum : int, optional
+          The number of throughput cores. If None, it is determined by system
+          power/area budget, the same as :meth:`perf`.
+
+        Returns
+        -------
+        array
+          The performance score of each application, in the order of
+          `suite.names`.
+
+        Raises
+        ------
+        AppError
+          Kernel characteristics of caches are not packed in suite.
+        """
+        suite.require(self.caches.kernel_params)
+        if not cnum:
+            cnum = self.get_cnum(vdd)
+
+        core = self.core
+        cols = suite.columns
+        runtime = parallel_runtime(core.freq(vdd), core.fnom, cnum,
+                                   self.caches.amat(cols, cnum), cols)
+        cov = cols['cov']
+        # non-kernels will not be speedup
+        perf = suite.app_sum(cov * runtime) + (1 - suite.app_sum(cov))
+        return core.perfnom / perf
+
+    def optimize(self, apps, vdd=None):
+        """Find the optimal supply and number of cores.
+
+        The whole (vdd, cnum) space allowed by power and area budgets is
+        searched, with power and area of caches taken into account as
+        :meth:`get_cnum` does. The performance is assumed unimodal in the
+        number of cores at a given supply, so that the best core count is
+        found by binary search, see
+        :func:`~lumos.model.system.detailed.optimize_operating_point`.
+
+        Parameters
+        ----------
+        apps : application, iterable of applications, or :class:`~lumos.model.workload.packed.PackedSuite`
+          A synthetic application, or many of them to be optimized at once.
+        vdd : array of int, optional
+          The supplies to be searched, in mV. By default, all supplies of
+          the core at the step of V_PRECISION.
+
+        Returns
+        -------
+        dict: results wrapped in a python dict with keys:
+
+        vdd, cnum, perf
+          The optimal supply, number of cores, and performance, the same as
+          :meth:`perf` with them. For many applications, they are arrays in
+          the order of applications, which are given by an extra key of
+          'names'.
+
+        Raises
+        ------
+        HomogSysError
+          No supply can power a core with its caches.
+        AppError
+          A packed suite lacks kernel characteristics of caches.
+        """
+        single = not isinstance(apps, PackedSuite) and hasattr(apps, 'type')
+        if isinstance(apps, PackedSuite):
+            suite = apps
+            suite.require(self.caches.kernel_params)
+        else:
+            suite = pack_apps([apps] if single else apps,
+                              extra_params=self.caches.kernel_params)
+
+        core = self.core
+        if vdd is None:
+            vdd = np.arange(core.vmin, core.vmax + 1, V_PRECISION)
+        vdd = np.asarray(vdd, dtype=int)
+        cols = suite.columns
+        cov = cols['cov']
+        noncov = 1 - suite.app_sum(cov)
+
+        def perf_func(vdd_, cnum):
+            cnum = cnum[:, suite.app_index]
+            runtime = parallel_runtime(core.freq_array(vdd_), core.fnom, cnum,
+                                       self.caches.amat(cols, cnum), cols)
+            return core.perfnom / (suite.app_sum(cov * runtime) + noncov)
+
+        ret = optimize_operating_point(vdd, self.get_cnum_array(vdd), perf_func,
+                                       len(suite))
+        if ret is None:
+            raise HomogSysError('No feasible supply in {0}'.format(vdd))
+        if single:
+            return {'vdd': int(ret['vdd'][0]),
+                    'cnum': int(ret['cnum'][0]),
+                    'perf': ret['perf'][0]}
+        ret['names'] = suite.names
+        return ret
@@ -6,18 +6,25 @@ application model.
 """
 
 import logging
-from ..core import BaseCore
+from ..core import get_core
 PERF_BASE = 12.92
 from ..acc import ASAcc as Accelerator
 # from ..application import Application
 from lumos.settings import LUMOS_DEBUG
 from lumos import BraceMessage as _bm_
+from lumos.model.misc import LRUCache
+import heapq
 import math
+import numpy as np
 
 
 EPSILON = 1e-9   # small number to test float equivalence
 V_PRECISION = 1  # 1mV
 
+DIM_PERF_CACHE_SIZE = 4096      # max number of memoized dim-silicon optima
+DIM_PERF_POWER_QUANTUM = 1e-3   # power budgets are cached in quanta of 1mW
+SCHED_POWER_MIN = 0.1           # min power budget (W) to start a kernel
+
 __logger = None
 
 if LUMOS_DEBUG and ('all' in LUMOS_DEBUG or 'mpsoc' in LUMOS_DEBUG):
@@ -98,9 +105,14 @@ class MPSoC():
         if tput_core:
             self.thru_core = tput_core
         else:
-            self.thru_core = BaseCore(tech, 'cmos', 'hp', 'io')
+            self.thru_core = get_core(tech, 'cmos', 'hp', 'io')
 
         self.dim_perf = None
+        self._dim_perf_cache = LRUCache(DIM_PERF_CACHE_SIZE)
+
+        # supplies of cores, cores are shared by systems and do not keep them
+        self.thru_core_vdd = None
+        self.serial_core_vdd = None
 
         self.serial_core = serial_core
         if serial_core:
@@ -150,6 +162,7 @@ class MPSoC():
 
         # need to update dim_perf later
         self.dim_perf = None
+        self._dim_perf_cache.clear()
 
     def del_asic(self, acc_id):
         """ Remove an ASIC accelerator from the system, free its area to other
@@ -181,6 +194,7 @@ class MPSoC():
 
         # need to update dim_perf later
         self.dim_perf = None
+        self._dim_perf_cache.clear()
 
     def get_all_asics(self):
         """ Get all registered ASIC accelerators
@@ -245,6 +259,7 @@ class MPSoC():
 
     def instantiate(self):
         self._thru_core_num = int(self.thru_core_area / self.thru_core.area)
+        self._dim_perf_cache.clear()
         _debug(_bm_('Tput core: {0}, area: {1}, cnum: {2}',
                                  self.thru_core.ctype, self.thru_core.area, self._thru_core_num))
 
@@ -273,6 +288,7 @@ class MPSoC():
         self.gp_acc.config(area=area, tech=self.tech)
         # need to update dim_perf later
         self.dim_perf = None
+        self._dim_perf_cache.clear()
 
     def set_tech(self, tech):
         """ Set the technology node of all cores and ucores.
@@ -297,6 +313,7 @@ class MPSoC():
 
         # need to update dim_perf later
         self.dim_perf = None
+        self._dim_perf_cache.clear()
 
     def _dim_perf_cnum(self, cnum, vmin=None, power_budget=None):
         """Get the performance by given the active number of cores.
@@ -363,6 +380,17 @@ class MPSoC():
 
         return (perf_opt, vmin, power_eff)
 
+    def dim_perf_cache_info(self):
+        """Get statistics of the memoized dim-silicon optima
+
+        Returns
+        -------
+        dict
+          with keys of 'hits', 'misses', 'size' and 'maxsize'. Hit/miss
+          counters are kept when the cache is invalidated.
+        """
+        return self._dim_perf_cache.info()
+
     def _dim_perf_opt(self, power_budget=None, cnum_max=None):
         """Get the optimal performance of multicore, subjecting to power and area budget.
 
@@ -370,6 +398,14 @@ class MPSoC():
         system budget (e.g. power and area) may limit the throughput improvement.
         This method finds the optimal throughput-based performance.
 
+        Results are memoized in a bounded LRU cache, keyed on the throughput
+        core, `cnum_max`, and the power budget rounded down to a multiple of
+        DIM_PERF_POWER_QUANTUM. Optima are solved at the rounded budget, so
+        that all budgets within a quantum share the same answer, which never
+        takes more power than any of them. The cache is invalidated whenever the system
+        configuration changes, e.g. by :meth:`add_asic`, :meth:`set_tech`, or
+        :meth:`instantiate`.
+
         Parameters
         ----------
         power_budget : float
@@ -392,21 +428,49 @@ class MPSoC():
         if not cnum_max:
             cnum_max = int(self.sys_area / core.area)
 
+        if not power_budget:
+            power_budget = self.sys_power
+
+        # round down, so that the optimum fits in the given budget
+        power_quanta = int(math.floor(power_budget / DIM_PERF_POWER_QUANTUM))
+        if power_quanta * DIM_PERF_POWER_QUANTUM > power_budget:
+            # floating-point error of the division
+            power_quanta -= 1
+        key = (core.mnemonic, core.tech, cnum_max, power_quanta)
+        ret = self._dim_perf_cache.get(key)
+        if ret is None:
+            ret = self._dim_perf_opt_solve(power_quanta * DIM_PERF_POWER_QUANTUM,
+                                           cnum_max)
+            self._dim_perf_cache.put(key, ret)
+        return ret
+
+    def _dim_perf_opt_solve(self, power_budget, cnum_max):
+        """Solve the optimal performance of multicore without memoization,
+        see :meth:`_dim_perf_opt` for details."""
+        core = self.thru_core
         _debug(_bm_('power budget: {0}', power_budget))
-        perf_opt, vdd_opt, cnum_opt, power_eff = 0, 0, 0, 0
-        for cnum in range(1, cnum_max + 1):
-            perf_, vdd_, power_ = self._dim_perf_cnum(cnum, power_budget=power_budget)
-            if perf_ == 0:
-                # power budget is too small to power such many cores
-                break
-
-            if perf_ > perf_opt:
-                perf_opt = perf_
-                vdd_opt = vdd_
-                cnum_opt = cnum
-                power_eff = power_
-            _debug(_bm_('cnum: {0}, perf_opt: {1}, power_eff: {2}',
-                                     cnum, perf_opt, power_eff))
+
+        # evaluate all core counts at once: the highest per-core vdd within the
+        # per-core power budget, then pick the core count with the best
+        # throughput. A vdd of 0 means the power budget is too small to power
+        # such many cores, even at vmin.
+        cnum = np.arange(1, cnum_max + 1)
+        vdd = core.vdd_constrained_by_power(power_budget / cnum.astype(float))
+        feasible = vdd > 0
+        if not feasible.any():
+            return (0, 0, 0, 0)
+
+        cnum = cnum[feasible]
+        vdd = vdd[feasible]
+        perf = cnum * core.perf_by_vdd_array(vdd)
+        idx = np.argmax(perf)
+
+        perf_opt = perf[idx]
+        vdd_opt = int(vdd[idx])
+        cnum_opt = int(cnum[idx])
+        power_eff = cnum_opt * core.power(vdd_opt)
+        _debug(_bm_('cnum: {0}, perf_opt: {1}, power_eff: {2}',
+                    cnum_opt, perf_opt, power_eff))
         return (perf_opt, vdd_opt, cnum_opt, power_eff)
 
     # def _calc_dim_perf(self, thru_core_power=None, thru_core_area=None):
@@ -539,6 +603,176 @@ class MPSoC():
         _debug(_bm_('baseline: {0}, bench: {1}', baseline, finish))
         return baseline / finish
 
+    def _sched_kernel(self, appdag, kernel_idx, power_budget, cnum_max):
+        """Get the run time of a kernel started with the given power budget
+        and free throughput cores, see :meth:`schedule_appdag`.
+
+        Returns
+        -------
+        (runtime, power, cnum, asacc)
+          The run time, the power and the number of throughput cores
+          reserved, and the ASIC in use (None on throughput cores). None if
+          the kernel can not start.
+        """
+        kl = appdag.get_kernel_length(kernel_idx)
+        ko = appdag.get_kernel(kernel_idx)
+        if self.has_asacc(ko.name):
+            asacc = self.get_asacc(ko.name)
+            asacc_su = asacc.perf(power=power_budget) / PERF_BASE
+            return (kl / asacc_su, asacc.power_eff, 0, asacc)
+
+        if cnum_max < 1:
+            return None
+        if ko.pf == 0:
+            # serial kernels run on a single core
+            cnum_max = 1
+        perf_, vdd_, cnum_, power_eff = self._dim_perf_opt(
+            power_budget=power_budget, cnum_max=cnum_max)
+        if power_eff == 0:
+            # power budget is too small
+            return None
+        thru_su = perf_ / PERF_BASE
+        serial_su = self.thru_core.perf_by_vdd(vdd_) / PERF_BASE
+        rt = kl * (1 - ko.pf) / serial_su + kl * ko.pf / thru_su
+        return (rt, power_eff, cnum_, None)
+
+    def schedule_appdag(self, appdag):
+        """Schedule kernels of an :class:`~lumos.model.AppDAG` application
+        with an event-driven list scheduler.
+
+        Ready kernels are kept in a priority queue, ordered by their critical
+        path to the end of the DAG (upward rank), with kernel run times
+        estimated on the whole system. Whenever a kernel finishes, ready
+        kernels are started in priority order as long as resources allow:
+        each ASIC runs one kernel at a time, kernels without an ASIC take
+        free throughput cores, and every running kernel reserves its
+        effective power from the system power budget until it finishes.
+        Kernels are never started with less than SCHED_POWER_MIN of power.
+
+        Parameters
+        ----------
+        appdag : :class:`~lumos.model.AppDAG`
+          The target application
+
+        Returns
+        -------
+        dict: results wrapped in a python dict with keys:
+
+        makespan : float
+          The finish time of the last kernel.
+        start, finish : list of float
+          The start and finish time of each kernel, indexed by kernel index.
+        power, cnum : list
+          The power and the number of throughput cores reserved by each kernel.
+
+        Raises
+        ------
+        MPSoCError
+          Ready kernels can not start, even with the whole system idle.
+        """
+        kernels = appdag.get_all_kernels()
+        nkernels = len(kernels)
+        cnum_total = int(self.thru_core_area / self.thru_core.area)
+
+        # upward rank: the estimated critical path to the end of the DAG
+        rank = [0] * nkernels
+        for idx in reversed(appdag.kernels_topo_sort()):
+            est = self._sched_kernel(appdag, idx, self.sys_power, cnum_total)
+            if est is None:
+                raise MPSoCError('kernel {0} can not run on the system'.format(idx))
+            succ = appdag.get_successor_kernels(idx)
+            rank[idx] = est[0] + max([rank[s_] for s_ in succ] or [0])
+
+        npreds = [len(appdag.get_precedent_kernel(idx)) for idx in kernels]
+        ready = [(-rank[idx], idx) for idx in kernels if npreds[idx] == 0]
+        heapq.heapify(ready)
+
+        start = [None] * nkernels
+        finish = [None] * nkernels
+        power = [0] * nkernels
+        cnum = [0] * nkernels
+        # running kernels as (finish time, kernel index, asic)
+        running = []
+        busy_asics = set()
+        power_avail = self.sys_power
+        cnum_free = cnum_total
+        now = 0
+        while ready or running:
+            deferred = []
+            while ready and power_avail >= SCHED_POWER_MIN:
+                item = heapq.heappop(ready)
+                idx = item[1]
+                ko = appdag.get_kernel(idx)
+                if self.has_asacc(ko.name) and ko.name in busy_asics:
+                    deferred.append(item)
+                    continue
+                ret = self._sched_kernel(appdag, idx, power_avail, cnum_free)
+                if ret is None:
+                    deferred.append(item)
+                    continue
+                rt, power_eff, cnum_, asacc = ret
+                start[idx], finish[idx] = now, now + rt
+                power[idx], cnum[idx] = power_eff, cnum_
+                power_avail -= power_eff
+                cnum_free -= cnum_
+                if asacc is not None:
+                    busy_asics.add(ko.name)
+                heapq.heappush(running, (finish[idx], idx, asacc))
+                _debug(_bm_('schedule_appdag: kernel {0} at {1}, runtime {2}, '
+                            'power {3}, cnum {4}', idx, now, rt, power_eff, cnum_))
+            for item in deferred:
+                heapq.heappush(ready, item)
+
+            if not running:
+                raise MPSoCError('kernels {0} can not start on an idle system'.format(
+                    sorted(idx for _, idx in ready)))
+
+            # release resources of all kernels finishing next
+            now = running[0][0]
+            while running and running[0][0] <= now + EPSILON:
+                _, idx, asacc = heapq.heappop(running)
+                power_avail += power[idx]
+                cnum_free += cnum[idx]
+                if asacc is not None:
+                    busy_asics.discard(appdag.get_kernel(idx).name)
+                for s_ in appdag.get_successor_kernels(idx):
+                    npreds[s_] -= 1
+                    if npreds[s_] == 0:
+                        heapq.heappush(ready, (-rank[s_], s_))
+            # avoid drifting away after many reservations
+            if not running:
+                power_avail = self.sys_power
+
+        return {'makespan': max(finish) if finish else 0,
+                'start': start,
+                'finish': finish,
+                'power': power,
+                'cnum': cnum}
+
+    def get_speedup_appdag_list(self, appdag):
+        """Get the performance of the system, on an :class:`~lumos.model.AppDAG`
+        application, kernels are scheduled by :meth:`schedule_appdag`.
+
+        Unlike :meth:`get_speedup_appdag_parallel_greedy`, a kernel starts
+        as soon as its precedent kernels finish and resources are available,
+        rather than waiting for all kernels of the previous depth.
+
+        Parameters
+        ----------
+        appdag : :class:`~lumos.model.AppDAG`
+          The target application
+
+        Returns
+        -------
+        float
+          speedup relative to running all kernels at the baseline performance.
+
+        """
+        baseline = sum(appdag.get_all_kernel_lengths())
+        makespan = self.schedule_appdag(appdag)['makespan']
+        _debug(_bm_('baseline: {0}, bench: {1}', baseline, makespan))
+        return baseline / makespan
+
     def get_speedup_appdag_serial(self, appdag):
         """Get the performance of the system, on an :class:`~lumos.model.AppDAG`
         application, all kernels are processed in serial.
@@ -701,11 +935,13 @@ class MPSoC():
     #     return (1 / perf, self.opt_cnum, self.opt_vdd)
 
     def change_serial_core_vdd(self, vdd_mv):
+        """change supply voltage of the serial core"""
         if self.serial_core:
-            self.serial_core.vdd = vdd_mv
+            self.serial_core_vdd = vdd_mv
 
     def change_tput_core_vdd(self, vdd_mv):
-        self.tput_core.vdd = vdd_mv
+        """change supply voltage of throughput cores"""
+        self.thru_core_vdd = vdd_mv
 
     def change_asic_vdd(self, acc_id, vdd_mv):
         """change supply voltage of an ASIC accelerator"""
@@ -1,17 +1,22 @@
 #!/usr/bin/env python
 
-from .cmos import CMOSTechModel
-from .tfet import TFETTechModel
-from .finfet import FinFETTechModel
 from .base import TechModelError
+import importlib
+
+# model name -> (sub-package, class of the tech model), imported on first use,
+# so that only the requested model is loaded
+_MODELS = {
+    'cmos': ('.cmos', 'CMOSTechModel'),
+    'tfet': ('.tfet', 'TFETTechModel'),
+    'finfet': ('.finfet', 'FinFETTechModel'),
+}
 
 
 def get_model(name, variant):
-    if name == 'cmos':
-        return CMOSTechModel(variant)
-    elif name == 'tfet':
-        return TFETTechModel(variant)
-    elif name == 'finfet':
-        return FinFETTechModel(variant)
-    else:
+    try:
+        pkg, cls = _MODELS[name]
+    except KeyError:
         raise TechModelError("Unknown model name: {0}".format(name))
+
+    module = importlib.import_module(pkg, __name__)
+    return getattr(module, cls)(variant)
@@ -1,12 +1,20 @@
 #!/usr/bin/env python
 
 import abc
+import numpy as np
 
 
 class TechModelError(Exception):
     pass
 
 
+from .store import TechArrays
+
+# normalized TechArrays, indexed by (mnemonic, tech node), shared by all
+# instances of the same tech model
+_normalized_arrays = dict()
+
+
 class BaseTechModel(object):
     __metaclass__ = abc.ABCMeta
 
@@ -14,9 +22,8 @@ class BaseTechModel(object):
         self._name = name
         self._variant = variant
 
-        self._freq_dict = _tech_model.freq_dict
-        self._dynamic_power_dict = _tech_model.dynamic_power_dict
-        self._static_power_dict = _tech_model.static_power_dict
+        # TechArrays of each tech node, memory-mapped from the tech model store
+        self._model_arrays = _tech_model.model_arrays
         self.vnom_dict = _tech_model.vnom_dict
         self.area_scale = _tech_model.area_scale
         self.dynamic_power_scale = _tech_model.dp_scale
@@ -32,10 +39,67 @@ class BaseTechModel(object):
     def mnemonic(self):
         return '{0}-{1}'.format(self._name, self._variant)
 
+    def _normalized(self, tech):
+        """Get :class:`TechArrays` of the tech node, normalized to the values
+        at the nominal supply, or raise KeyError if not available."""
+        key = (self.mnemonic, tech)
+        try:
+            return _normalized_arrays[key]
+        except KeyError:
+            pass
+
+        model = self._model_arrays[tech]
+        idx_nom = self.vnom(tech) - model.vmin
+        if idx_nom < 0 or idx_nom > model.vmax - model.vmin:
+            raise KeyError(tech)
+        normalized = TechArrays(model.vmin, model.vmax,
+                                model.freq / model.freq[idx_nom],
+                                model.dp / model.dp[idx_nom],
+                                model.sp / model.sp[idx_nom])
+        _normalized_arrays[key] = normalized
+        return normalized
+
+    def _scale(self, tech, vdd_mv, name):
+        model = self._normalized(tech)
+        idx = int(vdd_mv) - model.vmin
+        if idx != vdd_mv - model.vmin or idx < 0 or vdd_mv > model.vmax:
+            raise KeyError(vdd_mv)
+        return getattr(model, name)[idx]
+
+    def _scale_array(self, tech, vdd_mv, name):
+        model = self._normalized(tech)
+        vdd_mv = np.asarray(vdd_mv)
+        idx = vdd_mv.astype(np.int64) - model.vmin
+        if vdd_mv.size and (np.any(idx != vdd_mv - model.vmin) or
+                            idx.min() < 0 or vdd_mv.max() > model.vmax):
+            raise KeyError(vdd_mv)
+        return getattr(model, name)[idx]
+
     def dynamic_power(self, tech, vdd_mv, **kwargs):
         try:
-            vdd_scale = self._dynamic_power_dict[tech][vdd_mv] / \
-                self._dynamic_power_dict[tech][self.vnom(tech)]
+            vdd_scale = self._scale(tech, vdd_mv, 'dp')
+        except KeyError:
+            raise TechModelError('No dynamic power for Vdd: {0}mV at {1}nm'.format(vdd_mv, tech))
+
+        return vdd_scale
+
+    def dynamic_power_array(self, tech, vdd_mv, **kwargs):
+        """Vectorized :meth:`dynamic_power`
+
+        Parameters
+        ----------
+        tech : int
+          technology node
+        vdd_mv : array of int
+          supply voltages in mV
+
+        Returns
+        -------
+        array
+          dynamic power scales relative to the nominal supply
+        """
+        try:
+            vdd_scale = self._scale_array(tech, vdd_mv, 'dp')
         except KeyError:
             raise TechModelError('No dynamic power for Vdd: {0}mV at {1}nm'.format(vdd_mv, tech))
 
@@ -43,8 +107,16 @@ class BaseTechModel(object):
 
     def static_power(self, tech, vdd_mv, **kwargs):
         try:
-            vdd_scale = self._static_power_dict[tech][vdd_mv] / \
-                self._static_power_dict[tech][self.vnom(tech)]
+            vdd_scale = self._scale(tech, vdd_mv, 'sp')
+        except KeyError:
+            raise TechModelError('No static power for Vdd: {0}mV at {1}nm'.format(vdd_mv, tech))
+
+        return vdd_scale
+
+    def static_power_array(self, tech, vdd_mv, **kwargs):
+        """Vectorized :meth:`static_power`, see :meth:`dynamic_power_array`"""
+        try:
+            vdd_scale = self._scale_array(tech, vdd_mv, 'sp')
         except KeyError:
             raise TechModelError('No static power for Vdd: {0}mV at {1}nm'.format(vdd_mv, tech))
 
@@ -55,8 +127,16 @@ class BaseTechModel(object):
 
     def freq(self, tech, vdd_mv, **kwargs):
         try:
-            vdd_scale = self._freq_dict[tech][vdd_mv] / \
-                self._freq_dict[tech][self.vnom(tech)]
+            vdd_scale = self._scale(tech, vdd_mv, 'freq')
+        except KeyError:
+            raise TechModelError('No freq for Vdd: {0}mV at {1}nm'.format(vdd_mv, tech))
+
+        return vdd_scale
+
+    def freq_array(self, tech, vdd_mv, **kwargs):
+        """Vectorized :meth:`freq`, see :meth:`dynamic_power_array`"""
+        try:
+            vdd_scale = self._scale_array(tech, vdd_mv, 'freq')
         except KeyError:
             raise TechModelError('No freq for Vdd: {0}mV at {1}nm'.format(vdd_mv, tech))
 
@@ -70,7 +150,7 @@ class BaseTechModel(object):
             return self._vmin
         except AttributeError:
             try:
-                self._vmin = min(self._freq_dict[tech].keys())
+                self._vmin = self._model_arrays[tech].vmin
             except KeyError:
                 raise TechModelError('No freq for tech node at {0}nm'.format(tech))
             return self._vmin
@@ -80,7 +160,7 @@ class BaseTechModel(object):
             return self._vmax
         except AttributeError:
             try:
-                self._vmax = max(self._freq_dict[tech].keys())
+                self._vmax = self._model_arrays[tech].vmax
             except KeyError:
                 raise TechModelError('No freq for tech node at {0}nm'.format(tech))
             return self._vmax
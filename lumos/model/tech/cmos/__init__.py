@@ -1,17 +1,21 @@
 #!/usr/bin/env python
 
 from ..base import TechModelError, BaseTechModel
-from . import hp as cmos_hp
-from . import lp as cmos_lp
+import importlib
+
+# variant -> sub-package of its models, imported on first use
+_VARIANTS = {
+    'hp': '.hp',
+    'lp': '.lp',
+}
 
 
 class CMOSTechModel(BaseTechModel):
     def __init__(self, variant):
-        if variant == 'hp':
-            tech = cmos_hp
-        elif variant == 'lp':
-            tech = cmos_lp
-        else:
+        try:
+            pkg = _VARIANTS[variant]
+        except KeyError:
             raise TechModelError('CMOS tech model does not have variant of: {0}'.format(variant))
+        tech = importlib.import_module(pkg, __name__)
 
         super(CMOSTechModel, self).__init__('cmos', variant, tech)
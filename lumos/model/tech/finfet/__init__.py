@@ -2,17 +2,21 @@
 
 from lumos import settings
 from ..base import TechModelError, BaseTechModel
-from . import hp as finfet_hp
-from . import lstp as finfet_lp
+import importlib
+
+# variant -> sub-package of its models, imported on first use
+_VARIANTS = {
+    'hp': '.hp',
+    'lp': '.lstp',
+}
 
 
 class FinFETTechModel(BaseTechModel):
     def __init__(self, variant):
-        if variant == 'hp':
-            tech = finfet_hp
-        elif variant == 'lp':
-            tech = finfet_lp
-        else:
+        try:
+            pkg = _VARIANTS[variant]
+        except KeyError:
             raise TechModelError('FinFET model does not have the variant: {0}'.format(variant))
+        tech = importlib.import_module(pkg, __name__)
 
         super(FinFETTechModel, self).__init__('finfet', variant, tech)
@@ -0,0 +1,398 @@
+#!/usr/bin/env python
+"""
+A compact binary store of technology models.
+
+Technology models are characterized by circuit simulations at a few supply
+voltages (the `*.data` CSV files), and interpolated to every millivolt. All
+interpolated models are compiled into a single binary file, which is opened
+with :func:`numpy.memmap`, so that loading a model does not need pandas or
+scipy, and all processes share the same pages.
+
+The file is laid out as::
+
+    magic (8 bytes) | header length (uint64) | JSON header | float64 data
+
+For each model, the data section holds three contiguous float64 arrays
+(frequency, dynamic power, static power), indexed by (vdd_mv - vmin). The
+header records the offset, vdd range, and the source file mtime of each
+model. Models are keyed by the path of their source file relative to the
+tech model directory, without the extension, e.g. 'cmos/hp/rca32_hp_22'.
+
+The default store lives in LUMOS_CACHE_DIR, as the package directory may be
+read-only. Writers serialize on a lock file next to the store, and merge
+models written by others in the meantime. A store which can not be read is
+treated as empty, and rebuilt on the next update.
+"""
+
+import logging
+from lumos.settings import LUMOS_DEBUG, LUMOS_CACHE_DIR
+from lumos import BraceMessage as _bm_
+from collections import namedtuple
+import json
+import os
+import re
+import struct
+import tempfile
+import numpy as np
+try:
+    import fcntl
+except ImportError:
+    # no advisory locks, e.g. on Windows
+    fcntl = None
+from .base import TechModelError
+
+
+__logger = None
+
+if LUMOS_DEBUG and ('all' in LUMOS_DEBUG or 'techstore' in LUMOS_DEBUG):
+    _debug_enabled = True
+else:
+    _debug_enabled = False
+
+def _debug(brace_msg):
+    global __logger
+    if not _debug_enabled:
+        return
+
+    if not __logger:
+        __logger = logging.getLogger('TechStore')
+        __logger.setLevel(logging.DEBUG)
+
+    __logger.debug(brace_msg)
+
+
+_TECH_DIR = os.path.dirname(os.path.abspath(__file__))
+STORE_FILE = os.path.join(LUMOS_CACHE_DIR, 'tech_models.bin')
+
+_MAGIC = b'LUMOSTM1'
+_DTYPE = np.dtype('<f8')
+_PREFIX = struct.Struct('<8sQ')
+
+_tech_node_re = re.compile(r'[a-zA-Z0-9]+_[a-zA-Z0-9]+_(\d+).data')
+
+
+# interpolated model of a technology node, arrays are indexed by (vdd_mv - vmin)
+TechArrays = namedtuple('TechArrays', ['vmin', 'vmax', 'freq', 'dp', 'sp'])
+
+
+def get_tech_node(model_file):
+    fname = os.path.basename(model_file)
+    mo = _tech_node_re.search(fname)
+    if mo:
+        return int(mo.group(1))
+    else:
+        raise TechModelError('no technology node from the name of {0}'.format(model_file))
+
+
+def model_key(model_file):
+    """Get the key of a model file in the store, e.g. 'cmos/hp/rca32_hp_22'"""
+    rel = os.path.relpath(os.path.abspath(model_file), _TECH_DIR)
+    return os.path.splitext(rel)[0].replace(os.sep, '/')
+
+
+def interp_model_file(model_file):
+    """Interpolate a model file to every millivolt.
+
+    This is the only place that needs pandas and scipy, which are
+    imported on demand.
+
+    Parameters
+    ----------
+    model_file : str
+      Path to a CSV file with the columns of vdd (in V), delay, dp and sp.
+
+    Returns
+    -------
+    :class:`TechArrays`
+    """
+    from scipy.interpolate import interp1d as scipy_interp
+    import pandas as pd
+
+    try:
+        df = pd.read_csv(model_file, index_col='vdd')
+    except OSError:
+        raise TechModelError('Model file {0} not found'.format(model_file))
+    except ValueError:
+        raise TechModelError('Wrong format, missing "vdd" column in {0}'.format(model_file))
+    df.sort_index(inplace=True)
+
+    vdd_to_interp = df.index.values
+    dp_to_interp = df['dp'].values
+    sp_to_interp = df['sp'].values
+    freq_to_interp = (1/df['delay']).values
+
+    vmin = int(min(df.index) * 1000)
+    vmax = int(max(df.index) * 1000)
+    vdd_mv_np = np.arange(vmin, vmax+1)
+    vdd_np = np.array([(float(v)/1000) for v in vdd_mv_np])
+
+    model = scipy_interp(vdd_to_interp, freq_to_interp, kind=6)
+    freq_np = model(vdd_np)
+
+    model = scipy_interp(vdd_to_interp, dp_to_interp, kind=6)
+    dp_np = model(vdd_np)
+
+    model = scipy_interp(vdd_to_interp, sp_to_interp, kind='linear')
+    sp_np = model(vdd_np)
+
+    return TechArrays(vmin, vmax, freq_np, dp_np, sp_np)
+
+
+class TechModelStore(object):
+    """A memory-mapped store of interpolated technology models.
+
+    Parameters
+    ----------
+    path : str
+      The path to the store file. It will be created, or updated, when a
+      model is found missing or out-of-date.
+    """
+    def __init__(self, path=STORE_FILE):
+        self.path = path
+        self._index = dict()
+        self._data = None
+        self._open()
+
+    def _open(self):
+        self._index = dict()
+        self._data = None
+        try:
+            with open(self.path, 'rb') as f:
+                magic, hlen = _PREFIX.unpack(f.read(_PREFIX.size))
+                if magic != _MAGIC:
+                    raise ValueError('bad magic {0!r}'.format(magic))
+                header = json.loads(f.read(hlen).decode('utf-8'))
+                index = header['models']
+                data_offset = _PREFIX.size + hlen
+                if os.fstat(f.fileno()).st_size > data_offset:
+                    data = np.memmap(f, dtype=_DTYPE, mode='r', offset=data_offset)
+                else:
+                    data = np.zeros(0, dtype=_DTYPE)
+        except (OSError, IOError):
+            # not built yet
+            return
+        except (struct.error, ValueError, KeyError, TypeError) as e:
+            # ValueError covers bad JSON and bad UTF-8, the store will be
+            # rebuilt on the next update
+            _debug(_bm_('{0} is corrupt ({1}), treated as empty', self.path, e))
+            return
+
+        self._index = index
+        self._data = data
+        _debug(_bm_('opened {0} with {1} models', self.path, len(self._index)))
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def keys(self):
+        return self._index.keys()
+
+    def get(self, key):
+        """Get the model by its key
+
+        Returns
+        -------
+        :class:`TechArrays`
+          arrays are read-only views into the memory-mapped store
+
+        Raises
+        ------
+        KeyError
+          The model is not in the store
+        """
+        entry = self._index[key]
+        vmin = entry['vmin']
+        vmax = entry['vmax']
+        n = vmax - vmin + 1
+        start = entry['offset']
+        arrays = self._data[start:start+3*n].reshape(3, n)
+        return TechArrays(vmin, vmax, arrays[0], arrays[1], arrays[2])
+
+    def is_fresh(self, model_file):
+        """Whether the model of model_file is in the store and up-to-date"""
+        entry = self._index.get(model_key(model_file))
+        if entry is None:
+            return False
+        return entry['mtime'] == os.path.getmtime(model_file)
+
+    def _lock(self):
+        """Open and lock the lock file of the store, return its file object"""
+        lock_file = open(self.path + '.lock', 'a')
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        return lock_file
+
+    def update(self, model_files):
+        """Build models of model_files which are missing or out-of-date,
+        and write the store.
+
+        Models already in the store are kept, including those written by
+        other processes since the store was opened. Writers hold a lock
+        file, and the store file is replaced atomically, so that concurrent
+        readers always see a complete store.
+
+        Returns
+        -------
+        dict
+          :class:`TechArrays` of model_files, indexed by their keys. Models
+          are kept in memory if the store can not be written.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            lock_file = self._lock()
+        except (OSError, IOError) as e:
+            _debug(_bm_('can not lock {0}: {1}', self.path, e))
+            return self._compile(model_files)[0]
+
+        try:
+            # re-read the store, others may have written it meanwhile
+            self._open()
+            stale = [f for f in model_files if not self.is_fresh(f)]
+            built, mtimes = self._compile(stale)
+            models = dict()
+            for key in self._index:
+                models[key] = self.get(key)
+                mtimes.setdefault(key, self._index[key]['mtime'])
+            models.update(built)
+            try:
+                self._write(models, mtimes)
+            except (OSError, IOError) as e:
+                _debug(_bm_('can not write {0}: {1}', self.path, e))
+                return built
+        finally:
+            lock_file.close()
+
+        # drop the old mapping before re-opening
+        self._data = None
+        self._open()
+        return dict((model_key(f), self.get(model_key(f))) for f in model_files)
+
+    def _compile(self, model_files):
+        models = dict()
+        mtimes = dict()
+        for model_file in model_files:
+            _debug(_bm_('compile model {0}', model_file))
+            key = model_key(model_file)
+            models[key] = interp_model_file(model_file)
+            mtimes[key] = os.path.getmtime(model_file)
+        return models, mtimes
+
+    def _write(self, models, mtimes):
+        index = dict()
+        offset = 0
+        for key in sorted(models):
+            m = models[key]
+            index[key] = {
+                'tech': get_tech_node(key + '.data'),
+                'vmin': m.vmin,
+                'vmax': m.vmax,
+                'offset': offset,
+                'mtime': mtimes[key],
+            }
+            offset += 3 * (m.vmax - m.vmin + 1)
+
+        header = json.dumps({'version': 1, 'models': index},
+                            sort_keys=True).encode('utf-8')
+        # pad to keep float64 data aligned
+        header += b' ' * (-(_PREFIX.size + len(header)) % _DTYPE.itemsize)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_PREFIX.pack(_MAGIC, len(header)))
+                f.write(header)
+                for key in sorted(models):
+                    m = models[key]
+                    for arr in (m.freq, m.dp, m.sp):
+                        f.write(np.ascontiguousarray(arr, dtype=_DTYPE).tobytes())
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def load(self, model_files):
+        """Load models from model_files, compile them if necessary
+
+        Returns
+        -------
+        dict
+          :class:`TechArrays` of each model, indexed by the tech node
+        """
+        models = dict()
+        if not all(self.is_fresh(f) for f in model_files):
+            # another process may have replaced the store, re-open it
+            self._open()
+        stale = [f for f in model_files if not self.is_fresh(f)]
+        if stale:
+            models = self.update(stale)
+
+        ret = dict()
+        for f in model_files:
+            key = model_key(f)
+            ret[get_tech_node(f)] = models[key] if key in models else self.get(key)
+        return ret
+
+
+class LazyTechArrays(dict):
+    """:class:`TechArrays` indexed by the tech node, each is loaded from the
+    store when it is first used.
+
+    Parameters
+    ----------
+    model_dir : str
+      The directory of model files of a tech variant
+    circuit : str
+      The simulated circuit, e.g. 'rca32'
+    model_name : str
+      The name of the tech variant, e.g. 'hp'
+    """
+    def __init__(self, model_dir, circuit, model_name):
+        super(LazyTechArrays, self).__init__()
+        self.model_dir = model_dir
+        self.circuit = circuit
+        self.model_name = model_name
+
+    def model_file(self, tech):
+        return os.path.join(self.model_dir, '{0}_{1}_{2}.data'.format(
+            self.circuit, self.model_name, tech))
+
+    def __contains__(self, tech):
+        return (super(LazyTechArrays, self).__contains__(tech) or
+                os.path.exists(self.model_file(tech)))
+
+    def __missing__(self, tech):
+        model_file = self.model_file(tech)
+        if not os.path.exists(model_file):
+            raise KeyError(tech)
+        _debug(_bm_('load model {0}', model_file))
+        arrays = get_store().load([model_file])[tech]
+        self[tech] = arrays
+        return arrays
+
+
+_store = None
+
+
+def get_store():
+    """Get the shared store of the default location"""
+    global _store
+    if _store is None:
+        _store = TechModelStore()
+    return _store
+
+
+if __name__ == '__main__':
+    # compile all models of the configured circuits
+    import glob
+    from lumos import settings
+    circuits = {'cmos': settings.CMOS_SIM_CIRCUIT,
+                'finfet': settings.FINFET_SIM_CIRCUIT,
+                'tfet': settings.TFET_SIM_CIRCUIT}
+    model_files = []
+    for name, circuit in circuits.items():
+        model_files.extend(glob.glob(os.path.join(
+            _TECH_DIR, name, '*', '{0}_*.data'.format(circuit))))
+    TechModelStore().update(model_files)
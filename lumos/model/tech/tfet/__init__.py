@@ -1,17 +1,21 @@
 #!/usr/bin/env python
 
 from ..base import TechModelError, BaseTechModel
-from . import homoTFET30nm as tfet_30nm
-from . import homoTFET60nm as tfet_60nm
+import importlib
+
+# variant -> sub-package of its models, imported on first use
+_VARIANTS = {
+    'homo30nm': '.homoTFET30nm',
+    'homo60nm': '.homoTFET60nm',
+}
 
 
 class TFETTechModel(BaseTechModel):
     def __init__(self, variant):
-        if variant == 'homo30nm':
-            tech = tfet_30nm
-        elif variant == 'homo60nm':
-            tech = tfet_60nm
-        else:
+        try:
+            pkg = _VARIANTS[variant]
+        except KeyError:
             raise TechModelError('TFET tech model does not have the variant: {0}'.format(variant))
+        tech = importlib.import_module(pkg, __name__)
 
         super(TFETTechModel, self).__init__('tfet', variant, tech)
@@ -5,9 +5,15 @@ from .kernel import load_suite_xmltree as load_kernels_xmltree
 from .application import SimpleApp, DetailedApp, LinearApp, DAGApp
 from .application import load_suite_xmlfile as load_apps_xmlfile
 from .application import load_suite_xmltree as load_apps_xmltree
+from .compiled import WorkloadError, WorkloadCacheError
+from .compiled import CompiledWorkload, XMLWorkload, compile_workload, open_workload
+from .compiled import iterparse_kernels, iterparse_apps
+from .compiled import load_cached, save_cached, cache_dir_of
+from .packed import PackedSuite, pack_apps
+from ..misc import file_digest
 
 
-def load_kernels_and_apps(xmlfile):
+def load_kernels_and_apps(xmlfile, cache=None):
     """Load kernels and applications from an XML file.
 
     Parameters
@@ -15,6 +21,14 @@ def load_kernels_and_apps(xmlfile):
     xmlfile : filepath
       The file to be loaded, in XML format. The suite includes two
       section: kernels and applications.
+    cache : bool, str, or None
+      Whether to use the compiled workload cache, or the directory of the
+      cache. The XML file is compiled on the first load, and later loads of
+      the same content read the compiled file instead, see
+      :mod:`~lumos.model.workload.compiled`. By default, the cache is used
+      only if LUMOS_CACHE_DIR is set, see
+      :func:`~lumos.model.workload.compiled.cache_dir_of`. Failures of
+      writing the cache are ignored.
 
     Returns
     -------
@@ -29,6 +43,14 @@ def load_kernels_and_apps(xmlfile):
     KernelError: if parameters is not float
 
     """
+    digest = None
+    cache_dir = cache_dir_of(cache)
+    if cache_dir is not None and isinstance(xmlfile, str):
+        digest = file_digest(xmlfile)
+        kernels, applications = load_cached(digest, cache_dir)
+        if kernels is not None:
+            return kernels, applications
+
     tree = etree.parse(xmlfile)
 
     ktree = tree.find('kernels')
@@ -43,4 +65,45 @@ def load_kernels_and_apps(xmlfile):
         return None, None
     applications = load_apps_xmltree(atree, kernels)
 
+    if digest:
+        save_cached(digest, atree.get('type') or 'simple', kernels,
+                    applications.values(), cache_dir)
+
     return kernels, applications
+
+
+def iter_apps(xmlfile, batch_size=None, cache=None):
+    """Load applications from an XML file one by one, or in batches.
+
+    Unlike :func:`load_kernels_and_apps`, applications are not kept after
+    being yielded, so that the memory is bounded by the batch size rather
+    than the size of the suite. Kernels are loaded once and shared by all
+    applications, they can also be accessed by :func:`open_workload`.
+
+    Parameters
+    ----------
+    xmlfile : filepath
+      The workload file.
+    batch_size : int
+      If given, applications are yielded in lists of batch_size, the last
+      one may be shorter.
+    cache : bool or str
+      Whether to use the compiled workload cache, or the directory of the
+      cache, see :func:`open_workload`.
+
+    Returns
+    -------
+    generator
+      of application objects, or lists of them, in the order of the XML
+      file. They can be passed to performance models as they are, e.g.
+      :meth:`~lumos.model.system.hetero.HeterogSysDetailed.perf`.
+
+    Examples
+    --------
+    >>> for app in iter_apps('syn.xml'):
+    ...     perf = sys.perf(650, app)
+    """
+    workload = open_workload(xmlfile, cache)
+    if batch_size is None:
+        return workload.iter_apps()
+    return workload.iter_batches(batch_size)
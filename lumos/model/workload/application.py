@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 import abc
 import logging
-from igraph import Graph, IN as GRAPH_IN
+from array import array
+from collections import deque
 from lxml import etree
+import numpy as np
 from lumos.settings import LUMOS_DEBUG
 from lumos import BraceMessage as _bm_
 
@@ -74,12 +76,23 @@ class SpreadApp(BaseApp):
         pass
 
 
+def _csr(rows, cols, nrows):
+    """Build a CSR (indptr, indices) adjacency from (rows, cols) pairs,
+    indices of a row are in ascending order."""
+    order = np.lexsort((cols, rows))
+    indptr = np.zeros(nrows + 1, dtype=np.intp)
+    indptr[1:] = np.cumsum(np.bincount(rows, minlength=nrows))
+    return indptr, cols[order]
+
+
 class DAGApp(BaseApp):
     """An application modeled as a directed acyclic graph (DAG)
 
     An application is DAG of tasks/kernels. Kernels are referred by a
     handler, called `kernel index`. Internally, the kernel index is the
-    node index in the DAG (represented using `igraph` library).
+    node index in the DAG. Edges are stored in compact arrays, and the
+    adjacency is derived from them on demand, see :meth:`to_igraph` to
+    export the DAG to `igraph`.
 
     Attributes
     ----------
@@ -87,15 +100,31 @@ class DAGApp(BaseApp):
       The name of an application
     """
 
+    # attributes derived from edges, they are rebuilt on demand
+    _DERIVED_ATTRS = ('_pred_indptr', '_pred_indices', '_succ_indptr',
+                      '_succ_indices', '_depth_sorted', '_lengths',
+                      '_baseline_runtime')
+
     def __init__(self, name):
-        self._g = Graph(directed=True)
-        self._kernels = dict()
-        self._length = dict()
+        self._kernels = []
+        self._length = array('d')
+        self._depth = array('i')
+        self._edges_from = array('i')
+        self._edges_to = array('i')
         self._max_depth = -1
         self._num_kernels = 0
+        # structure arrays, built by _prep_structure
+        self._levels = None
 
         super().__init__(name, 'dag')
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self._DERIVED_ATTRS:
+            state.pop(name, None)
+        state['_levels'] = None
+        return state
+
     @classmethod
     def load_from_xmltree(cls, xmltree, kernels):
         """load an application from an XML tree node
@@ -157,7 +186,7 @@ class DAGApp(BaseApp):
         return self._max_depth
 
     def get_all_kernel_lengths(self):
-        return [self._length[idx_] for idx_ in self._g.vs.indices]
+        return list(self._length)
 
     def get_kernel_length(self, kernel_idx):
         """Get the length of a kernel, indicated by kernel_idx
@@ -190,11 +219,13 @@ class DAGApp(BaseApp):
         int
           kernel index
         """
-        kernel_idx = self._g.vcount()
-        self._g.add_vertex(name=kerobj.name, depth=1)
-        self._kernels[kernel_idx] = kerobj
-        self._length[kernel_idx] = len_
+        kernel_idx = self._num_kernels
+        self._kernels.append(kerobj)
+        self._length.append(len_)
+        self._depth.append(1)
         self._num_kernels += 1
+        self._max_depth = max(1, self._max_depth)
+        self._levels = None
         return kernel_idx
 
     def _add_dependence(self, from_, to_):
@@ -206,10 +237,14 @@ class DAGApp(BaseApp):
           Precedent kernel (from\_) and the dependent kernel (to\_)
           expressed by kernel index
         """
-        self._g.add_edge(from_, to_)
-        self._g.vs[to_]['depth'] = max(self._g.vs[from_]['depth'] + 1,
-                                       self._g.vs[to_]['depth'])
-        self._max_depth = max(self._g.vs[to_]['depth'], self._max_depth)
+        for idx_ in (from_, to_):
+            if not 0 <= idx_ < self._num_kernels:
+                raise AppError('No kernel of index {0}'.format(idx_))
+        self._edges_from.append(from_)
+        self._edges_to.append(to_)
+        self._depth[to_] = max(self._depth[from_] + 1, self._depth[to_])
+        self._max_depth = max(self._depth[to_], self._max_depth)
+        self._levels = None
 
     def get_all_kernels(self, mode='index'):
         """get all kernels
@@ -227,9 +262,9 @@ class DAGApp(BaseApp):
           Depending on `mode` parameter.
         """
         if mode == 'object':
-            return [self._kernels[idx_] for idx_ in self._g.vs.indices]
+            return list(self._kernels)
         else:
-            return self._g.vs.indices
+            return list(range(self._num_kernels))
 
     def get_kernel(self, kernel_idx):
         """Get the kernel object
@@ -246,28 +281,75 @@ class DAGApp(BaseApp):
         """
         return self._kernels[kernel_idx]
 
-    def _prep_baseline(self):
-        self._depth_sorted = [[v_.index
-                               for v_ in self._g.vs.select(depth_eq=d_)]
-                              for d_ in range(1, self._max_depth + 1)]
-        finish_time = dict.fromkeys(self._g.vs.indices, 0)
-        for l, node_list in enumerate(self._depth_sorted):
+    def _prep_structure(self):
+        """Precompute the structure of the DAG as arrays.
+
+        Predecessors are stored in the CSR (compressed sparse row) format,
+        those of kernel i are _pred_indices[_pred_indptr[i]:_pred_indptr[i+1]],
+        in ascending order, and so are successors. Kernels are grouped by
+        depth into _levels, a list of (nodes, preds, offsets): nodes of the
+        level, their predecessors concatenated, and the offset of each
+        node's predecessors in preds, as required by
+        :func:`numpy.maximum.reduceat`.
+        """
+        nkernels = self._num_kernels
+        edges_from = np.array(self._edges_from, dtype=np.intp)
+        edges_to = np.array(self._edges_to, dtype=np.intp)
+        self._pred_indptr, self._pred_indices = _csr(edges_to, edges_from, nkernels)
+        self._succ_indptr, self._succ_indices = _csr(edges_from, edges_to, nkernels)
+
+        depth = np.array(self._depth, dtype=np.intp)
+        self._depth_sorted = []
+        self._levels = []
+        for d_ in range(1, self._max_depth + 1):
+            nodes = np.flatnonzero(depth == d_)
+            self._depth_sorted.append(nodes.tolist())
+            counts = self._pred_indptr[nodes + 1] - self._pred_indptr[nodes]
+            offsets = np.zeros(len(nodes), dtype=np.intp)
+            offsets[1:] = np.cumsum(counts)[:-1]
+            level_preds = np.concatenate(
+                [self._pred_indices[self._pred_indptr[n_]:self._pred_indptr[n_ + 1]]
+                 for n_ in nodes] + [np.zeros(0, dtype=np.intp)])
+            self._levels.append((nodes, level_preds, offsets))
+
+    def _finish_time(self, runtime):
+        """Get the finish time of each kernel given their run time.
+
+        Parameters
+        ----------
+        runtime : array
+          Run time of kernels, in the shape of (..., nkernels).
+
+        Returns
+        -------
+        array
+          Finish time of kernels, in the same shape of runtime.
+        """
+        finish = np.zeros_like(runtime)
+        for l, (nodes, preds, offsets) in enumerate(self._levels):
             if l == 0:
-                for node in node_list:
-                    finish_time[node] = self._length[node]
+                finish[..., nodes] = runtime[..., nodes]
             else:
-                for node in node_list:
-                    start = max([finish_time[n_] for n_ in
-                                 self._g.neighbors(node,
-                                                   mode=GRAPH_IN)])
-                    finish_time[node] = start + self._length[node]
-        self._baseline_runtime = max(finish_time.values())
+                # max-plus: the latest predecessor, plus the run time
+                start = np.maximum.reduceat(finish[..., preds], offsets, axis=-1)
+                finish[..., nodes] = start + runtime[..., nodes]
+        return finish
+
+    def _prep_baseline(self):
+        self._prep_structure()
+        self._lengths = np.array(self._length, dtype=np.float64)
+        finish = self._finish_time(self._lengths)
+        self._baseline_runtime = finish.max() if len(finish) else 0
+
+    def _structure(self):
+        if self._levels is None:
+            self._prep_baseline()
 
     def get_kernel_depth(self, kernel_idx):
-        return self._g.vs[kernel_idx]['depth']
+        return self._depth[kernel_idx]
 
     def get_all_kernel_depth(self):
-        return self._g.vs['depth']
+        return list(self._depth)
 
     def kernels_topo_sort(self):
         """sort kernels in a topological order.
@@ -277,7 +359,18 @@ class DAGApp(BaseApp):
         list
           kernel indexes in a topological sort order
         """
-        return self._g.topological_sorting()
+        self._structure()
+        npreds = np.diff(self._pred_indptr).tolist()
+        queue = deque(idx_ for idx_ in range(self._num_kernels) if npreds[idx_] == 0)
+        order = []
+        while queue:
+            idx_ = queue.popleft()
+            order.append(idx_)
+            for s_ in self.get_successor_kernels(idx_):
+                npreds[s_] -= 1
+                if npreds[s_] == 0:
+                    queue.append(s_)
+        return order
 
     def get_precedent_kernel(self, kernel_idx):
         """Get the precedent (pre-requisite) kernels.
@@ -288,7 +381,48 @@ class DAGApp(BaseApp):
           A list of kernel indexes that precedent the given kernel. None
           if no precedent kernels exist, e.g. the starting kernel.
         """
-        return self._g.neighbors(kernel_idx, mode=GRAPH_IN)
+        self._structure()
+        return self._pred_indices[
+            self._pred_indptr[kernel_idx]:self._pred_indptr[kernel_idx + 1]].tolist()
+
+    def get_successor_kernels(self, kernel_idx):
+        """Get the successor kernels, which depend on the given kernel.
+
+        Returns
+        -------
+        list
+          A list of kernel indexes that depend on the given kernel, empty
+          for the ending kernels.
+        """
+        self._structure()
+        return self._succ_indices[
+            self._succ_indptr[kernel_idx]:self._succ_indptr[kernel_idx + 1]].tolist()
+
+    def to_igraph(self):
+        """Export the DAG to `igraph`, which is imported on demand.
+
+        Returns
+        -------
+        :class:`igraph.Graph`
+          A directed graph, whose vertices have 'name' (kernel name),
+          'depth', and 'length' attributes.
+
+        Raises
+        ------
+        AppError
+          igraph is not installed.
+        """
+        try:
+            from igraph import Graph
+        except ImportError:
+            raise AppError('igraph is required to export DAGs, '
+                           'it can be installed by: pip install python-igraph')
+        g = Graph(n=self._num_kernels, directed=True,
+                  edges=list(zip(self._edges_from, self._edges_to)))
+        g.vs['name'] = [k_.name for k_ in self._kernels]
+        g.vs['depth'] = list(self._depth)
+        g.vs['length'] = list(self._length)
+        return g
 
     def kernels_depth_sort(self):
         """sort kernels by their depth.
@@ -305,10 +439,8 @@ class DAGApp(BaseApp):
                [5,6],   # depth == 2
             ]
         """
-        try:
-            return self._depth_sorted
-        except AttributeError:
-            raise AppError('App not initiliazed properly')
+        self._structure()
+        return self._depth_sorted
 
     def get_speedup(self, speedup_dict):
         """Get the speedup of an application by given a speedup vector of each kernel.
@@ -327,22 +459,34 @@ class DAGApp(BaseApp):
           kernels not specified will be assumed to have a speedup of 1x,
           e.g. not speedup
         """
-        speedups = [speedup_dict[idx_] if idx_ in speedup_dict else 1
-                    for idx_ in self._g.vs.indices]
-        kernel_runtime = [self._length[idx_] / speedups[idx_]
-                          for idx_ in self._g.vs.indices]
-        finish_time = dict.fromkeys(self._g.vs.indices, 0)
-        for l, node_list in enumerate(self._depth_sorted):
-            if l == 0:
-                for node in node_list:
-                    finish_time[node] = kernel_runtime[node]
-            else:
-                for node in node_list:
-                    start = max([finish_time[n_] for n_ in
-                                 self._g.neighbors(node,
-                                                   mode=GRAPH_IN)])
-                    finish_time[node] = start + kernel_runtime[node]
-        app_runtime = max(finish_time.values())
+        speedups = np.ones(self._num_kernels)
+        for idx_, su_ in speedup_dict.items():
+            speedups[idx_] = su_
+        return float(self.get_speedup_batch(speedups))
+
+    def get_speedup_batch(self, speedup_matrix):
+        """Get the speedup of an application for many speedup vectors at once.
+
+        Parameters
+        ----------
+        speedup_matrix : array
+          Speedup of each kernel, in the shape of (nconfigs, nkernels) and
+          indexed by kernel index along the last axis, or (nkernels,) for a
+          single speedup vector.
+
+        Returns
+        -------
+        array
+          Speedup of the application, in the shape of (nconfigs,), or a
+          scalar for a single speedup vector.
+        """
+        self._structure()
+        speedup_matrix = np.asarray(speedup_matrix, dtype=np.float64)
+        if speedup_matrix.shape[-1:] != (self._num_kernels,):
+            raise AppError('Expect speedup of {0} kernels, got the shape of {1}'.format(
+                self._num_kernels, speedup_matrix.shape))
+        runtime = self._lengths / speedup_matrix
+        app_runtime = self._finish_time(runtime).max(axis=-1)
         return self._baseline_runtime / app_runtime
 
 
@@ -788,30 +932,43 @@ class DetailedApp(BaseApp):
         return cls.load_from_xmltree(tree_root.getroot(), kernels)
 
 
-def load_suite_xmltree(xmltree, kernels):
-    type_ = xmltree.get('type')
+APP_CLASSES = {
+    'simple': SimpleApp,
+    'dag': DAGApp,
+    'detailed': DetailedApp,
+    'synthetic': SyntheticApp,
+}
+
+
+def get_app_class(type_):
+    """Get the application class of a suite type
+
+    Parameters
+    ----------
+    type_ : str
+      The type attribute of the apps element, default to 'simple' if None
+      or empty.
+
+    Raises
+    ------
+    AppError
+      the type is unknown
+    """
     if not type_:
         type_ = 'simple'
+    try:
+        return APP_CLASSES[type_]
+    except KeyError:
+        raise AppError('Unknown app type {0}'.format(type_))
+
+
+def load_suite_xmltree(xmltree, kernels):
+    app_cls = get_app_class(xmltree.get('type'))
 
     applications = dict()
-    if type_ == 'simple':
-        for r_ in xmltree.findall('app'):
-            a = SimpleApp.load_from_xmltree(r_, kernels)
-            applications[a.name] = a
-    elif type_ == 'dag':
-        for r_ in xmltree.findall('app'):
-            a = DAGApp.load_from_xmltree(r_, kernels)
-            applications[a.name] = a
-    elif type_ == 'detailed':
-        for r_ in xmltree.findall('app'):
-            a = DetailedApp.load_from_xmltree(r_, kernels)
-            applications[a.name] = a
-    elif type_ == 'synthetic':
-        for r_ in xmltree.findall('app'):
-            a = SyntheticApp.load_from_xmltree(r_, kernels)
-            applications[a.name] = a
-    else:
-        raise AppError('Unknown app type {0}'.format(type_))
+    for r_ in xmltree.findall('app'):
+        a = app_cls.load_from_xmltree(r_, kernels)
+        applications[a.name] = a
     return applications
 
 
@@ -0,0 +1,601 @@
+#!/usr/bin/env python
+"""
+Compiled workloads, and streaming parsers of workload XML files.
+
+Parsing a workload XML file builds the whole element tree, then kernel and
+application objects element by element, which takes seconds for generated
+suites of thousands of applications. A compiled workload is the binary
+serialization of these objects, written on the first load and keyed by the
+digest of the XML file, so that later loads skip XML parsing altogether.
+The cache is opt-in, by the cache argument of loaders or by setting
+LUMOS_CACHE_DIR, see :func:`cache_dir_of`.
+
+The file is laid out as a stream of pickle records::
+
+    magic (8 bytes) | napps (uint64) | header | kernels | apps | apps | ... | None
+
+napps is the number of applications, filled in once all of them are
+written. The header is a dict of the format version, the digest of the source XML
+file, and the type of applications. Kernels are stored once as a dict
+indexed by names. Applications are stored as lists of a few of them, each
+list is a separate record that refers to kernels by name, so that
+applications can be read a few at a time.
+
+For XML files too big to be held as a tree, :func:`iterparse_kernels` and
+:func:`iterparse_apps` parse elements as they are read, and discard them
+once the corresponding objects are built.
+
+Both compiled and XML files can be opened by :func:`open_workload` to
+stream applications one by one, or in batches, so that the memory of
+evaluating a suite is bounded by the batch size rather than the number of
+applications.
+"""
+
+import logging
+import os
+import pickle
+import struct
+import tempfile
+from lxml import etree
+from lumos.settings import LUMOS_DEBUG, LUMOS_CACHE_DIR, LUMOS_WORKLOAD_CACHE
+from lumos import BraceMessage as _bm_
+from ..misc import file_digest
+from .kernel import Kernel
+from .application import get_app_class
+
+
+__logger = None
+
+if LUMOS_DEBUG and ('all' in LUMOS_DEBUG or 'workload' in LUMOS_DEBUG):
+    _debug_enabled = True
+else:
+    _debug_enabled = False
+
+def _debug(brace_msg):
+    global __logger
+    if not _debug_enabled:
+        return
+
+    if not __logger:
+        __logger = logging.getLogger('workload')
+        __logger.setLevel(logging.DEBUG)
+
+    __logger.debug(brace_msg)
+
+
+class WorkloadError(Exception):
+    pass
+
+
+class WorkloadCacheError(WorkloadError):
+    pass
+
+
+_MAGIC = b'LUMOSWL2'
+_NAPPS = struct.Struct('<Q')
+# bump whenever pickled application classes change their attributes
+_VERSION = 3
+# the number of applications per record
+_RECORD_APPS = 64
+
+
+def _release(elem):
+    """Free an element parsed by iterparse, and its preceding siblings"""
+    elem.clear()
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def iterparse_kernels(xmlfile):
+    """Load kernels from an XML file, without building the whole tree.
+
+    Parsing stops at the end of the kernels element, and applications
+    before it are skipped.
+
+    Parameters
+    ----------
+    xmlfile : filepath
+      The workload file, see
+      :func:`~lumos.model.workload.load_kernels_and_apps`.
+
+    Returns
+    -------
+    dict
+      kernels indexed by names, None if there is no kernels element.
+    """
+    kernels = None
+    for event, elem in etree.iterparse(xmlfile, events=('start', 'end'),
+                                       tag=('kernels', 'kernel', 'app')):
+        if elem.tag == 'kernels':
+            if event == 'start':
+                kernels = dict()
+                continue
+            break
+
+        if event != 'end':
+            continue
+        if elem.tag == 'kernel' and elem.getparent().tag == 'kernels':
+            k = Kernel.load_from_xmltree(elem)
+            kernels[k.name] = k
+            _release(elem)
+        elif elem.tag == 'app':
+            _release(elem)
+    return kernels
+
+
+def iterparse_apps(xmlfile, kernels):
+    """Load applications one by one from an XML file, without building the
+    whole tree.
+
+    Parameters
+    ----------
+    xmlfile : filepath
+      The workload file.
+    kernels : dict
+      Kernels indexed by names, e.g. from :func:`iterparse_kernels`.
+
+    Returns
+    -------
+    generator
+      of application objects, in the order of the file.
+    """
+    app_cls = None
+    for event, elem in etree.iterparse(xmlfile, events=('start', 'end'),
+                                       tag=('apps', 'app')):
+        if elem.tag == 'apps':
+            if event == 'start':
+                app_cls = get_app_class(elem.get('type'))
+                continue
+            break
+
+        if event == 'end' and app_cls is not None:
+            a = app_cls.load_from_xmltree(elem, kernels)
+            _release(elem)
+            yield a
+
+
+def apps_type(xmlfile):
+    """Get the type of applications of an XML file, None if there are no
+    applications"""
+    for event, elem in etree.iterparse(xmlfile, events=('start',), tag='apps'):
+        return elem.get('type') or 'simple'
+    return None
+
+
+class _AppPickler(pickle.Pickler):
+    """Pickle applications, with kernels referred by names"""
+    def __init__(self, f):
+        super(_AppPickler, self).__init__(f, pickle.HIGHEST_PROTOCOL)
+        self.kernels = dict()
+
+    def persistent_id(self, obj):
+        if isinstance(obj, Kernel) and self.kernels.get(obj.name) is obj:
+            return obj.name
+        return None
+
+
+class _AppUnpickler(pickle.Unpickler):
+    def __init__(self, f, kernels=None):
+        super(_AppUnpickler, self).__init__(f)
+        self.kernels = kernels
+
+    def persistent_load(self, pid):
+        try:
+            return self.kernels[pid]
+        except (KeyError, TypeError):
+            raise WorkloadCacheError('Unknown kernel {0}'.format(pid))
+
+
+def cache_path(digest, cache_dir=None):
+    """Get the path of the compiled workload of an XML file's digest
+
+    Parameters
+    ----------
+    digest : str
+      The digest of the XML file, see :func:`~lumos.model.misc.file_digest`
+    cache_dir : str
+      The directory of compiled workloads, default to a 'workload'
+      directory under :data:`~lumos.settings.LUMOS_CACHE_DIR`.
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(LUMOS_CACHE_DIR, 'workload')
+    return os.path.join(cache_dir, '{0}.wl'.format(digest))
+
+
+def cache_dir_of(cache):
+    """Get the directory of compiled workloads from the cache argument of
+    :func:`open_workload` and :func:`~lumos.model.workload.load_kernels_and_apps`
+
+    Parameters
+    ----------
+    cache : bool, str, or None
+      Whether to use the cache, or the directory of the cache. None follows
+      :data:`~lumos.settings.LUMOS_WORKLOAD_CACHE`, i.e. the cache is used
+      only if LUMOS_CACHE_DIR is set in the environment.
+
+    Returns
+    -------
+    str
+      The directory, None if the cache is not used.
+    """
+    if cache is None:
+        cache = LUMOS_WORKLOAD_CACHE
+    if not cache:
+        return None
+    if isinstance(cache, str):
+        return cache
+    return os.path.join(LUMOS_CACHE_DIR, 'workload')
+
+
+def _dump_record(pickler, record):
+    # records are independent of each other, which also bounds the memo
+    pickler.clear_memo()
+    pickler.dump(record)
+    return len(record)
+
+
+def write_compiled(path, digest, type_, kernels, apps):
+    """Write a compiled workload.
+
+    The file is replaced atomically, so that concurrent readers (e.g. sweep
+    workers) see either a complete file or no file.
+
+    Parameters
+    ----------
+    path : str
+      The output file, parent directories are created if not exist.
+    digest : str
+      The digest of the source XML file.
+    type_ : str
+      The type of applications, e.g. 'synthetic'.
+    kernels : dict
+      Kernels indexed by names.
+    apps : iterable
+      Application objects, can be a generator.
+
+    Returns
+    -------
+    int
+      The number of applications written.
+    """
+    dirname = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(dirname):
+        os.makedirs(dirname)
+
+    napps = 0
+    fd, tmp_path = tempfile.mkstemp(dir=dirname)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_MAGIC)
+            f.write(_NAPPS.pack(0))
+            pickler = _AppPickler(f)
+            pickler.dump({'version': _VERSION, 'digest': digest, 'type': type_})
+            pickler.dump(kernels)
+            # from now on, kernels are referred by names
+            pickler.kernels = kernels
+            record = []
+            for a in apps:
+                record.append(a)
+                if len(record) == _RECORD_APPS:
+                    napps += _dump_record(pickler, record)
+                    record = []
+            if record:
+                napps += _dump_record(pickler, record)
+            pickler.dump(None)
+            f.seek(len(_MAGIC))
+            f.write(_NAPPS.pack(napps))
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    _debug(_bm_('compiled {0} kernels and {1} apps to {2}',
+                len(kernels), napps, path))
+    return napps
+
+
+def iter_batches(apps, batch_size):
+    """Group applications into lists of batch_size, the last one may be
+    shorter"""
+    if batch_size < 1:
+        raise WorkloadError('batch_size should be at least 1, but given {0}'.format(batch_size))
+    return _batches(apps, batch_size)
+
+
+def _batches(apps, batch_size):
+    batch = []
+    for a in apps:
+        batch.append(a)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class _Workload(object):
+    """Kernels, and a stream of applications"""
+    def iter_apps(self):
+        raise NotImplementedError
+
+    def iter_batches(self, batch_size):
+        """Load applications in lists of batch_size, see :func:`iter_batches`"""
+        return iter_batches(self.iter_apps(), batch_size)
+
+    def __iter__(self):
+        return self.iter_apps()
+
+    def load(self):
+        """Load all kernels and applications
+
+        Returns
+        -------
+        kernels, applications : dict
+          as :func:`~lumos.model.workload.load_kernels_and_apps`
+        """
+        return self.kernels, dict((a.name, a) for a in self.iter_apps())
+
+
+class XMLWorkload(_Workload):
+    """A workload XML file, parsed by :func:`iterparse_kernels` and
+    :func:`iterparse_apps`.
+
+    Parameters
+    ----------
+    xmlfile : filepath
+      The workload file.
+
+    Attributes
+    ----------
+    kernels : dict
+      Kernels indexed by names, shared by all applications.
+    type : str
+      The type of applications.
+    """
+    def __init__(self, xmlfile):
+        self.xmlfile = xmlfile
+        self.kernels = iterparse_kernels(xmlfile)
+        self.type = apps_type(xmlfile)
+        if self.kernels is None or self.type is None:
+            raise WorkloadError('No kernels or applications in {0}'.format(xmlfile))
+
+    def iter_apps(self):
+        """Load applications one by one.
+
+        Returns
+        -------
+        generator
+          of application objects, in the order of the XML file.
+        """
+        return iterparse_apps(self.xmlfile, self.kernels)
+
+
+class CompiledWorkload(_Workload):
+    """A compiled workload file.
+
+    Parameters
+    ----------
+    path : str
+      The compiled workload file.
+    digest : str
+      If given, the digest of the source XML file that the compiled file is
+      expected to match.
+
+    Attributes
+    ----------
+    header : dict
+      with keys of 'version', 'digest', and 'type'.
+    napps : int
+      The number of applications, also given by len().
+    kernels : dict
+      Kernels indexed by names, shared by all applications loaded from the
+      file.
+
+    Raises
+    ------
+    WorkloadCacheError
+      The file is missing, not a compiled workload, or out-of-date.
+    """
+    def __init__(self, path, digest=None):
+        self.path = path
+        f = self._open()
+        try:
+            unpickler = _AppUnpickler(f)
+            self.header = self._load(unpickler)
+            if not isinstance(self.header, dict) or self.header.get('version') != _VERSION:
+                raise WorkloadCacheError('Unsupported format of {0}'.format(path))
+            if digest is not None and self.header.get('digest') != digest:
+                raise WorkloadCacheError('{0} is out-of-date'.format(path))
+            self.kernels = self._load(unpickler)
+        finally:
+            f.close()
+
+    @property
+    def type(self):
+        return self.header['type']
+
+    def __len__(self):
+        return self.napps
+
+    def _open(self):
+        try:
+            f = open(self.path, 'rb')
+        except (OSError, IOError) as e:
+            raise WorkloadCacheError('Can not open {0}: {1}'.format(self.path, e))
+        prefix = f.read(len(_MAGIC) + _NAPPS.size)
+        if len(prefix) != len(_MAGIC) + _NAPPS.size or not prefix.startswith(_MAGIC):
+            f.close()
+            raise WorkloadCacheError('{0} is not a compiled workload'.format(self.path))
+        self.napps = _NAPPS.unpack(prefix[len(_MAGIC):])[0]
+        return f
+
+    def _load(self, unpickler):
+        try:
+            return unpickler.load()
+        except WorkloadCacheError:
+            raise
+        except Exception as e:
+            # truncated or corrupted files
+            raise WorkloadCacheError('Error reading {0}: {1!r}'.format(self.path, e))
+
+    def iter_apps(self):
+        """Load applications one by one.
+
+        Returns
+        -------
+        generator
+          of application objects, in the order of the source XML file.
+        """
+        f = self._open()
+        try:
+            unpickler = _AppUnpickler(f)
+            # skip the header and kernels
+            self._load(unpickler)
+            self._load(unpickler)
+            while True:
+                # records are pickled with a fresh memo
+                unpickler = _AppUnpickler(f, self.kernels)
+                record = self._load(unpickler)
+                if record is None:
+                    return
+                for a in record:
+                    yield a
+        finally:
+            f.close()
+
+
+def load_cached(digest, cache_dir=None):
+    """Load the compiled workload of an XML file's digest from the cache
+
+    Returns
+    -------
+    kernels, applications : dict
+      None, None if not cached, or the cached file can not be read.
+    """
+    path = cache_path(digest, cache_dir)
+    try:
+        return CompiledWorkload(path, digest).load()
+    except WorkloadCacheError as e:
+        _debug(_bm_('compiled workload not loaded: {0}', e))
+        return None, None
+
+
+def save_cached(digest, type_, kernels, apps, cache_dir=None):
+    """Save a workload to the cache, see :func:`write_compiled` for
+    parameters. Failures, e.g. of a read-only cache directory, or objects
+    which can not be pickled, are ignored.
+
+    Returns
+    -------
+    str
+      The path of the compiled file, None if failed.
+    """
+    path = cache_path(digest, cache_dir)
+    try:
+        write_compiled(path, digest, type_, kernels, apps)
+    except (OSError, IOError, pickle.PicklingError, TypeError, AttributeError,
+            WorkloadCacheError) as e:
+        # pickle raises TypeError (e.g. on locks) or AttributeError (e.g. on
+        # local functions) for many objects which can not be pickled
+        _debug(_bm_('failed to write {0}: {1}', path, e))
+        return None
+    return path
+
+
+def compile_workload(xmlfile, path=None, cache_dir=None):
+    """Compile an XML workload file.
+
+    The XML file is parsed by :func:`iterparse_kernels` and
+    :func:`iterparse_apps`, and applications are written as they are parsed,
+    so that memory is bounded by the kernels and a single application.
+
+    Parameters
+    ----------
+    xmlfile : filepath
+      The workload file.
+    path : str
+      The compiled file, default to :func:`cache_path` of the XML file, where
+      it is found by :func:`~lumos.model.workload.load_kernels_and_apps`.
+    cache_dir : str
+      The cache directory, if path is not given.
+
+    Returns
+    -------
+    str
+      The path of the compiled file.
+    """
+    digest = file_digest(xmlfile)
+    if path is None:
+        path = cache_path(digest, cache_dir)
+
+    workload = XMLWorkload(xmlfile)
+    write_compiled(path, digest, workload.type, workload.kernels,
+                   workload.iter_apps())
+    return path
+
+
+def open_workload(xmlfile, cache=None):
+    """Open a workload for streaming its applications.
+
+    Parameters
+    ----------
+    xmlfile : filepath
+      The workload file.
+    cache : bool, str, or None
+      Whether to use the compiled workload cache, or the directory of the
+      cache, see :func:`cache_dir_of`. The XML file is compiled first if it
+      is not in the cache, and is read as it is if the cache can not be
+      written.
+
+    Returns
+    -------
+    :class:`CompiledWorkload` or :class:`XMLWorkload`
+      with the kernels loaded, and applications to be loaded by iter_apps()
+      or iter_batches().
+
+    Examples
+    --------
+    >>> workload = open_workload('syn.xml')
+    >>> sys = HeterogSysDetailed(config, workload.kernels)
+    >>> for batch in workload.iter_batches(1000):
+    ...     perfs = [sys.perf(650, app) for app in batch]
+    """
+    cache_dir = cache_dir_of(cache)
+    if cache_dir is None:
+        return XMLWorkload(xmlfile)
+
+    digest = file_digest(xmlfile)
+    path = cache_path(digest, cache_dir)
+    try:
+        return CompiledWorkload(path, digest)
+    except WorkloadCacheError as e:
+        _debug(_bm_('compiled workload not loaded: {0}', e))
+
+    workload = XMLWorkload(xmlfile)
+    if save_cached(digest, workload.type, workload.kernels,
+                   workload.iter_apps(), cache_dir) is None:
+        return workload
+    return CompiledWorkload(path, digest)
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog='python -m lumos.model.workload.compiled',
+        description='Compile workload XML files into the workload cache')
+    parser.add_argument('xmlfile', nargs='+')
+    parser.add_argument('-o', '--output',
+                        help='output file, only with a single xmlfile, '
+                        'default to the workload cache')
+    parser.add_argument('--cache-dir',
+                        help='the cache directory, default: %(default)s',
+                        default=os.path.join(LUMOS_CACHE_DIR, 'workload'))
+    args = parser.parse_args()
+    if args.output and len(args.xmlfile) > 1:
+        parser.error('--output is only allowed with a single xmlfile')
+
+    for xmlfile in args.xmlfile:
+        print('{0} -> {1}'.format(xmlfile, compile_workload(
+            xmlfile, args.output, args.cache_dir)))
@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+"""
+A packed (struct-of-arrays) representation of applications.
+
+A :class:`PackedSuite` holds one row per (application, kernel) pair, with
+kernel characteristics as columns of NumPy arrays, so that performance
+models evaluate a whole suite with array expressions rather than nested
+loops over applications and kernels, e.g.
+:meth:`~lumos.model.system.homo.HomogSysDetailed.perf_packed` and
+:meth:`~lumos.model.system.hetero.HeterogSysDetailed.perf_packed`.
+Rows of an application are contiguous, in the order of
+:meth:`~lumos.model.workload.application.SyntheticApp.get_all_kernels`.
+
+Simple applications are packed as well, with their parallel ratios as
+per-application columns, and their coverage as a matrix of applications by
+kernels (:attr:`PackedSuite.cov_matrix`), e.g. for
+:meth:`~lumos.model.system.hetero.HeterogSys.get_perf_suite`.
+"""
+
+import numpy as np
+from .application import AppError
+
+
+#: Characteristics of a kernel within an application
+APP_KERNEL_PARAMS = ('cov', 'rc_count', 'rc_time')
+
+#: Characteristics of an application, NaN if not applicable, e.g. the
+#: parallel ratio of synthetic applications
+APP_PARAMS = ('f', 'f_noacc')
+
+#: Kernel characteristics used by the multi-core performance model, as named
+#: in the `core_perf_config` section of a kernel description.
+KERNEL_PERF_PARAMS = ('cache_sz_l1_nom', 'cache_sz_l2_nom',
+                      'miss_l1', 'miss_l2', 'alpha_l1', 'alpha_l2',
+                      'rm', 'cpi_exe', 'pf')
+
+#: All columns of a :class:`PackedSuite`
+PACKED_COLUMNS = APP_KERNEL_PARAMS + KERNEL_PERF_PARAMS
+
+
+class PackedSuite(object):
+    """Applications packed into arrays.
+
+    Use :meth:`from_apps` to build one from application objects.
+
+    Parameters
+    ----------
+    names : list of str
+      The names of applications.
+    kernels : list of :class:`~lumos.model.workload.kernel.Kernel`
+      The distinct kernels of all applications.
+    app_index : array of int
+      The application of each row, as an index into names.
+    kernel_index : array of int
+      The kernel of each row, as an index into kernels.
+    columns : dict
+      Arrays of each row indexed by names in :data:`PACKED_COLUMNS`, and
+      extra kernel characteristics if any.
+    app_columns : dict
+      Arrays of each application, indexed by names in :data:`APP_PARAMS`,
+      default to NaN.
+
+    Attributes
+    ----------
+    names, kernels, app_index, kernel_index, columns, app_columns
+      as parameters, arrays are read-only.
+    """
+    def __init__(self, names, kernels, app_index, kernel_index, columns,
+                 app_columns=None):
+        self.names = list(names)
+        self.kernels = list(kernels)
+        self.app_index = np.asarray(app_index, dtype=np.intp)
+        self.kernel_index = np.asarray(kernel_index, dtype=np.intp)
+        self.columns = dict()
+        missing = [name for name in PACKED_COLUMNS if name not in columns]
+        if missing:
+            raise AppError('Missing columns {0}'.format(missing))
+        for name in columns:
+            col = np.asarray(columns[name], dtype=np.float64)
+            if col.shape != self.app_index.shape:
+                raise AppError('Column {0} has the shape of {1}, expect {2}'.format(
+                    name, col.shape, self.app_index.shape))
+            self.columns[name] = col
+        self.app_columns = dict()
+        app_columns = app_columns or dict()
+        for name in APP_PARAMS + tuple(p for p in app_columns if p not in APP_PARAMS):
+            col = np.asarray(app_columns.get(name, np.nan), dtype=np.float64)
+            if not col.ndim:
+                col = np.full(len(self.names), float(col))
+            if col.shape != (len(self.names),):
+                raise AppError('Column {0} has the shape of {1}, expect {2}'.format(
+                    name, col.shape, (len(self.names),)))
+            self.app_columns[name] = col
+        for arr in ([self.app_index, self.kernel_index] + list(self.columns.values()) +
+                    list(self.app_columns.values())):
+            arr.flags.writeable = False
+        self._index = None
+        self._cov_matrix = None
+
+    @classmethod
+    def from_apps(cls, apps, extra_params=()):
+        """Pack synthetic or simple applications
+
+        Parameters
+        ----------
+        apps : iterable of :class:`~lumos.model.workload.application.SyntheticApp` or :class:`~lumos.model.workload.application.SimpleApp`
+          e.g. values of a suite loaded by
+          :func:`~lumos.model.workload.load_kernels_and_apps`, or a batch
+          from :func:`~lumos.model.workload.iter_apps`.
+        extra_params : iterable of str
+          Kernel characteristics to be packed besides
+          :data:`KERNEL_PERF_PARAMS`, e.g.
+          those of an L3 cache, see
+          :attr:`~lumos.model.mem.hierarchy.CacheHierarchy.kernel_params`.
+
+        Raises
+        ------
+        AppError
+          An application is neither synthetic nor simple.
+        """
+        names = []
+        kernels = []
+        kernel_ids = dict()
+        app_index = []
+        kernel_index = []
+        rows = dict((name, []) for name in APP_KERNEL_PARAMS)
+        app_rows = dict((name, []) for name in APP_PARAMS)
+        for a in apps:
+            if a.type not in ('synthetic', 'simple'):
+                raise AppError('Requires a synthetic or simple application, '
+                               'but {0} is {1}'.format(a.name, a.type))
+            idx = len(names)
+            names.append(a.name)
+            for name in APP_PARAMS:
+                app_rows[name].append(getattr(a, name, np.nan))
+            for kid in a.get_all_kernels():
+                kobj = a.get_kernel(kid)
+                # kernels are shared by applications of a suite
+                kidx = kernel_ids.get(id(kobj))
+                if kidx is None:
+                    kidx = len(kernels)
+                    kernel_ids[id(kobj)] = kidx
+                    kernels.append(kobj)
+                if a.type == 'synthetic':
+                    cov, rc_count, rc_time = a.get_kernel_characteristics(kid)
+                else:
+                    cov, rc_count, rc_time = a.get_cov(kid), 0, 0
+                rows['cov'].append(cov)
+                rows['rc_count'].append(rc_count)
+                rows['rc_time'].append(rc_time)
+                app_index.append(idx)
+                kernel_index.append(kidx)
+
+        kernel_index = np.array(kernel_index, dtype=np.intp)
+        columns = dict((name, np.array(rows[name], dtype=np.float64))
+                       for name in APP_KERNEL_PARAMS)
+        for name in KERNEL_PERF_PARAMS + tuple(
+                p for p in extra_params if p not in KERNEL_PERF_PARAMS):
+            # kernels without core characteristics give NaN
+            per_kernel = np.array([getattr(k, name, np.nan) for k in kernels],
+                                  dtype=np.float64)
+            columns[name] = per_kernel[kernel_index]
+        return cls(names, kernels, app_index, kernel_index, columns, app_rows)
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def nrows(self):
+        return len(self.app_index)
+
+    def index(self, name):
+        """Get the position of an application by its name"""
+        if self._index is None:
+            self._index = dict((n, i) for i, n in enumerate(self.names))
+        return self._index[name]
+
+    @property
+    def cov_matrix(self):
+        """The coverage of kernels in the shape of (napps, nkernels),
+        read-only, 0 where an application does not have a kernel"""
+        if self._cov_matrix is None:
+            cov = np.zeros((len(self.names), len(self.kernels)))
+            # kernels are distinct within an application
+            cov[self.app_index, self.kernel_index] = self.columns['cov']
+            cov.flags.writeable = False
+            self._cov_matrix = cov
+        return self._cov_matrix
+
+    def require(self, params):
+        """Check that kernel characteristics are packed
+
+        Parameters
+        ----------
+        params : iterable of str
+          e.g. :attr:`~lumos.model.mem.hierarchy.CacheHierarchy.kernel_params`
+          of a system.
+
+        Raises
+        ------
+        AppError
+          Some of params are not in columns, the suite should be packed
+          with them as extra_params, see :meth:`from_apps`.
+        """
+        missing = [name for name in params if name not in self.columns]
+        if missing:
+            raise AppError('Missing columns {0}, pack applications with them '
+                           'as extra_params'.format(missing))
+
+    def app_sum(self, values):
+        """Sum values of rows by applications.
+
+        Parameters
+        ----------
+        values : array
+          in the shape of (..., nrows)
+
+        Returns
+        -------
+        array
+          in the shape of (..., napps), applications without kernels sum to 0.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        napps = len(self.names)
+        if values.ndim == 1:
+            return np.bincount(self.app_index, weights=values, minlength=napps)
+        # a single bincount, with rows of values offset by napps
+        flat = values.reshape(-1, values.shape[-1])
+        nflat = flat.shape[0]
+        bins = (np.arange(nflat)[:, np.newaxis] * napps + self.app_index).ravel()
+        ret = np.bincount(bins, weights=flat.ravel(), minlength=nflat * napps)
+        return ret.reshape(values.shape[:-1] + (napps,))
+
+    def kernel_map(self, func):
+        """Evaluate func once per distinct kernel, and expand results to rows.
+
+        Parameters
+        ----------
+        func : callable
+          Called as func(kernel_object) and returns a float.
+
+        Returns
+        -------
+        array
+          of the shape (nrows,)
+        """
+        per_kernel = np.array([func(k) for k in self.kernels], dtype=np.float64)
+        return per_kernel[self.kernel_index]
+
+
+def pack_apps(apps, extra_params=()):
+    """Pack applications, see :meth:`PackedSuite.from_apps`"""
+    return PackedSuite.from_apps(apps, extra_params)
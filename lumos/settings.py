@@ -33,3 +33,11 @@ FINFET_SIM_CIRCUIT = 'rca32'
 # LUMOS_USE_REMOTE = os.getenv('LUMOS_USE_REMOTE', False)
 
 LUMOS_ANALYSIS_DIR = os.getenv('LUMOS_ANALYSIS_DIR', os.path.join(LUMOS_HOME, 'analyses'))
+
+# where compiled workloads, and other derived files, are cached
+LUMOS_CACHE_DIR = os.getenv('LUMOS_CACHE_DIR', os.path.join(
+    os.path.expanduser('~'), '.cache', 'lumos'))
+
+# workloads are compiled into the cache by default only if LUMOS_CACHE_DIR is
+# set, otherwise only when asked for, e.g. load_kernels_and_apps(f, cache=True)
+LUMOS_WORKLOAD_CACHE = bool(os.getenv('LUMOS_CACHE_DIR'))
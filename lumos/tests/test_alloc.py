@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+import os
+import itertools
+from lumos.model.workload import load_kernels_xmlfile, load_apps_xmlfile
+from lumos.model.system.hetero import HeterogSys, SysConfig
+from lumos.model.system.alloc import AreaAllocator, AllocError, RLACC
+from lumos.model.system.alloc import optimize_alloc
+import numpy as np
+import unittest
+
+curdir = os.path.dirname(__file__)
+ASACCS = [('ker0', 'asic_10x'), ('ker1', 'asic_5x'), ('ker2', 'asic_50x')]
+
+
+class TestAreaAllocator(unittest.TestCase):
+    def setUp(self):
+        self.ks = load_kernels_xmlfile(os.path.join(curdir, 'alloc_kernels.xml'))
+        self.as_ = load_apps_xmlfile(os.path.join(curdir, 'alloc_apps.xml'), self.ks)
+
+    def test_optimize(self):
+        for objective in ('mean', 'gmean', 'hmean'):
+            allocator = AreaAllocator(SysConfig(), self.ks, self.as_.values(),
+                                      ASACCS, rlacc=True, objective=objective)
+            ret = allocator.optimize()
+
+            # no worse than an exhaustive search on a coarse grid
+            grid = np.arange(0, 0.21, 0.04)
+            scores = [allocator.evaluate(x + (0,))
+                      for x in itertools.product(grid, repeat=len(ASACCS))]
+            self.assertGreaterEqual(ret['score'], max(scores))
+
+            # the same as a system built from scratch
+            sysconfig = SysConfig()
+            for key, ratio in ret['ratios'].items():
+                if key == RLACC:
+                    sysconfig.rlacc_area_ratio = ratio
+                elif ratio:
+                    sysconfig.add_asacc(key[0], key[1], ratio)
+            sys = HeterogSys(sysconfig, self.ks)
+            perf = sys.get_perf_suite(self.as_.values())['perf']
+            np.testing.assert_allclose(ret['perf'], perf)
+
+    def test_infeasible(self):
+        allocator = AreaAllocator(SysConfig(), self.ks, self.as_.values(), ASACCS)
+        self.assertIsNone(allocator.evaluate((0.5, 0.5, 0.5)))
+        self.assertIsNone(allocator.evaluate((-0.1, 0, 0)))
+        # the system is left unchanged
+        self.assertEqual(allocator.evaluate((0.1, 0, 0)),
+                         optimize_alloc(SysConfig(), self.ks, self.as_.values(),
+                                        ASACCS, init=(0.1, 0, 0), max_iter=0)['score'])
+        with self.assertRaises(AllocError):
+            allocator.optimize(init=(0.5, 0.5, 0.5))
+
+    def test_bad_args(self):
+        with self.assertRaises(AllocError):
+            AreaAllocator(SysConfig(), self.ks, self.as_.values(), ASACCS,
+                          objective='median')
+        with self.assertRaises(AllocError):
+            AreaAllocator(SysConfig(), self.ks, self.as_.values(), [])
+        with self.assertRaises(AllocError):
+            AreaAllocator(SysConfig(), self.ks, self.as_.values(), [('foo', 'asic_5x')])
+
+
+if __name__ == '__main__':
+    unittest.main()
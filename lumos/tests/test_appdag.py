@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 
+import pickle
+import random
 import unittest
+import numpy as np
 from lumos.model.workload import load_kernels_and_apps
+from lumos.model.workload.application import DAGApp, AppError
 
 import os
 curdir = os.path.dirname(__file__)
@@ -24,3 +28,76 @@ class TestAppDAG(unittest.TestCase):
     def test_speedup(self):
         speedup_dict = {0: 1.2, 1: 1.3, 5: 1.5, 4: 2}
         self.assertAlmostEqual(self._app.get_speedup(speedup_dict), 1.2)
+
+    def _random_dag(self, nkernels, seed=1):
+        rng = random.Random(seed)
+        app = DAGApp('app_random')
+        for idx in range(nkernels):
+            app._add_kernel(self._ks['ker0'], rng.uniform(0.1, 1))
+            for pred in rng.sample(range(max(idx - 10, 0), idx), min(idx, 2)):
+                app._add_dependence(pred, idx)
+        app._prep_baseline()
+        return app
+
+    def test_speedup_batch(self):
+        app = self._random_dag(200)
+        rng = np.random.RandomState(1)
+        speedups = rng.uniform(0.5, 10, (20, 200))
+
+        expected = []
+        for row in speedups:
+            # the longest path by a plain traversal in topological order
+            finish = dict()
+            for idx in app.kernels_topo_sort():
+                start = max([finish[p] for p in app.get_precedent_kernel(idx)] or [0])
+                finish[idx] = start + app.get_kernel_length(idx) / row[idx]
+            expected.append(app._baseline_runtime / max(finish.values()))
+        np.testing.assert_allclose(app.get_speedup_batch(speedups), expected)
+        self.assertAlmostEqual(app.get_speedup(dict(enumerate(speedups[3]))), expected[3])
+        self.assertAlmostEqual(app.get_speedup_batch(np.ones(200)), 1)
+        with self.assertRaises(AppError):
+            app.get_speedup_batch(np.ones((2, 3)))
+
+    def test_no_dependence(self):
+        app = DAGApp('app_flat')
+        app._add_kernel(self._ks['ker0'], 0.4)
+        app._add_kernel(self._ks['ker1'], 0.6)
+        app._prep_baseline()
+        self.assertEqual(app.kernels_depth_sort(), [[0, 1]])
+        # kernels run in parallel, 0.6 vs. max(0.4, 0.6 / 2)
+        self.assertAlmostEqual(app.get_speedup({1: 2}), 1.5)
+
+    def test_structure(self):
+        app = self._random_dag(300)
+        order = app.kernels_topo_sort()
+        self.assertEqual(sorted(order), app.get_all_kernels())
+        position = dict((idx, i) for i, idx in enumerate(order))
+        for idx in app.get_all_kernels():
+            preds = app.get_precedent_kernel(idx)
+            self.assertEqual(preds, sorted(preds))
+            for pred in preds:
+                self.assertLess(position[pred], position[idx])
+                self.assertIn(idx, app.get_successor_kernels(pred))
+            depth = max([app.get_kernel_depth(p) for p in preds] or [0]) + 1
+            self.assertEqual(app.get_kernel_depth(idx), depth)
+        with self.assertRaises(AppError):
+            app._add_dependence(0, 300)
+
+    def test_pickle(self):
+        app = self._random_dag(100)
+        speedup = app.get_speedup({3: 2, 10: 4})
+        app2 = pickle.loads(pickle.dumps(app))
+        self.assertEqual(app2.kernels_depth_sort(), app.kernels_depth_sort())
+        self.assertEqual(app2.get_speedup({3: 2, 10: 4}), speedup)
+
+    def test_to_igraph(self):
+        try:
+            import igraph
+        except ImportError:
+            self.skipTest('igraph is not installed')
+        g = self._app.to_igraph()
+        self.assertEqual(g.vcount(), 6)
+        self.assertEqual(g.neighbors(5, mode='in'), [1, 2, 3, 4])
+        self.assertEqual(g.vs['depth'], self._app.get_all_kernel_depth())
+        self.assertEqual(g.topological_sorting(), self._app.kernels_topo_sort())
+
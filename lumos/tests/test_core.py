@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+from lumos.model.core import BaseCore, BaseCoreError, get_core
+from lumos.model.system.mpsoc import MPSoC
+from lumos.model.system.budget import Sys_L
+import unittest
+
+
+class TestBaseCore(unittest.TestCase):
+    def test_get_core(self):
+        core = get_core(22, 'cmos', 'hp', 'io')
+        self.assertIs(get_core(22, 'cmos', 'hp', 'io'), core)
+        self.assertIsNot(get_core(32, 'cmos', 'hp', 'io'), core)
+
+        # same as a core constructed directly
+        core2 = BaseCore(22, 'cmos', 'hp', 'io')
+        for vdd in (core.vmin, core.vnom, core.vmax):
+            self.assertEqual(core.freq(vdd), core2.freq(vdd))
+            self.assertEqual(core.power(vdd), core2.power(vdd))
+
+        # systems share the interned core
+        self.assertIs(MPSoC(Sys_L, 22).thru_core, core)
+
+    def test_immutable(self):
+        core = get_core(22, 'cmos', 'hp', 'io')
+        with self.assertRaises(ValueError):
+            core._freq_list[0] = 0
+        with self.assertRaises(BaseCoreError):
+            core.vdd = 800
+        # cores constructed directly are not shared
+        core2 = BaseCore(22, 'cmos', 'hp', 'io')
+        core2.vdd = 800
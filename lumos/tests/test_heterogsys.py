@@ -2,8 +2,15 @@
 
 import os
 import lumos
-from lumos.model.workload import load_kernels_and_apps
+from lumos.model.workload import load_kernels_and_apps, pack_apps
+from lumos.model.workload import load_kernels_xmlfile, load_apps_xmlfile
+from lumos.model.workload.application import AppError
 from lumos.model.system.hetero import HeterogSysDetailed, SysConfigDetailed
+from lumos.model.system.hetero import HeterogSys, SysConfig
+from lumos.model.system.hetero import HeterogSysError
+from lumos.model.system.budget import Budget, Sys_L
+from lumos.model.mem.hierarchy import CacheLevel, BASELINE_L1
+import numpy as np
 import unittest
 
 
@@ -35,3 +42,185 @@ class TestHeterogSys(unittest.TestCase):
         self.assertAlmostEqual(sys.perf(750, app), 686.615, places=2)
         app = _as['synapp_reconfig_overhead_3']
         self.assertAlmostEqual(sys.perf(750, app), 686.615, places=2)
+
+    def test_packed(self):
+        workload_xmlfile = os.path.join(
+            os.path.dirname(lumos.model.workload.__file__), 'sirius.xml')
+        _ks, _as = load_kernels_and_apps(workload_xmlfile)
+        suite = pack_apps(_as.values())
+        for rlacc_area_ratio in (0, 0.2):
+            sysconfig = SysConfigDetailed()
+            sysconfig.rlacc_area_ratio = rlacc_area_ratio
+            sysconfig.add_asacc('gmm', 'asic_5x', 0.05)
+            sys = HeterogSysDetailed(sysconfig, _ks)
+            for kwargs in ({}, {'disable_rlacc': True}, {'disable_asacc': True},
+                           {'cnum_max': 16}):
+                perfs = sys.perf_packed(750, suite, **kwargs)
+                # perf() is evaluated in single precision
+                np.testing.assert_allclose(
+                    perfs, [sys.perf(750, _as[name], **kwargs) for name in suite.names],
+                    rtol=1e-4)
+
+    def test_perf_vdd_curve(self):
+        workload_xmlfile = os.path.join(
+            os.path.dirname(lumos.model.workload.__file__), 'sirius.xml')
+        _ks, _as = load_kernels_and_apps(workload_xmlfile)
+        sysconfig = SysConfigDetailed()
+        sysconfig.rlacc_area_ratio = 0.1
+        sysconfig.add_asacc('gmm', 'asic_5x', 0.05)
+        sys = HeterogSysDetailed(sysconfig, _ks)
+        vdd = np.arange(500, 1001, 25)
+        suite = pack_apps(_as.values())
+        for name in ('synapp_0', 'synapp_reconfig_overhead_0'):
+            ret = sys.perf_vdd_curve(_as[name], vdd)
+            perfs = [sys.perf(v, _as[name]) for v in vdd]
+            np.testing.assert_allclose(ret['perf'], perfs, rtol=1e-4)
+            self.assertEqual(list(ret['cnum']), [sys.get_cnum(v) for v in vdd])
+            self.assertEqual(ret['opt_vdd'], vdd[np.argmax(ret['perf'])])
+            self.assertEqual(ret['opt_perf'], max(ret['perf']))
+            np.testing.assert_allclose(
+                sys.perf_packed(vdd, suite)[:, suite.index(name)], ret['perf'])
+
+        # supplies that can not power a core are infeasible
+        sysconfig.budget = Budget(area=Sys_L.area, power=7, bw=Sys_L.bw)
+        sys = HeterogSysDetailed(sysconfig, _ks)
+        ret = sys.perf_vdd_curve(_as['synapp_0'], [600, 700, 900])
+        self.assertEqual(list(ret['cnum']), [3, 1, 0])
+        self.assertTrue(np.isnan(ret['perf'][2]))
+        self.assertIn(ret['opt_vdd'], (600, 700))
+        with self.assertRaises(HeterogSysError):
+            sys.perf_vdd_curve(_as['synapp_0'], [900, 1000])
+
+    def test_optimize(self):
+        workload_xmlfile = os.path.join(
+            os.path.dirname(lumos.model.workload.__file__), 'sirius.xml')
+        _ks, _as = load_kernels_and_apps(workload_xmlfile)
+        suite = pack_apps(_as.values())
+        sysconfig = SysConfigDetailed()
+        sysconfig.rlacc_area_ratio = 0.1
+        sysconfig.add_asacc('gmm', 'asic_5x', 0.05)
+        sys = HeterogSysDetailed(sysconfig, _ks)
+        vdd = np.arange(500, 1001, 20)
+        for kwargs in ({}, {'disable_rlacc': True, 'disable_asacc': True}):
+            ret = sys.optimize(suite, vdd, **kwargs)
+
+            # exhaustive search over all (vdd, cnum) allowed by budgets
+            cnum_max = sys.get_cnum_array(vdd)
+            best = np.zeros(len(suite))
+            for cnum in range(1, cnum_max.max() + 1):
+                perfs = sys.perf_packed(vdd, suite, cnum_max=cnum, **kwargs)
+                perfs[cnum > cnum_max] = 0
+                best = np.maximum(best, perfs.max(axis=0))
+            np.testing.assert_allclose(ret['perf'], best)
+
+        r = sys.optimize(_as['synapp_0'], vdd)
+        self.assertAlmostEqual(r['perf'] / sys.perf(r['vdd'], _as['synapp_0'],
+                                                    cnum_max=r['cnum']), 1, places=4)
+
+    def test_cache_levels(self):
+        workload_xmlfile = os.path.join(
+            os.path.dirname(lumos.model.workload.__file__), 'sirius.xml')
+        _ks, _as = load_kernels_and_apps(workload_xmlfile, cache=False)
+        sysconfig = SysConfigDetailed()
+        sysconfig.add_asacc('gmm', 'asic_5x', 0.05)
+        sysconfig.cache_levels = [
+            CacheLevel('l1', 65536, 'cmos-hp', 22, baseline=BASELINE_L1),
+            CacheLevel('l2', 18874368, 'cmos-hp', 22, sharing=None),
+            CacheLevel('l3', 67108864, 'sttram-sttram', 22, sharing=None,
+                       miss=0.5, alpha=1.5, size_nom=18874368)]
+        sys = HeterogSysDetailed(sysconfig, _ks)
+        vdd = np.arange(500, 1001, 50)
+        cnum = sys.get_cnum_array(vdd)
+        self.assertEqual(cnum.tolist(), [sys.get_cnum(v) for v in vdd])
+
+        app = _as['synapp_0']
+        r = sys.perf_vdd_curve(app, vdd)
+        for v, perf in zip(vdd, r['perf']):
+            if np.isnan(perf):
+                self.assertLess(sys.get_cnum(v), 1)
+            else:
+                self.assertAlmostEqual(perf / sys.perf(v, app), 1, places=4)
+
+        # per-kernel L3 characteristics, packed and scalar results agree
+        kobj = app.get_kernel(list(app.get_all_kernels())[0])
+        kobj.miss_l3, kobj.alpha_l3, kobj.cache_sz_l3_nom = 0.2, 1.2, 4194304
+        suite = pack_apps(_as.values(), extra_params=sys.caches.kernel_params)
+        perfs = sys.perf_packed(650, suite)
+        for name, perf in zip(suite.names, perfs):
+            self.assertAlmostEqual(perf / sys.perf(650, _as[name]), 1, places=6)
+        with self.assertRaises(AppError):
+            sys.perf_packed(650, pack_apps(_as.values()))
+
+    def test_get_perf_suite(self):
+        curdir = os.path.dirname(__file__)
+        _ks = load_kernels_xmlfile(os.path.join(curdir, 'kernels.xml'))
+        _as = load_apps_xmlfile(os.path.join(curdir, 'apps.xml'), _ks)
+        apps = list(_as.values())
+        for rlacc_area_ratio, asacc_area_ratio in ((0, 0), (0.1, 0), (0, 0.05), (0.1, 0.05)):
+            sysconfig = SysConfig()
+            sysconfig.rlacc_area_ratio = rlacc_area_ratio
+            if asacc_area_ratio:
+                sysconfig.add_asacc('ker', 'asic_10x', asacc_area_ratio)
+            sys = HeterogSys(sysconfig, _ks)
+            ret = sys.get_perf_suite(apps)
+            self.assertEqual(ret['perf'].shape, (len(apps),))
+            for app, perf in zip(apps, ret['perf']):
+                r = sys.get_perf(app)
+                self.assertAlmostEqual(perf, r['perf'])
+                self.assertEqual((ret['cnum'], ret['vdd']), (r['cnum'], r['vdd']))
+
+    def test_set_acc_area(self):
+        curdir = os.path.dirname(__file__)
+        _ks = load_kernels_xmlfile(os.path.join(curdir, 'kernels.xml'))
+        _as = load_apps_xmlfile(os.path.join(curdir, 'apps.xml'), _ks)
+        suite = pack_apps(_as.values())
+        sys = HeterogSys(SysConfig(), _ks)
+        steps = [('asic_10x', 0.05, 0), ('asic_10x', 0.2, 0), ('asic_10x', 0.2, 0.1),
+                 ('asic_10x', 0, 0.1), ('asic_10x', 0.05, 0), ('asic_10x', 0.05, 0)]
+        for acc_id, asacc_area_ratio, rlacc_area_ratio in steps:
+            sys.set_rlacc_area(rlacc_area_ratio)
+            ret = sys.set_asacc_area('ker', acc_id, asacc_area_ratio, suite)
+
+            sysconfig = SysConfig()
+            sysconfig.rlacc_area_ratio = rlacc_area_ratio
+            if asacc_area_ratio:
+                sysconfig.add_asacc('ker', acc_id, asacc_area_ratio)
+            sys_ref = HeterogSys(sysconfig, _ks)
+            ret_ref = sys_ref.get_perf_suite(_as.values())
+            self.assertAlmostEqual(sys.thru_core_area, sys_ref.thru_core_area)
+            self.assertEqual(sys.thru_core_num, sys_ref.thru_core_num)
+            self.assertEqual(sys.has_asacc('ker'), sys_ref.has_asacc('ker'))
+            self.assertEqual((ret['cnum'], ret['vdd']), (ret_ref['cnum'], ret_ref['vdd']))
+            np.testing.assert_allclose(ret['perf'], ret_ref['perf'])
+        # the dim-silicon optimum is reused when the core count is back
+        self.assertGreater(sys.dim_perf_cache_info()['hits'], 0)
+
+        with self.assertRaises(HeterogSysError):
+            sys.set_asacc_area('ker', 'asic_5x', 1)
+
+    def test_set_acc_area_detailed(self):
+        workload_xmlfile = os.path.join(
+            os.path.dirname(lumos.model.workload.__file__), 'sirius.xml')
+        _ks, _as = load_kernels_and_apps(workload_xmlfile)
+        suite = pack_apps(_as.values())
+        sys = HeterogSysDetailed(SysConfigDetailed(), _ks)
+        steps = [(0.05, 0), (0.05, 0.1), (0, 0.1), (0, 0)]
+        for asacc_area_ratio, rlacc_area_ratio in steps:
+            sys.set_rlacc_area(rlacc_area_ratio)
+            ret = sys.set_asacc_area('gmm', 'asic_5x', asacc_area_ratio, suite)
+
+            sysconfig = SysConfigDetailed()
+            sysconfig.rlacc_area_ratio = rlacc_area_ratio
+            if asacc_area_ratio:
+                sysconfig.add_asacc('gmm', 'asic_5x', asacc_area_ratio)
+            sys_ref = HeterogSysDetailed(sysconfig, _ks)
+            ret_ref = sys_ref.optimize(suite)
+            self.assertAlmostEqual(sys.thru_core_area, sys_ref.thru_core_area)
+            self.assertEqual(sys.has_asacc('gmm'), sys_ref.has_asacc('gmm'))
+            self.assertEqual(sys.has_rlacc(), sys_ref.has_rlacc())
+            np.testing.assert_array_equal(ret['vdd'], ret_ref['vdd'])
+            np.testing.assert_array_equal(ret['cnum'], ret_ref['cnum'])
+            np.testing.assert_allclose(ret['perf'], ret_ref['perf'])
+
+        with self.assertRaises(HeterogSysError):
+            sys.set_asacc_area('gmm', 'asic_5x', 1)
@@ -4,8 +4,14 @@ import os
 from lumos.model.system.homo import HomogSys
 from lumos.model.workload import SimpleApp
 from lumos.model.core import BaseCore
-from lumos.model.workload import load_kernels_and_apps
+import lumos
+from lumos.model.workload import load_kernels_and_apps, pack_apps
+from lumos.model.workload.application import AppError
 from lumos.model.system.homo import HomogSysDetailed, SysConfigDetailed
+from lumos.model.workload.packed import KERNEL_PERF_PARAMS
+from lumos.model.mem.hierarchy import CacheLevel, BASELINE_L1
+import itertools
+import numpy as np
 import unittest
 
 
@@ -30,3 +36,132 @@ class TestHomogSys(unittest.TestCase):
 
         # test perf score
         self.assertAlmostEqual(sys.perf(650, app), 992.02310514)
+
+    def test_homogsys_detailed_batch(self):
+        _ks, _as = load_kernels_and_apps(
+            os.path.join(os.path.dirname(__file__), 'detailed_workload.xml'))
+        appname = 'l1m0.005_l2m0.01_rm0.18_alpha0.5_cpi0.5'
+        app = _as[appname]
+        kobj = app.get_kernel(appname)
+        sys = HomogSysDetailed(SysConfigDetailed())
+
+        vdd_list = (500, 650, 800)
+        miss_l2_list = (0.01, 0.2, 0.6)
+        alpha_l2_list = (0.5, 2.0)
+        kparams = dict((name, getattr(kobj, name))
+                       for name in KERNEL_PERF_PARAMS)
+        params = list(itertools.product(miss_l2_list, alpha_l2_list))
+        kparams['miss_l2'] = np.array([p[0] for p in params])
+        kparams['alpha_l2'] = np.array([p[1] for p in params])
+        perfs = sys.perf_batch(np.array(vdd_list)[:, np.newaxis], kparams)
+        self.assertEqual(perfs.shape, (len(vdd_list), len(params)))
+
+        for i, vdd in enumerate(vdd_list):
+            for j, (miss_l2, alpha_l2) in enumerate(params):
+                kobj.miss_l2 = miss_l2
+                kobj.alpha_l2 = alpha_l2
+                self.assertAlmostEqual(perfs[i, j], sys.perf(vdd, app))
+
+    def test_homogsys_detailed_packed(self):
+        _ks, _as = load_kernels_and_apps(os.path.join(
+            os.path.dirname(lumos.model.workload.__file__), 'sirius.xml'))
+        suite = pack_apps(_as.values())
+        sys = HomogSysDetailed(SysConfigDetailed())
+        for vdd in (500, 650, 800):
+            perfs = sys.perf_packed(vdd, suite)
+            self.assertEqual(perfs.shape, (len(_as),))
+            for name, perf in zip(suite.names, perfs):
+                self.assertAlmostEqual(perf, sys.perf(vdd, _as[name]))
+        perfs = sys.perf_packed(650, suite, cnum=16)
+        for name, perf in zip(suite.names, perfs):
+            self.assertAlmostEqual(perf, sys.perf(650, _as[name], cnum=16))
+
+    def test_homogsys_detailed_optimize(self):
+        _ks, _as = load_kernels_and_apps(os.path.join(
+            os.path.dirname(lumos.model.workload.__file__), 'sirius.xml'))
+        suite = pack_apps(_as.values())
+        sys = HomogSysDetailed(SysConfigDetailed())
+        vdd = np.arange(500, 1001, 20)
+        ret = sys.optimize(suite, vdd)
+
+        # exhaustive search over all (vdd, cnum) allowed by budgets
+        best = np.zeros(len(suite))
+        for v in vdd:
+            for cnum in range(1, sys.get_cnum(v) + 1):
+                best = np.maximum(best, sys.perf_packed(v, suite, cnum=cnum))
+        np.testing.assert_allclose(ret['perf'], best)
+        self.assertEqual(ret['names'], suite.names)
+
+        r = sys.optimize(_as['synapp_0'], vdd)
+        i = suite.index('synapp_0')
+        self.assertEqual((r['vdd'], r['cnum']), (ret['vdd'][i], ret['cnum'][i]))
+        self.assertAlmostEqual(r['perf'], sys.perf(r['vdd'], _as['synapp_0'], cnum=r['cnum']))
+
+    def test_homogsys_detailed_l3(self):
+        _ks, _as = load_kernels_and_apps(os.path.join(
+            os.path.dirname(lumos.model.workload.__file__), 'sirius.xml'))
+        sysconfig = SysConfigDetailed()
+        sysconfig.cache_levels = [
+            CacheLevel('l1', 65536, 'cmos-hp', 22, baseline=BASELINE_L1),
+            CacheLevel('l2', 262144, 'cmos-hp', 22, sharing=4, miss=0.3, alpha=2,
+                       size_nom=262144),
+            CacheLevel('l3', 18874368, 'sttram-sttram', 22, sharing=None,
+                       miss=0.5, alpha=1.5, size_nom=1048576)]
+        sys = HomogSysDetailed(sysconfig)
+        self.assertEqual(len(sys.caches), 3)
+
+        # power and area of cores with their caches fit the budget
+        def fits(cnum):
+            return (cnum * sys.core.power(650) + sys.caches.power(cnum).sum() <= sys.sys_power and
+                    cnum * sys.core.area + sys.caches.area(cnum).sum() <= sys.sys_area)
+        cnum = sys.get_cnum(650)
+        self.assertTrue(fits(cnum))
+        self.assertFalse(fits(cnum + 1))
+
+        suite = pack_apps(_as.values(), extra_params=sys.caches.kernel_params)
+        perfs = sys.perf_packed(650, suite)
+        for name, perf in zip(suite.names, perfs):
+            self.assertAlmostEqual(perf, sys.perf(650, _as[name]))
+        vdd = np.arange(500, 1001, 50)
+        self.assertEqual(sys.get_cnum_array(vdd).tolist(),
+                         [sys.get_cnum(v) for v in vdd])
+        r = sys.optimize(_as['synapp_0'], vdd)
+        self.assertAlmostEqual(r['perf'], sys.perf(r['vdd'], _as['synapp_0'], cnum=r['cnum']))
+
+    def test_homogsys_detailed_l3_params(self):
+        _ks, _as = load_kernels_and_apps(os.path.join(
+            os.path.dirname(lumos.model.workload.__file__), 'sirius.xml'), cache=False)
+        # per-kernel L3 characteristics of some kernels, others use defaults
+        kernels = sorted(set(a.get_kernel(k) for a in _as.values()
+                             for k in a.get_all_kernels()), key=lambda k: k.name)
+        for i, k in enumerate(kernels[::2]):
+            k.miss_l3 = 0.1 + 0.2 * i
+            k.alpha_l3 = 1.2 + 0.3 * i
+            k.cache_sz_l3_nom = 524288 * (i + 1)
+        sysconfig = SysConfigDetailed()
+        sysconfig.cache_levels = [
+            CacheLevel('l1', 65536, 'cmos-hp', 22, baseline=BASELINE_L1),
+            CacheLevel('l2', 262144, 'cmos-hp', 22, sharing=4, miss=0.3, alpha=2,
+                       size_nom=262144),
+            CacheLevel('l3', 18874368, 'sttram-sttram', 22, sharing=None,
+                       miss=0.5, alpha=1.5, size_nom=1048576)]
+        sys = HomogSysDetailed(sysconfig)
+
+        # a suite without L3 characteristics is rejected, not defaulted
+        with self.assertRaises(AppError):
+            sys.perf_packed(650, pack_apps(_as.values()))
+        with self.assertRaises(AppError):
+            sys.optimize(pack_apps(_as.values()))
+
+        suite = pack_apps(_as.values(), extra_params=sys.caches.kernel_params)
+        self.assertTrue(np.isnan(suite.columns['miss_l3']).any())
+        self.assertFalse(np.isnan(suite.columns['miss_l3']).all())
+        for vdd in (500, 650, 900):
+            perfs = sys.perf_packed(vdd, suite)
+            for name, perf in zip(suite.names, perfs):
+                self.assertAlmostEqual(perf, sys.perf(vdd, _as[name]))
+        vdd = np.arange(500, 1001, 50)
+        r = sys.optimize(suite, vdd)
+        for name, v, cnum, perf in zip(r['names'], r['vdd'], r['cnum'], r['perf']):
+            self.assertAlmostEqual(perf, sys.perf(v, _as[name], cnum=cnum))
+
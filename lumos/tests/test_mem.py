@@ -1,7 +1,26 @@
-from lumos.model.mem.cache import get_cache_trait, cache_sz_nom
+from lumos.model.mem.cache import get_cache_trait, get_cache_traits, cache_sz_nom
+from lumos.model.mem.cache import CacheTraitIndex, CacheError
+from lumos.model.mem.cache import generate_cache_db, scale_cache_traits
+from lumos.model.mem.cache import load_cache_db, save_cache_db
+from lumos.model.mem.hierarchy import CacheLevel, CacheHierarchy, baseline_hierarchy
+from lumos.model.system.detailed import parallel_runtime
+import numpy as np
+import os
+import shutil
+import tempfile
 
 import unittest
 
+
+def _fake_solve(solve_key):
+    size, line_sz, assoc, nbanks = solve_key
+    return {'power': size * 1e-6, 'area': size * 1e-5, 'latency': assoc + nbanks}
+
+
+def _fail_solve(solve_key):
+    raise RuntimeError('solve {0}'.format(solve_key))
+
+
 class TestMem(unittest.TestCase):
     def setUp(self):
         pass
@@ -17,3 +36,214 @@ class TestMem(unittest.TestCase):
         c = get_cache_trait(cache_sz_nom('128K'), tech_node=22)
         self.assertAlmostEqual(c['area'], 0.1792535)
         self.assertAlmostEqual(c['power'], 0.1461256)
+
+    def test_interpolate(self):
+        lo = get_cache_trait(cache_sz_nom('64K'))
+        hi = get_cache_trait(cache_sz_nom('128K'))
+        mid = get_cache_trait(96 * 1024)
+        for name in ('power', 'area', 'latency'):
+            self.assertTrue(min(lo[name], hi[name]) <= mid[name] <= max(lo[name], hi[name]))
+        # log-log interpolation of the area
+        self.assertAlmostEqual(
+            mid['area'], np.exp(np.interp(np.log(96), np.log([64, 128]),
+                                          np.log([lo['area'], hi['area']]))))
+
+        with self.assertRaises(CacheError):
+            get_cache_trait(96 * 1024, interpolate=False)
+        with self.assertRaises(CacheError):
+            get_cache_trait(1024)
+        with self.assertRaises(CacheError):
+            get_cache_trait(cache_sz_nom('64K'), tech_node=3)
+
+    def test_vectorized(self):
+        sizes = np.array([cache_sz_nom('64K'), 96 * 1024, cache_sz_nom('128M')])
+        traits = get_cache_traits(sizes)
+        for i, size in enumerate(sizes):
+            c = get_cache_trait(size)
+            for name in ('power', 'area', 'latency'):
+                self.assertEqual(traits[name][i], c[name])
+
+        with self.assertRaises(CacheError):
+            get_cache_traits([cache_sz_nom('64K'), 1024])
+
+    def test_index(self):
+        db = {('cmos-hp', 22, 1024, 64, 2, 1): {'power': 1, 'area': 2, 'latency': 4},
+              ('cmos-hp', 22, 4096, 64, 2, 1): {'power': 4, 'area': 8, 'latency': 4}}
+        index = CacheTraitIndex.from_dict(db)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(list(index.sizes()), [1024, 4096])
+        c = index.lookup(2048)
+        self.assertAlmostEqual(c['power'], 2)
+        self.assertAlmostEqual(c['area'], 4)
+        self.assertAlmostEqual(c['latency'], 4)
+
+    def test_npy(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            npyfile = os.path.join(tmpdir, 'cache_db.npy')
+            db = load_cache_db()
+            save_cache_db(db, npyfile)
+            self.assertEqual(load_cache_db(npyfile), db)
+
+            index = CacheTraitIndex.open(npyfile)
+            index_ref = CacheTraitIndex.from_dict(db)
+            self.assertEqual(len(index), len(db))
+            for tech_type, tech_node, size, line_sz, assoc, nbanks in db:
+                self.assertEqual(
+                    index.lookup(size, tech_type, tech_node, line_sz, assoc, nbanks),
+                    db[(tech_type, tech_node, size, line_sz, assoc, nbanks)])
+            sizes = np.linspace(16384, 524288, 50)
+            self.assertEqual(index.lookup_array(sizes)['area'].tolist(),
+                             index_ref.lookup_array(sizes)['area'].tolist())
+            with self.assertRaises(CacheError):
+                index.lookup(65536, 'cmos-hp', 3)
+            with self.assertRaises(CacheError):
+                CacheTraitIndex.open(os.path.join(tmpdir, 'missing.npy'))
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+def _mcore_runtime(freq, fnom, cnum, cache_sz_l1, cache_sz_l2,
+                   delay_l1, delay_l2, delay_mem, kparams):
+    """The reference run time with a private L1 and an L2 shared by all
+    cores, written out without CacheHierarchy"""
+    miss_l1 = np.minimum(
+        1, kparams['miss_l1'] * ((cache_sz_l1 / kparams['cache_sz_l1_nom']) **
+                                 (1 - kparams['alpha_l1'])))
+    miss_l2 = np.minimum(
+        1, kparams['miss_l2'] * ((cache_sz_l2 /
+                                  (cnum * kparams['cache_sz_l2_nom'])) **
+                                 (1 - kparams['alpha_l2'])))
+
+    t0 = ((1 - miss_l1) * delay_l1 + miss_l1 * (1 - miss_l2) * delay_l2 +
+          miss_l1 * miss_l2 * delay_mem)
+    return parallel_runtime(freq, fnom, cnum, t0, kparams)
+
+
+class TestCacheHierarchy(unittest.TestCase):
+    def setUp(self):
+        self.kparams = {
+            'cache_sz_l1_nom': np.array([32768., 65536.]),
+            'cache_sz_l2_nom': np.array([1048576., 4194304.]),
+            'miss_l1': np.array([0.02, 0.1]), 'miss_l2': np.array([0.3, 0.6]),
+            'alpha_l1': np.array([1.5, 5.]), 'alpha_l2': np.array([2., 1.5]),
+            'rm': np.array([0.2, 0.4]), 'cpi_exe': np.array([1., 1.2]),
+            'pf': np.array([0.9, 0.99])}
+
+    def test_baseline(self):
+        caches = baseline_hierarchy(22, 65536, 'cmos-hp', 18874368, 'cmos-hp', 29)
+        self.assertEqual([level.delay for level in caches], [3, 29])
+        cnum = np.array([[1], [16], [64]])
+        freq = np.array([[2.], [3.], [4.]])
+        runtime = parallel_runtime(freq, 3.5, cnum, caches.amat(self.kparams, cnum),
+                                   self.kparams)
+        runtime_ref = _mcore_runtime(freq, 3.5, cnum, 65536, 18874368, 3, 29, 29,
+                                     self.kparams)
+        self.assertEqual(runtime.tolist(), runtime_ref.tolist())
+
+        # private L1 of each core, and an L2 for all
+        l1, l2 = caches.levels
+        np.testing.assert_allclose(caches.power(cnum)[:, :, 0].T,
+                                   [[1 * l1.traits['power'], l2.traits['power']],
+                                    [16 * l1.traits['power'], l2.traits['power']],
+                                    [64 * l1.traits['power'], l2.traits['power']]])
+
+    def test_sharing(self):
+        level = CacheLevel('l2', 1048576, sharing=4)
+        self.assertEqual(level.instances(np.arange(1, 10)).tolist(),
+                         [1, 1, 1, 1, 2, 2, 2, 2, 3])
+        self.assertEqual(level.sharers(np.array([1, 3, 8])).tolist(), [1, 3, 4])
+        # contention for a shared cache
+        miss = level.miss_rate(self.kparams, np.array([[1], [2], [4], [8]]))
+        self.assertTrue((np.diff(miss, axis=0) >= 0).all())
+        self.assertEqual(miss[2].tolist(), miss[3].tolist())
+
+        caches = CacheHierarchy([CacheLevel('l1', 65536, baseline=(3, 65536, 'cmos-hp', 22)),
+                                 level], 100)
+        for power in np.linspace(10, 80, 29):
+            cnum = caches.max_cores(power, 1000, 1.5, 4)
+
+            def cost(c):
+                return c * 1.5 + caches.power(c).sum()
+            self.assertLessEqual(cost(cnum), power)
+            self.assertGreater(cost(cnum + 1), power)
+        cnums = caches.max_cores(np.linspace(10, 80, 29), 1000, 1.5, 4)
+        self.assertEqual(cnums.tolist(), [caches.max_cores(p, 1000, 1.5, 4)
+                                          for p in np.linspace(10, 80, 29)])
+
+        with self.assertRaises(CacheError):
+            CacheLevel('l2', 1048576, sharing=0)
+
+    def test_default_params(self):
+        caches = CacheHierarchy(
+            [CacheLevel('l1', 65536), CacheLevel('l2', 1048576),
+             CacheLevel('l3', 16777216, 'sttram-sttram', sharing=None,
+                        miss=0.2, alpha=2, size_nom=1048576)], 200)
+        self.assertEqual(caches.kernel_params[-3:],
+                         ('miss_l3', 'alpha_l3', 'cache_sz_l3_nom'))
+        # NaN for kernels without L3 characteristics
+        nan = np.array([np.nan, np.nan])
+        amat = caches.amat(dict(self.kparams, miss_l3=nan, alpha_l3=nan,
+                                cache_sz_l3_nom=nan), 8)
+        amat_l2 = CacheHierarchy(caches.levels[:2], 200).amat(self.kparams, 8)
+        self.assertTrue((amat < amat_l2).all())
+
+        kparams = dict(self.kparams, miss_l3=np.array([np.nan, 0.2]),
+                       alpha_l3=np.array([np.nan, 2]),
+                       cache_sz_l3_nom=np.array([np.nan, 1048576]))
+        self.assertEqual(caches.amat(kparams, 8).tolist(), amat.tolist())
+
+        # missing columns are not defaulted
+        with self.assertRaises(CacheError):
+            caches.amat(self.kparams, 8)
+
+        caches = CacheHierarchy([CacheLevel('l1', 65536), CacheLevel('l3', 16777216)], 200)
+        with self.assertRaises(CacheError):
+            caches.amat(self.kparams, 8)
+
+
+class TestCacheDBGen(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.checkpoint = os.path.join(self.tmpdir, 'solves.p')
+        self.configs = [(tech, node, size, 64, 2, 1)
+                        for tech, node in (('cmos-hp', 22), ('cmos-hp', 16), ('finfet-hp', 7))
+                        for size in (16384, 32768, 65536)]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_generate(self):
+        progress = []
+        cachedb, stats = generate_cache_db(
+            self.configs, nprocs=2, checkpoint=self.checkpoint, solve=_fake_solve,
+            progress=lambda *args: progress.append(args))
+        # solves are shared by technologies
+        self.assertEqual(stats['configs'], 9)
+        self.assertEqual(stats['solves'], 3)
+        self.assertEqual(len(progress), 3)
+        self.assertEqual(sorted(cachedb), sorted(self.configs))
+        for key in self.configs:
+            self.assertEqual(cachedb[key], scale_cache_traits(
+                _fake_solve(key[2:]), key[0], key[1]))
+
+        # nothing left to solve
+        cachedb2, stats = generate_cache_db(self.configs, dict(cachedb), nprocs=1,
+                                            solve=_fail_solve)
+        self.assertEqual(stats['solves'], 0)
+        self.assertEqual(cachedb2, cachedb)
+
+    def test_resume(self):
+        generate_cache_db(self.configs[:2], nprocs=1, checkpoint=self.checkpoint,
+                          solve=_fake_solve)
+        with self.assertRaises(RuntimeError):
+            generate_cache_db(self.configs, nprocs=1, checkpoint=self.checkpoint,
+                              solve=_fail_solve)
+        cachedb, stats = generate_cache_db(self.configs, nprocs=1,
+                                           checkpoint=self.checkpoint, solve=_fake_solve)
+        self.assertEqual(stats['checkpointed'], 2)
+        self.assertEqual(stats['solves'], 1)
+        self.assertEqual(len(cachedb), 9)
+
+        with self.assertRaises(CacheError):
+            generate_cache_db([('cmos-hp', 3, 16384, 64, 2, 1)], solve=_fake_solve)
@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 
 import os
+import random
+import numpy as np
 from lumos.model.workload import load_kernels_and_apps
-from lumos.model.system.mpsoc import MPSoC
+from lumos.model.workload.application import DAGApp
+from lumos.model.system.mpsoc import MPSoC, EPSILON
 from lumos.model.system.budget import Sys_L
 from lumos.model.tech import get_model
 from lumos.model.core import BaseCore
@@ -42,3 +45,112 @@ class TestMPSoC(unittest.TestCase):
         ker_obj = self.ks_['ker4']
         sys.add_asic(ker_obj, 'asic_5x', 0.1, tech_model)
         self.assertAlmostEqual(sys.get_speedup_appdag_parallel_greedy(app), 3.986, places=2)
+
+    def test_dim_perf_opt(self):
+        sys = MPSoC(Sys_L, 22, tput_core=BaseCore(22, 'cmos', 'hp', 'io'))
+        cnum_max = int(sys.sys_area / sys.thru_core.area)
+        for power_budget in (0.5, 5, 37.3, 120):
+            # compare to a core-by-core search
+            expected = (0, 0, 0, 0)
+            for cnum in range(1, cnum_max + 1):
+                perf_, vdd_, power_ = sys._dim_perf_cnum(cnum, power_budget=power_budget)
+                if perf_ == 0:
+                    break
+                if perf_ > expected[0]:
+                    expected = (perf_, vdd_, cnum, power_)
+            ret = sys._dim_perf_opt(power_budget=power_budget)
+            self.assertAlmostEqual(ret[0], expected[0])
+            self.assertEqual(ret[1:3], expected[1:3])
+            self.assertAlmostEqual(ret[3], expected[3])
+
+    def test_dim_perf_cache_budget(self):
+        sys = MPSoC(Sys_L, 22, tput_core=BaseCore(22, 'cmos', 'hp', 'io'))
+        cnum_max = int(sys.sys_area / sys.thru_core.area)
+        # budgets within a quantum share the optimum of the rounded-down
+        # budget, regardless of the order of calls
+        for base in (0.050, 0.500, 1.234, 18.925):
+            misses = sys.dim_perf_cache_info()['misses']
+            first = sys._dim_perf_opt(power_budget=base + 0.0008)
+            self.assertLessEqual(first[3], base + 0.0001)
+            for offset in (0.0005, 0.0001, 0.0003):
+                ret = sys._dim_perf_opt(power_budget=base + offset)
+                self.assertEqual(ret, first)
+            self.assertEqual(sys.dim_perf_cache_info()['misses'], misses + 1)
+        self.assertEqual(sys._dim_perf_opt(power_budget=0.0009),
+                         sys._dim_perf_opt_solve(0, cnum_max))
+
+    def test_dim_perf_cache_feasible(self):
+        sys = MPSoC(Sys_L, 22, tput_core=BaseCore(22, 'cmos', 'hp', 'io'))
+        # repeated calls with budgets inside one quantum never take more
+        # power than the budget
+        for power_budget in np.linspace(0.3, 20, 1000):
+            for _ in range(2):
+                for budget in (power_budget + 0.0009, power_budget):
+                    ret = sys._dim_perf_opt(power_budget=budget)
+                    self.assertLessEqual(ret[3], budget)
+
+    def test_dim_perf_cache(self):
+        sys = MPSoC(Sys_L, 22, tput_core=BaseCore(22, 'cmos', 'hp', 'io'))
+        app = self.as_['app_dag0']
+        tech_model = get_model('cmos', 'hp')
+        sys.add_asic(self.ks_['ker1'], 'asic_5x', 0.1, tech_model)
+        speedup = sys.get_speedup_appdag_parallel_greedy(app)
+        info = sys.dim_perf_cache_info()
+        self.assertGreater(info['misses'], 0)
+
+        # same system and app, all dim-silicon optima come from the cache
+        self.assertEqual(sys.get_speedup_appdag_parallel_greedy(app), speedup)
+        self.assertEqual(sys.dim_perf_cache_info()['misses'], info['misses'])
+        self.assertGreater(sys.dim_perf_cache_info()['hits'], info['hits'])
+
+        # reconfiguring the system invalidates the cache
+        sys.add_asic(self.ks_['ker2'], 'asic_5x', 0.1, tech_model)
+        self.assertEqual(sys.dim_perf_cache_info()['size'], 0)
+
+    def _asic_sys(self):
+        sys = MPSoC(Sys_L, 22, tput_core=BaseCore(22, 'cmos', 'hp', 'io'))
+        tech_model = get_model('cmos', 'hp')
+        for kname in ('ker1', 'ker2', 'ker3', 'ker4'):
+            sys.add_asic(self.ks_[kname], 'asic_5x', 0.1, tech_model)
+        return sys
+
+    def assertValidSchedule(self, sys, app, sched):
+        cnum_total = int(sys.thru_core_area / sys.thru_core.area)
+        for idx in app.get_all_kernels():
+            for pred in app.get_precedent_kernel(idx):
+                self.assertGreaterEqual(sched['start'][idx] + EPSILON, sched['finish'][pred])
+        # resources in use when each kernel starts
+        for t in set(sched['start']):
+            active = [idx for idx in app.get_all_kernels()
+                      if sched['start'][idx] <= t < sched['finish'][idx] - EPSILON]
+            self.assertLessEqual(sum(sched['power'][i] for i in active),
+                                 sys.sys_power + EPSILON)
+            self.assertLessEqual(sum(sched['cnum'][i] for i in active), cnum_total)
+            asics = [app.get_kernel(i).name for i in active if sched['cnum'][i] == 0]
+            self.assertEqual(len(asics), len(set(asics)))
+
+    def test_appdag_speedup_list(self):
+        sys = self._asic_sys()
+        app = self.as_['app_dag0']
+        sched = sys.schedule_appdag(app)
+        self.assertValidSchedule(sys, app, sched)
+        speedup = sys.get_speedup_appdag_list(app)
+        self.assertAlmostEqual(speedup, sum(app.get_all_kernel_lengths()) / sched['makespan'])
+        self.assertGreaterEqual(speedup, sys.get_speedup_appdag_parallel_greedy(app))
+
+    def test_appdag_list_large(self):
+        rng = random.Random(1)
+        names = sorted(self.ks_)
+        app = DAGApp('app_large')
+        for idx in range(500):
+            app._add_kernel(self.ks_[rng.choice(names)], rng.uniform(0.1, 1))
+            for pred in rng.sample(range(max(idx - 20, 0), idx), min(idx, 3)):
+                app._add_dependence(pred, idx)
+        app._prep_baseline()
+
+        sys = self._asic_sys()
+        sched = sys.schedule_appdag(app)
+        self.assertValidSchedule(sys, app, sched)
+        self.assertGreater(sys.get_speedup_appdag_list(app),
+                           sys.get_speedup_appdag_parallel_greedy(app))
+
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+from lumos.analysis import ResultWriter, read_results, iter_results
+from lumos.analysis import LumosAnalysisError
+import numpy as np
+import unittest
+
+try:
+    import pyarrow
+    _has_pyarrow = True
+except ImportError:
+    _has_pyarrow = False
+
+
+@unittest.skipUnless(_has_pyarrow, 'pyarrow is not installed')
+class TestResults(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'results.parquet')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_write_and_read(self):
+        with ResultWriter(self.path, columns=['vdd', 'area', 'perf'],
+                          batch_rows=10) as writer:
+            for area in (100, 200, 300):
+                vdd = np.arange(500, 510)
+                writer.append({'vdd': vdd, 'area': np.repeat(area, 10),
+                               'perf': vdd * 0.1 + area})
+            for vdd in range(500, 505):
+                writer.append_row({'vdd': vdd, 'area': 400, 'perf': 1.5})
+        self.assertEqual(writer.rows, 35)
+
+        df = read_results(self.path)
+        self.assertEqual(list(df.columns), ['vdd', 'area', 'perf'])
+        self.assertEqual(len(df), 35)
+        self.assertEqual(list(df['area'][-5:]), [400] * 5)
+        self.assertEqual(df['vdd'].dtype, np.int64)
+
+        df = read_results(self.path, columns=['perf'],
+                          filters=[('area', '==', 200), ('vdd', '>=', 505)])
+        self.assertEqual(list(df.columns), ['perf'])
+        self.assertEqual(list(df['perf']), [v * 0.1 + 200 for v in range(505, 510)])
+
+        batches = list(iter_results(self.path, filters=[('area', 'in', (100, 400))],
+                                    batch_rows=4))
+        self.assertTrue(all(len(b) <= 4 for b in batches))
+        self.assertEqual(sum(len(b) for b in batches), 15)
+
+    def test_columns_mismatch(self):
+        with ResultWriter(self.path) as writer:
+            writer.append_row({'vdd': 500, 'perf': 1.0})
+            with self.assertRaises(LumosAnalysisError):
+                writer.append_row({'vdd': 500})
+            with self.assertRaises(LumosAnalysisError):
+                writer.append({'vdd': [500, 600], 'perf': [1.0]})
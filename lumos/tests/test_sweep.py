@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import lumos.model.workload
+from lumos.analysis import ParamGrid, AppGrid, SweepRunner, LumosAnalysisError
+from lumos.analysis import ResultCache, point_key
+from lumos.model.misc import file_digest
+from lumos.model.system.mpsoc import MPSoC
+from lumos.model.system.budget import Budget, Sys_L
+from lumos.model.system.hetero import HeterogSysDetailed, SysConfigDetailed
+import unittest
+
+WORKLOAD_FILE = os.path.join(os.path.dirname(__file__), 'appdag.xml')
+SIRIUS_FILE = os.path.join(
+    os.path.dirname(lumos.model.workload.__file__), 'sirius.xml')
+
+
+def _init(context, tech):
+    context['tech'] = tech
+
+
+def _cache_key(point):
+    return dict(point, metric='speedup_serial', tech=22,
+                core=(22, 'cmos', 'hp', 'io'), app='app_dag0', asic='ker3',
+                workload=file_digest(WORKLOAD_FILE))
+
+
+def _eval_point(point, context):
+    budget = Budget(area=point['area'], power=point['power'], bw=Sys_L.bw)
+    sys = MPSoC(budget, context['tech'],
+                tput_core=context['cores'][(22, 'cmos', 'hp', 'io')])
+    tech_model = context['tech_models'][('cmos', 'hp')]
+    sys.add_asic(context['kernels']['ker3'], 'asic_5x', point['alloc'], tech_model)
+    return sys.get_speedup_appdag_serial(context['apps']['app_dag0'])
+
+
+def _eval_app(point, context):
+    sys = HeterogSysDetailed(SysConfigDetailed(), context['kernels'])
+    return sys.perf(point['vdd'], point['app'])
+
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        self.grid = ParamGrid([('area', (200, 600)),
+                               ('power', (60, 120)),
+                               ('alloc', (0.05, 0.1, 0.2))])
+
+    def _runner(self, **kwargs):
+        return SweepRunner(_eval_point, workload_file=WORKLOAD_FILE,
+                           tech_models=[('cmos', 'hp', 22)],
+                           cores=[(22, 'cmos', 'hp', 'io')],
+                           initializer=_init, initargs=(22,), **kwargs)
+
+    def test_grid(self):
+        self.assertEqual(len(self.grid), 12)
+        points = list(self.grid)
+        self.assertEqual(points[0], {'area': 200, 'power': 60, 'alloc': 0.05})
+        self.assertEqual(points[1], {'area': 200, 'power': 60, 'alloc': 0.1})
+        self.assertEqual(points[-1], {'area': 600, 'power': 120, 'alloc': 0.2})
+
+    def test_parallel(self):
+        serial = list(self._runner(nprocs=1).run(self.grid))
+        progress = []
+        runner = self._runner(nprocs=2, chunksize=5,
+                              progress=lambda *args: progress.append(args))
+        parallel = list(runner.run(self.grid))
+
+        self.assertEqual([p for p, _ in parallel], list(self.grid))
+        self.assertEqual(parallel, serial)
+        self.assertEqual(runner.stats['points'], 12)
+        self.assertEqual(progress[-1][:2], (12, 12))
+
+    def test_bad_args(self):
+        with self.assertRaises(LumosAnalysisError):
+            SweepRunner(_eval_point, nprocs=0)
+
+    def test_cache(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'cache.db')
+            expected = list(self._runner(nprocs=1).run(self.grid))
+
+            # interrupted after the first chunk
+            runner = self._runner(nprocs=2, chunksize=5, cache=path,
+                                  cache_key=_cache_key)
+            for point, result in runner.run(self.grid):
+                break
+            self.assertEqual(len(ResultCache(path)), 5)
+
+            # resumed
+            runner = self._runner(nprocs=2, chunksize=5, cache=path,
+                                  cache_key=_cache_key)
+            self.assertEqual(list(runner.run(self.grid)), expected)
+            self.assertEqual(runner.stats['cached'], 5)
+
+            # all served from the cache
+            runner = self._runner(nprocs=1, cache=path, cache_key=_cache_key)
+            self.assertEqual(list(runner.run(self.grid)), expected)
+            self.assertEqual(runner.stats['cached'], 12)
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_app_grid(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            grid = AppGrid(SIRIUS_FILE, [('vdd', (600, 700))], cache=tmpdir)
+            ks, as_ = lumos.model.workload.load_kernels_and_apps(SIRIUS_FILE, cache=False)
+            self.assertEqual(len(grid), 2 * len(as_))
+            self.assertEqual(grid.names, ('app', 'vdd'))
+
+            runner = SweepRunner(_eval_app, nprocs=2, chunksize=4,
+                                 workload_file=SIRIUS_FILE, load_apps=False)
+            sys = HeterogSysDetailed(SysConfigDetailed(), ks)
+            results = list(runner.run(grid))
+            self.assertEqual(len(results), len(grid))
+            for point, perf in results:
+                self.assertEqual(perf, sys.perf(point['vdd'], as_[point['app'].name]))
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_point_key(self):
+        self.assertEqual(point_key({'area': 200, 'alloc': (0.1, 0.2)}),
+                         point_key({'alloc': [0.1, 0.2], 'area': 200.0}))
+        self.assertNotEqual(point_key({'area': 200, 'power': 60}),
+                            point_key({'area': 200, 'power': 60.5}))
+        with self.assertRaises(LumosAnalysisError):
+            SweepRunner(_eval_point, cache=':memory:')
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+from lumos.model.tech import get_model, TechModelError
+import numpy as np
+import unittest
+
+
+class TestBaseTechModel(unittest.TestCase):
+    def test_array_lookups(self):
+        for name, variant, tech in (('cmos', 'hp', 22), ('cmos', 'lp', 45),
+                                    ('finfet', 'lp', 16), ('tfet', 'homo30nm', 22)):
+            model = get_model(name, variant)
+            vdd = np.arange(model.vmin(tech), model.vmax(tech) + 1, 7)
+            freq = model.freq_array(tech, vdd)
+            dp = model.dynamic_power_array(tech, vdd)
+            sp = model.static_power_array(tech, vdd)
+            for i, v in enumerate(vdd):
+                self.assertEqual(freq[i], model.freq(tech, v))
+                self.assertEqual(dp[i], model.dynamic_power(tech, v))
+                self.assertEqual(sp[i], model.static_power(tech, v))
+            # normalized to the nominal supply
+            self.assertEqual(model.freq_array(tech, [model.vnom(tech)])[0], 1)
+
+    def test_array_out_of_range(self):
+        model = get_model('cmos', 'hp')
+        vmin = model.vmin(22)
+        with self.assertRaises(TechModelError):
+            model.freq_array(22, np.array([vmin - 1, vmin]))
+        with self.assertRaises(TechModelError):
+            model.dynamic_power_array(22, np.array([vmin + 0.5]))
+        with self.assertRaises(TechModelError):
+            model.static_power_array(10, np.array([vmin]))
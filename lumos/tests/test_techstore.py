@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from lumos.model.tech import get_model
+from lumos.model.tech.store import TechModelStore
+import unittest
+
+
+class TestTechModelStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'tech_models.bin')
+        self.model_files = sorted(glob.glob(os.path.join(
+            os.path.dirname(__file__), '..', 'model', 'tech', 'cmos', 'hp',
+            'rca32_hp_*.data')))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_build_and_reopen(self):
+        store = TechModelStore(self.path)
+        arrays = store.load(self.model_files)
+        self.assertTrue(os.path.exists(self.path))
+
+        model = get_model('cmos', 'hp')
+        for tech, m in arrays.items():
+            vnom_idx = model.vnom(tech) - m.vmin
+            for vdd in (m.vmin, 650, m.vmax):
+                self.assertEqual(m.freq[vdd - m.vmin] / m.freq[vnom_idx],
+                                 model.freq(tech, vdd))
+                self.assertEqual(m.dp[vdd - m.vmin] / m.dp[vnom_idx],
+                                 model.dynamic_power(tech, vdd))
+                self.assertEqual(m.sp[vdd - m.vmin] / m.sp[vnom_idx],
+                                 model.static_power(tech, vdd))
+
+        # a re-opened store is up-to-date, and reads the same models
+        store = TechModelStore(self.path)
+        self.assertTrue(all(store.is_fresh(f) for f in self.model_files))
+        arrays2 = store.load(self.model_files)
+        for tech in arrays:
+            self.assertEqual(list(arrays[tech].freq), list(arrays2[tech].freq))
+
+    def test_concurrent_update(self):
+        # both stores are opened before either writes
+        store1 = TechModelStore(self.path)
+        store2 = TechModelStore(self.path)
+        store1.load(self.model_files[:1])
+        store2.load(self.model_files[1:2])
+        store = TechModelStore(self.path)
+        self.assertTrue(all(store.is_fresh(f) for f in self.model_files[:2]))
+
+        # store2 re-opens the store replaced by store1
+        store1.load(self.model_files[2:3])
+        arrays = store2.load(self.model_files[2:3])
+        self.assertEqual(len(arrays), 1)
+        self.assertFalse(store2.is_fresh(self.model_files[3]))
+
+    def test_corrupt_store(self):
+        for content in (b'not a store', b'LUMOSTM1\x04\0\0\0\0\0\0\0{"ve',
+                        b'LUMOSTM1\x02\0\0\0\0\0\0\0\xff\xfe'):
+            with open(self.path, 'wb') as f:
+                f.write(content)
+            store = TechModelStore(self.path)
+            self.assertEqual(len(store.keys()), 0)
+            store.load(self.model_files[:1])
+            self.assertTrue(TechModelStore(self.path).is_fresh(self.model_files[0]))
+
+    def test_unwritable_store(self):
+        # the parent of the store is a file
+        parent = os.path.join(self.tmpdir, 'file')
+        open(parent, 'w').close()
+        store = TechModelStore(os.path.join(parent, 'tech_models.bin'))
+        arrays = store.load(self.model_files[:1])
+        self.assertEqual(len(arrays), 1)
+        self.assertTrue(len(list(arrays.values())[0].freq) > 0)
+
+    def test_lazy_import(self):
+        # the default store is compiled by now
+        get_model('cmos', 'hp').freq(22, 800)
+        code = '\n'.join([
+            'import sys',
+            'from lumos.model.tech import get_model',
+            'assert "pandas" not in sys.modules and "scipy" not in sys.modules',
+            'assert "lumos.model.tech.cmos" not in sys.modules',
+            'model = get_model("cmos", "hp")',
+            'model.freq(22, 800)',
+            'import lumos.model.tech.cmos.hp as cmos_hp',
+            'assert list(dict.keys(cmos_hp.model_arrays)) == [22]',
+            'assert "lumos.model.tech.cmos.lp" not in sys.modules',
+            'assert "lumos.model.tech.tfet" not in sys.modules',
+            'assert "lumos.model.tech.finfet" not in sys.modules',
+        ])
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))
+        env = dict(os.environ, PYTHONPATH=root)
+        self.assertEqual(subprocess.call([sys.executable, '-c', code], env=env), 0)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+import lumos
+from lumos.model.misc import file_digest
+from lumos.model.workload import load_kernels_and_apps
+from lumos.model.workload import load_kernels_xmlfile, load_apps_xmlfile
+from lumos.model.workload import iterparse_kernels, iterparse_apps
+from lumos.model.workload import CompiledWorkload, WorkloadCacheError
+from lumos.model.workload import compile_workload, open_workload, iter_apps
+from lumos.model.workload import XMLWorkload, WorkloadError
+from lumos.model.workload import pack_apps
+from lumos.model.workload.application import SyntheticApp, AppError
+from lumos.model.system.hetero import HeterogSysDetailed, SysConfigDetailed
+from lumos.model.workload.compiled import cache_path, cache_dir_of, save_cached
+
+curdir = os.path.dirname(__file__)
+sirius_xmlfile = os.path.join(
+    os.path.dirname(lumos.model.workload.__file__), 'sirius.xml')
+
+
+def _kernel_attrs(k):
+    ret = dict((name, val) for name, val in vars(k).items()
+               if name != '_kernel_params')
+    ret['_kernel_params'] = dict(
+        (acc_id, (p.perf, p.power, p.bw)) for acc_id, p in k._kernel_params.items())
+    return ret
+
+
+class TestCompiledWorkload(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def assertSameKernels(self, ks, ks_ref):
+        self.assertEqual(sorted(ks), sorted(ks_ref))
+        for name in ks_ref:
+            self.assertEqual(_kernel_attrs(ks[name]), _kernel_attrs(ks_ref[name]))
+
+    def assertSameSyntheticApps(self, ks, as_, as_ref):
+        self.assertEqual(sorted(as_), sorted(as_ref))
+        for name, a_ref in as_ref.items():
+            a = as_[name]
+            self.assertIs(type(a), type(a_ref))
+            self.assertEqual(a.kernels_coverage, a_ref.kernels_coverage)
+            self.assertEqual(a.kernels_rc_count, a_ref.kernels_rc_count)
+            self.assertEqual(a.kernels_rc_time, a_ref.kernels_rc_time)
+            # apps share kernel objects
+            for kname in a.get_all_kernels():
+                self.assertIs(a.get_kernel(kname), ks[kname])
+
+    def test_cache(self):
+        ks_ref, as_ref = load_kernels_and_apps(sirius_xmlfile, cache=False)
+
+        path = cache_path(file_digest(sirius_xmlfile), self.cache_dir)
+        self.assertFalse(os.path.exists(path))
+        load_kernels_and_apps(sirius_xmlfile, cache=self.cache_dir)
+        self.assertTrue(os.path.exists(path))
+
+        ks, as_ = load_kernels_and_apps(sirius_xmlfile, cache=self.cache_dir)
+        self.assertSameKernels(ks, ks_ref)
+        self.assertSameSyntheticApps(ks, as_, as_ref)
+
+    def test_cache_dir(self):
+        self.assertIsNone(cache_dir_of(False))
+        self.assertEqual(cache_dir_of(self.cache_dir), self.cache_dir)
+        self.assertTrue(cache_dir_of(True))
+
+    def test_cache_unwritable(self):
+        ks_ref, as_ref = load_kernels_and_apps(sirius_xmlfile, cache=False)
+        # the cache directory is under a file
+        parent = os.path.join(self.cache_dir, 'file')
+        open(parent, 'w').close()
+        cache_dir = os.path.join(parent, 'workload')
+        ks, as_ = load_kernels_and_apps(sirius_xmlfile, cache=cache_dir)
+        self.assertSameKernels(ks, ks_ref)
+        self.assertSameSyntheticApps(ks, as_, as_ref)
+        self.assertIsInstance(open_workload(sirius_xmlfile, cache_dir), XMLWorkload)
+
+    def test_cache_unpicklable(self):
+        ks, as_ = load_kernels_and_apps(sirius_xmlfile, cache=False)
+        digest = file_digest(sirius_xmlfile)
+        path = cache_path(digest, self.cache_dir)
+        app = as_['synapp_0']
+        # a lock raises TypeError, and a local function AttributeError
+        for obj in (threading.Lock(), lambda: None):
+            app.unpicklable = obj
+            self.assertIsNone(save_cached(digest, 'synthetic', ks, as_.values(),
+                                          self.cache_dir))
+            self.assertFalse(os.path.exists(path))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_dag(self):
+        xmlfile = os.path.join(curdir, 'appdag.xml')
+        path = compile_workload(xmlfile, cache_dir=self.cache_dir)
+        ks, as_ = CompiledWorkload(path, file_digest(xmlfile)).load()
+        a = as_['app_dag0']
+        self.assertEqual(a.get_precedent_kernel(5), [1, 2, 3, 4])
+        self.assertEqual(a.kernels_depth_sort(), [[0], [1, 2, 3, 4], [5]])
+        self.assertAlmostEqual(a.get_speedup({0: 1.2, 1: 1.3, 5: 1.5, 4: 2}), 1.2)
+        self.assertIs(a.get_kernel(0), ks['ker0'])
+
+    def test_stale(self):
+        path = os.path.join(self.cache_dir, 'sirius.wl')
+        compile_workload(sirius_xmlfile, path)
+        CompiledWorkload(path, file_digest(sirius_xmlfile))
+        with self.assertRaises(WorkloadCacheError):
+            CompiledWorkload(path, '0' * 40)
+
+    def test_corrupted(self):
+        digest = file_digest(sirius_xmlfile)
+        path = compile_workload(sirius_xmlfile, cache_dir=self.cache_dir)
+        with open(path, 'rb') as f:
+            data = f.read()
+        with open(path, 'wb') as f:
+            f.write(data[:len(data) // 2])
+        with self.assertRaises(WorkloadCacheError):
+            CompiledWorkload(path, digest).load()
+
+        # falls back to XML, and re-compiles
+        ks_ref, as_ref = load_kernels_and_apps(sirius_xmlfile, cache=False)
+        ks, as_ = load_kernels_and_apps(sirius_xmlfile, cache=self.cache_dir)
+        self.assertSameSyntheticApps(ks, as_, as_ref)
+        self.assertEqual(len(CompiledWorkload(path, digest).load()[1]), len(as_ref))
+
+    def test_iterparse(self):
+        ks_ref, as_ref = load_kernels_and_apps(sirius_xmlfile, cache=False)
+        ks = iterparse_kernels(sirius_xmlfile)
+        self.assertSameKernels(ks, ks_ref)
+        as_ = dict((a.name, a) for a in iterparse_apps(sirius_xmlfile, ks))
+        self.assertSameSyntheticApps(ks, as_, as_ref)
+
+    def test_iterparse_apps_first(self):
+        # apps are before kernels in this file
+        xmlfile = os.path.join(curdir, 'detailed_workload.xml')
+        ks_ref, as_ref = load_kernels_and_apps(xmlfile, cache=False)
+        ks = iterparse_kernels(xmlfile)
+        self.assertSameKernels(ks, ks_ref)
+        as_ = dict((a.name, a) for a in iterparse_apps(xmlfile, ks))
+        self.assertSameSyntheticApps(ks, as_, as_ref)
+
+
+class TestIterApps(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.ks_ref, self.as_ref = load_kernels_and_apps(sirius_xmlfile, cache=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_apps(self):
+        for cache in (False, self.cache_dir, self.cache_dir):
+            names = [a.name for a in iter_apps(sirius_xmlfile, cache=cache)]
+            self.assertEqual(sorted(names), sorted(self.as_ref))
+
+    def test_batches(self):
+        for cache in (False, self.cache_dir):
+            batches = list(iter_apps(sirius_xmlfile, batch_size=3, cache=cache))
+            self.assertEqual([len(b) for b in batches[:-1]], [3] * (len(batches) - 1))
+            self.assertTrue(1 <= len(batches[-1]) <= 3)
+            self.assertEqual(sorted(a.name for b in batches for a in b),
+                             sorted(self.as_ref))
+        with self.assertRaises(WorkloadError):
+            iter_apps(sirius_xmlfile, batch_size=0, cache=False)
+
+    def test_open_workload(self):
+        workload = open_workload(sirius_xmlfile, cache=False)
+        self.assertIsInstance(workload, XMLWorkload)
+        workload = open_workload(sirius_xmlfile, cache=self.cache_dir)
+        self.assertIsInstance(workload, CompiledWorkload)
+        self.assertEqual(len(workload), len(self.as_ref))
+        self.assertEqual(workload.type, 'synthetic')
+
+    def test_perf(self):
+        workload = open_workload(sirius_xmlfile, cache=self.cache_dir)
+        sys = HeterogSysDetailed(SysConfigDetailed(), workload.kernels)
+        sys_ref = HeterogSysDetailed(SysConfigDetailed(), self.ks_ref)
+        for batch in workload.iter_batches(4):
+            for app in batch:
+                self.assertEqual(sys.perf(650, app),
+                                 sys_ref.perf(650, self.as_ref[app.name]))
+
+
+class TestPackedSuite(unittest.TestCase):
+    def test_pack(self):
+        ks, as_ = load_kernels_and_apps(sirius_xmlfile, cache=False)
+        apps = list(as_.values())
+        apps = apps[:2] + [SyntheticApp('empty0')] + apps[2:] + [SyntheticApp('empty')]
+        suite = pack_apps(apps)
+        self.assertEqual(len(suite), len(apps))
+        self.assertEqual(suite.nrows, sum(len(a.get_all_kernels()) for a in apps))
+        # kernels are packed once
+        self.assertEqual(len(suite.kernels), len(set(
+            k for a in apps for k in a.get_all_kernels())))
+
+        covs = suite.app_sum(suite.columns['cov'])
+        for i, a in enumerate(apps):
+            self.assertEqual(suite.index(a.name), i)
+            self.assertAlmostEqual(covs[i], sum(a.get_cov(k) for k in a.get_all_kernels()))
+            rows = suite.app_index == i
+            self.assertEqual([suite.kernels[k].name for k in suite.kernel_index[rows]],
+                             list(a.get_all_kernels()))
+            for kname, miss_l1 in zip(a.get_all_kernels(), suite.columns['miss_l1'][rows]):
+                self.assertEqual(miss_l1, a.get_kernel(kname).miss_l1)
+        self.assertEqual(covs[-1], 0)
+        # 2-D values, with empty applications
+        values = np.array([suite.columns['cov'], suite.columns['rc_count'],
+                           suite.columns['miss_l1']]).reshape(3, 1, -1)
+        sums = suite.app_sum(values)
+        self.assertEqual(sums.shape, (3, 1, len(apps)))
+        for row, ref in zip(sums[:, 0], values[:, 0]):
+            self.assertEqual(row.tolist(), suite.app_sum(ref).tolist())
+        self.assertEqual(sums[:, 0, 2].tolist(), [0, 0, 0])
+        self.assertEqual(sums[:, 0, -1].tolist(), [0, 0, 0])
+
+    def test_pack_simple(self):
+        ks = load_kernels_xmlfile(os.path.join(curdir, 'kernels.xml'))
+        apps = list(load_apps_xmlfile(os.path.join(curdir, 'apps.xml'), ks).values())
+        suite = pack_apps(apps)
+        self.assertEqual(suite.cov_matrix.shape, (len(apps), len(suite.kernels)))
+        for i, a in enumerate(apps):
+            self.assertEqual(suite.app_columns['f'][i], a.f)
+            self.assertEqual(suite.app_columns['f_noacc'][i], a.f_noacc)
+            for j, kobj in enumerate(suite.kernels):
+                self.assertEqual(suite.cov_matrix[i, j], a.get_cov(kobj.name))
+
+        _, as_ = load_kernels_and_apps(sirius_xmlfile, cache=False)
+        self.assertTrue(np.isnan(pack_apps(as_.values()).app_columns['f']).all())
+
+    def test_not_synthetic(self):
+        _, as_ = load_kernels_and_apps(os.path.join(curdir, 'appdag.xml'), cache=False)
+        with self.assertRaises(AppError):
+            pack_apps(as_.values())
+
+
+if __name__ == '__main__':
+    unittest.main()
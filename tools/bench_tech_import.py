@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""
+Benchmark the cold-start time of tech models.
+
+Each run is a fresh interpreter which gets tech models ready to be queried.
+Runs of the memory-mapped store (lumos.model.tech.store) are compared with
+the loading path it replaced, where importing lumos.model.tech imported
+pandas and scipy, and every variant read all of its nodes, either by
+interpolating the `*.data` CSV files or, if they were up-to-date, by
+unpickling the interpolated dicts from `*.p` files next to them.
+
+- lazy: get_model('cmos', 'hp').freq(22, 800), which loads a single model.
+- eager: the same query, then every node of every variant.
+- csv: interpolate all model files with
+  :func:`~lumos.model.tech.store.interp_model_file`, i.e. a cold start of
+  the old path.
+- pickle: unpickle all `*.p` files, i.e. a warm start of the old path,
+  skipped if there are none.
+
+Times are reported on top of the start-up of an interpreter importing
+numpy, which is needed either way.
+"""
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import timeit
+
+LUMOS_HOME = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TECH_DIR = os.path.join(LUMOS_HOME, 'lumos', 'model', 'tech')
+
+# (name, variant) of get_model(), and the directory of its model files
+VARIANTS = ((('cmos', 'hp'), 'cmos/hp'),
+            (('cmos', 'lp'), 'cmos/lp'),
+            (('finfet', 'hp'), 'finfet/hp'),
+            (('finfet', 'lp'), 'finfet/lstp'),
+            (('tfet', 'homo30nm'), 'tfet/homoTFET30nm'),
+            (('tfet', 'homo60nm'), 'tfet/homoTFET60nm'))
+
+LAZY = """
+from lumos.model.tech import get_model
+get_model('cmos', 'hp').freq(22, 800)
+"""
+
+EAGER = """
+from lumos.model.tech import get_model, TechModelError
+get_model('cmos', 'hp').freq(22, 800)
+for name, variant in {variants!r}:
+    model = get_model(name, variant)
+    for tech in model.vnom_dict:
+        try:
+            model.freq(tech, model.vnom(tech))
+        except TechModelError:
+            # no model file of the node
+            pass
+"""
+
+CSV = """
+import pandas, scipy.interpolate
+from lumos.model.tech.store import interp_model_file
+for model_file in {files!r}:
+    interp_model_file(model_file)
+"""
+
+PICKLE = """
+import pickle
+import pandas, scipy.interpolate
+for pickle_file in {files!r}:
+    with open(pickle_file, 'rb') as f:
+        # frequency, dynamic power, and static power
+        pickle.load(f), pickle.load(f), pickle.load(f)
+"""
+
+
+def model_files(ext):
+    from lumos import settings
+    files = []
+    for _, subdir in VARIANTS:
+        circuit = getattr(settings, '{0}_SIM_CIRCUIT'.format(
+            subdir.split('/')[0].upper()))
+        files.extend(sorted(glob.glob(os.path.join(
+            TECH_DIR, subdir, '{0}_*.{1}'.format(circuit, ext)))))
+    return files
+
+
+def bench(code, repeat):
+    env = dict(os.environ, PYTHONPATH=LUMOS_HOME)
+    cmd = [sys.executable, '-c', code]
+    times = timeit.repeat(lambda: subprocess.check_call(cmd, env=env),
+                          number=1, repeat=repeat)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-n', '--repeat', type=int, default=10,
+                        help='number of runs, the best one is reported')
+    args = parser.parse_args()
+
+    sys.path.insert(0, LUMOS_HOME)
+    eager_code = EAGER.format(variants=[v for v, _ in VARIANTS])
+    runs = [('lazy (cmos-hp, 22nm)', LAZY),
+            ('eager (all models)', eager_code),
+            ('csv interpolation (old, cold)', CSV.format(files=model_files('data')))]
+    pickle_files = model_files('p')
+    if pickle_files:
+        runs.append(('pickles (old, warm)', PICKLE.format(files=pickle_files)))
+
+    # the first run compiles the tech model store, if needed
+    bench(eager_code, 1)
+    baseline = bench('import numpy', args.repeat)
+    print('interpreter with numpy: {0:.1f}ms'.format(baseline * 1000))
+    for label, code in runs:
+        elapsed = bench(code, args.repeat)
+        print('{0}: {1:.1f}ms'.format(label, (elapsed - baseline) * 1000))
+
+
+if __name__ == '__main__':
+    main()